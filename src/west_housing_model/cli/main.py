@@ -6,18 +6,43 @@ import argparse
 import json
 import sys
 import time
+from datetime import timedelta
 from pathlib import Path
 from typing import Any, Dict, Iterable
 
 import pandas as pd
 
-from west_housing_model.core.exceptions import CacheError, ConnectorError
+from west_housing_model.config.registry_loader import (
+    connector_cache_formats,
+    connector_rate_limits,
+)
+from west_housing_model.core.exceptions import (
+    CacheError,
+    ConnectorError,
+    RegistryError,
+    SchemaError,
+)
+from west_housing_model.data.cache_backend import SharedDirBackend
 from west_housing_model.data.connectors import DEFAULT_CONNECTORS
+from west_housing_model.data.connectors.common import http_pool_stats
+from west_housing_model.data.rate_limit import SharedRateState, configure_rate_limits
 from west_housing_model.data.repository import Repository
+from west_housing_model.data.snapshot import export_bundle, import_bundle, load_key_manifest
+from west_housing_model.data.warmup import (
+    DEFAULT_WARMUP_WORKERS,
+    load_portfolio,
+    plan_queries,
+    warm_cache,
+)
 from west_housing_model.features.ops_features import build_ops_features
 from west_housing_model.features.place_features import build_place_features_from_components
 from west_housing_model.features.site_features import build_site_features_from_components
-from west_housing_model.settings import get_pillar_weights
+from west_housing_model.settings import (
+    get_negative_cache_ttl,
+    get_pillar_weights,
+    get_rate_limit_state_path,
+    get_shared_cache_dir,
+)
 from west_housing_model.utils.logging import (
     LogContext,
     configure,
@@ -44,8 +69,52 @@ def _parse_key_values(pairs: Iterable[str]) -> Dict[str, Any]:
     return params
 
 
-def _load_repository(*, offline: bool) -> Repository:
-    return Repository(connectors=DEFAULT_CONNECTORS, offline=offline)
+_SIZE_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+
+
+def _parse_size(value: str) -> int:
+    """Parse a byte budget such as ``500MB`` or ``20GB`` (binary units)."""
+
+    text = value.strip().upper()
+    number = text.rstrip("KMGTB")
+    unit = text[len(number) :]
+    if unit not in _SIZE_UNITS:
+        raise argparse.ArgumentTypeError(f"Invalid size '{value}', expected e.g. 500MB or 20GB")
+    try:
+        return int(float(number) * _SIZE_UNITS[unit])
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f"Invalid size '{value}', expected e.g. 500MB or 20GB"
+        ) from exc
+
+
+def _load_repository(*, offline: bool, paranoid: bool = False) -> Repository:
+    try:
+        cache_formats = connector_cache_formats()
+    except RegistryError:
+        cache_formats = {}
+    if not offline:
+        _configure_rate_limits()
+    shared_dir = get_shared_cache_dir()
+    return Repository(
+        connectors=DEFAULT_CONNECTORS,
+        offline=offline,
+        paranoid=paranoid,
+        cache_formats=cache_formats,
+        negative_ttl=get_negative_cache_ttl(),
+        shared_cache=SharedDirBackend(shared_dir) if shared_dir is not None else None,
+    )
+
+
+def _configure_rate_limits() -> None:
+    try:
+        rate_limits = connector_rate_limits()
+    except RegistryError:
+        return
+    state_path = get_rate_limit_state_path()
+    configure_rate_limits(
+        rate_limits, state=SharedRateState(state_path) if state_path is not None else None
+    )
 
 
 def _ensure_output_dir(path: Path) -> None:
@@ -107,11 +176,23 @@ def _sample_places_from_query(query: str) -> tuple[pd.DataFrame, pd.DataFrame]:
     return base, comps
 
 
+def _http_pool_metrics() -> list[Dict[str, Any]]:
+    return [
+        {
+            "host": item.host,
+            "requests": item.requests,
+            "connections": item.connections,
+            "reused": item.reused,
+        }
+        for item in http_pool_stats()
+    ]
+
+
 def _run_refresh(args: argparse.Namespace) -> int:
     if args.source_id not in DEFAULT_CONNECTORS:
         raise SystemExit(f"Unknown source id: {args.source_id}")
 
-    repo = _load_repository(offline=args.offline)
+    repo = _load_repository(offline=args.offline, paranoid=args.paranoid)
     params = _parse_key_values(args.param or [])
     ctx = LogContext(event="cli.refresh", module="cli", action="refresh", source_id=args.source_id)
 
@@ -122,6 +203,8 @@ def _run_refresh(args: argparse.Namespace) -> int:
         warning(ctx, "refresh-error", error=str(exc))
         print(str(exc), file=sys.stderr)
         return 1
+    finally:
+        repo.close()
     duration = time.time() - start
 
     rows = int(pd.DataFrame(result.frame).shape[0])
@@ -137,6 +220,7 @@ def _run_refresh(args: argparse.Namespace) -> int:
         "artifact_path": str(result.artifact_path),
         "cache_key": result.cache_key,
         "correlation_id": result.correlation_id,
+        "http_pools": _http_pool_metrics(),
     }
     if result.metadata:
         payload["metadata"] = dict(result.metadata)
@@ -150,7 +234,14 @@ def _run_refresh(args: argparse.Namespace) -> int:
                     **payload
                 )
             )
-        info(ctx, "refresh-complete", duration_s=duration, status=result.status, rows=rows)
+        info(
+            ctx,
+            "refresh-complete",
+            duration_s=duration,
+            status=result.status,
+            rows=rows,
+            http_pools=payload["http_pools"],
+        )
     return 0
 
 
@@ -170,6 +261,210 @@ def _run_validate(args: argparse.Namespace) -> int:
     return 0
 
 
+def _run_cache_gc(args: argparse.Namespace) -> int:
+    repo = _load_repository(offline=True)
+    ctx = LogContext(event="cli.cache", module="cli", action="gc")
+    max_age = timedelta(days=args.max_age_days) if args.max_age_days is not None else None
+    report = repo.store.gc(max_bytes=args.max_bytes, max_age=max_age, dry_run=args.dry_run)
+
+    payload = {
+        "action": "cache-gc",
+        "dry_run": report.dry_run,
+        "bytes_before": report.bytes_before,
+        "bytes_after": report.bytes_after,
+        "reclaimed_bytes": report.reclaimed_bytes,
+        "evicted_keys": len(report.evicted),
+        "removed_files": [str(path) for path in report.removed_files],
+    }
+    if args.json:
+        print(json.dumps(payload, default=str))
+    else:
+        verb = "would reclaim" if report.dry_run else "reclaimed"
+        print(
+            f"{verb} {report.reclaimed_bytes} bytes: evicted_keys={len(report.evicted)} "
+            f"removed_files={len(report.removed_files)} bytes_after={report.bytes_after}"
+        )
+    info(
+        ctx,
+        "cache-gc-complete",
+        dry_run=report.dry_run,
+        reclaimed_bytes=report.reclaimed_bytes,
+        evicted_keys=len(report.evicted),
+        removed_files=len(report.removed_files),
+    )
+    return 0
+
+
+def _run_cache_export(args: argparse.Namespace) -> int:
+    repo = _load_repository(offline=True)
+    ctx = LogContext(event="cli.cache", module="cli", action="export")
+    try:
+        keys = load_key_manifest(Path(args.manifest)) if args.manifest else None
+        report = export_bundle(
+            repo.store,
+            Path(args.bundle),
+            sources=args.source or None,
+            as_of_from=args.as_of_from,
+            as_of_to=args.as_of_to,
+            keys=keys,
+        )
+    except CacheError as exc:
+        warning(ctx, "cache-export-error", error=str(exc))
+        print(str(exc), file=sys.stderr)
+        return 1
+
+    payload = {
+        "action": "cache-export",
+        "bundle": str(report.path),
+        "records": report.records,
+        "files": report.files,
+        "bytes": report.bytes,
+    }
+    if args.json:
+        print(json.dumps(payload, default=str))
+    else:
+        print(
+            f"exported {report.records} keys ({report.files} files, {report.bytes} bytes) "
+            f"to {report.path}"
+        )
+    info(ctx, "cache-export-complete", records=report.records, bytes=report.bytes)
+    return 0
+
+
+def _run_cache_import(args: argparse.Namespace) -> int:
+    repo = _load_repository(offline=True)
+    ctx = LogContext(event="cli.cache", module="cli", action="import")
+    try:
+        report = import_bundle(repo.store, Path(args.bundle), overwrite=args.overwrite)
+    except CacheError as exc:
+        warning(ctx, "cache-import-error", error=str(exc))
+        print(str(exc), file=sys.stderr)
+        return 1
+
+    payload = {
+        "action": "cache-import",
+        "bundle": str(report.path),
+        "records": report.records,
+        "files": report.files,
+        "skipped": report.skipped,
+    }
+    if args.json:
+        print(json.dumps(payload, default=str))
+    else:
+        print(
+            f"imported {report.records} keys ({report.files} files written, "
+            f"{report.skipped} skipped as newer locally) from {report.path}"
+        )
+    info(ctx, "cache-import-complete", records=report.records, skipped=report.skipped)
+    return 0
+
+
+def _progress_bar(done: int, total: int, width: int = 30) -> None:
+    filled = width * done // total if total else width
+    end = "\n" if done >= total else ""
+    print(f"\r[{'#' * filled}{'.' * (width - filled)}] {done}/{total}", end=end, file=sys.stderr)
+
+
+def _run_warm(args: argparse.Namespace) -> int:
+    ctx = LogContext(event="cli.warm", module="cli", action="warm")
+    try:
+        properties = load_portfolio(Path(args.portfolio))
+    except SchemaError as exc:
+        raise SystemExit(str(exc)) from exc
+    plan = plan_queries(properties, sources=DEFAULT_CONNECTORS)
+
+    repo = _load_repository(offline=False)
+    try:
+        summary = warm_cache(
+            repo,
+            plan,
+            max_workers=args.max_workers,
+            progress=None if args.json else _progress_bar,
+            dry_run=args.dry_run,
+        )
+    finally:
+        repo.close()
+
+    payload = {
+        "action": "warm",
+        "dry_run": summary.dry_run,
+        "properties": plan.properties,
+        "planned": summary.planned,
+        "missing": summary.missing,
+        "fetched": summary.fetched,
+        "failed": summary.failed,
+        "duration_s": summary.duration_s,
+        "sources": [
+            {
+                "source_id": item.source_id,
+                "planned": item.planned,
+                "cached": item.cached,
+                "fetched": item.fetched,
+                "failed": item.failed,
+                "errors": item.errors,
+            }
+            for item in summary.sources
+        ],
+        "http_pools": _http_pool_metrics(),
+    }
+    if args.json:
+        print(json.dumps(payload, default=str))
+    else:
+        for item in summary.sources:
+            print(
+                f"{item.source_id} planned={item.planned} cached={item.cached} "
+                f"fetched={item.fetched} failed={item.failed}"
+            )
+        print(
+            f"properties={plan.properties} planned={summary.planned} missing={summary.missing} "
+            f"fetched={summary.fetched} failed={summary.failed} "
+            f"duration_s={summary.duration_s:.3f}"
+        )
+    info(
+        ctx,
+        "warm-complete",
+        dry_run=summary.dry_run,
+        planned=summary.planned,
+        missing=summary.missing,
+        fetched=summary.fetched,
+        failed=summary.failed,
+        http_pools=payload["http_pools"],
+    )
+    return 1 if summary.failed else 0
+
+
+def _run_cache_stats(args: argparse.Namespace) -> int:
+    repo = _load_repository(offline=True)
+    ctx = LogContext(event="cli.cache", module="cli", action="stats")
+    stats = repo.store.index.source_stats()
+
+    sources = [
+        {
+            "source_id": item.source_id,
+            "keys": item.keys,
+            "bytes": item.bytes,
+            "hits": item.hits,
+            "misses": item.misses,
+            "hit_ratio": round(item.hit_ratio, 4),
+            "p50_load_ms": item.p50_load_ms,
+            "p95_load_ms": item.p95_load_ms,
+            "fetch_ms_total": round(item.fetch_ms_total, 3),
+        }
+        for item in stats
+    ]
+    if args.json:
+        print(json.dumps({"action": "cache-stats", "sources": sources}, default=str))
+    else:
+        for item in stats:
+            print(
+                f"{item.source_id} keys={item.keys} bytes={item.bytes} hits={item.hits} "
+                f"misses={item.misses} hit_ratio={item.hit_ratio:.2%} "
+                f"p50_load_ms={item.p50_load_ms} p95_load_ms={item.p95_load_ms}"
+            )
+    info(ctx, "cache-stats-complete", sources=len(sources))
+    return 0
+
+
 def _load_csv(path: Path) -> pd.DataFrame:
     if not path.exists():
         raise SystemExit(f"File not found: {path}")
@@ -328,6 +623,11 @@ def build_parser() -> argparse.ArgumentParser:
     refresh_p.add_argument("source_id")
     refresh_p.add_argument("--param", action="append", default=[])
     refresh_p.add_argument("--offline", action="store_true")
+    refresh_p.add_argument(
+        "--paranoid",
+        action="store_true",
+        help="Verify artifact checksums and re-run schema validation on cache hits",
+    )
     refresh_p.set_defaults(func=_run_refresh)
 
     validate_p = sub.add_parser(
@@ -336,6 +636,57 @@ def build_parser() -> argparse.ArgumentParser:
     validate_p.add_argument("--offline", action="store_true")
     validate_p.set_defaults(func=_run_validate)
 
+    cache_p = sub.add_parser("cache", help="Manage the artifact cache", parents=[json_parent])
+    cache_sub = cache_p.add_subparsers(dest="cache_command", required=True)
+    gc_p = cache_sub.add_parser(
+        "gc", help="Evict cache entries and remove orphaned files", parents=[json_parent]
+    )
+    gc_p.add_argument(
+        "--max-bytes", type=_parse_size, default=None, help="Size budget, e.g. 500MB or 20GB"
+    )
+    gc_p.add_argument(
+        "--max-age-days", type=float, default=None, help="Evict keys unused for this many days"
+    )
+    gc_p.add_argument("--dry-run", action="store_true", help="Report without deleting anything")
+    gc_p.set_defaults(func=_run_cache_gc)
+    stats_p = cache_sub.add_parser(
+        "stats", help="Per-source hit ratio, bytes and load latency", parents=[json_parent]
+    )
+    stats_p.set_defaults(func=_run_cache_stats)
+    export_p = cache_sub.add_parser(
+        "export", help="Pack cached artifacts into a checksummed bundle", parents=[json_parent]
+    )
+    export_p.add_argument("bundle", help="Output path, e.g. cache-snapshot.tar.gz")
+    export_p.add_argument(
+        "--source", action="append", default=[], help="Limit to a source id (repeatable)"
+    )
+    export_p.add_argument("--as-of-from", help="Earliest as_of to include (inclusive)")
+    export_p.add_argument("--as-of-to", help="Latest as_of to include (inclusive)")
+    export_p.add_argument(
+        "--manifest", help="JSON list of {source_id, key_hash | query} entries to include"
+    )
+    export_p.set_defaults(func=_run_cache_export)
+    import_p = cache_sub.add_parser(
+        "import", help="Merge a cache bundle into the local cache", parents=[json_parent]
+    )
+    import_p.add_argument("bundle")
+    import_p.add_argument(
+        "--overwrite", action="store_true", help="Replace keys that are newer locally"
+    )
+    import_p.set_defaults(func=_run_cache_import)
+
+    warm_p = sub.add_parser(
+        "warm",
+        help="Pre-fetch every connector query needed for a portfolio",
+        parents=[json_parent],
+    )
+    warm_p.add_argument("portfolio", help="CSV or JSON with lat, lon, tract, county, place_id")
+    warm_p.add_argument("--max-workers", type=int, default=DEFAULT_WARMUP_WORKERS)
+    warm_p.add_argument(
+        "--dry-run", action="store_true", help="Report missing keys without fetching them"
+    )
+    warm_p.set_defaults(func=_run_warm)
+
     features_p = sub.add_parser(
         "features", help="Build features from CSV inputs", parents=[json_parent]
     )
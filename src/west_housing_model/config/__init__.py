@@ -1,5 +1,17 @@
 from __future__ import annotations
 
-from .registry_loader import SourceConfig, load_data_dictionary, load_registry
+from .registry_loader import (
+    SourceConfig,
+    connector_cache_formats,
+    connector_rate_limits,
+    load_data_dictionary,
+    load_registry,
+)
 
-__all__ = ["SourceConfig", "load_registry", "load_data_dictionary"]
+__all__ = [
+    "SourceConfig",
+    "connector_cache_formats",
+    "connector_rate_limits",
+    "load_registry",
+    "load_data_dictionary",
+]
@@ -8,6 +8,9 @@ import yaml
 
 from west_housing_model.core.exceptions import RegistryError
 
+# Artifact formats understood by ``data.repository.CacheStore``.
+CACHE_FORMATS = ("parquet", "arrow")
+
 
 @dataclass(frozen=True)
 class SourceConfig:
@@ -20,6 +23,12 @@ class SourceConfig:
     license: str
     rate_limit: str
     notes: str | None = None
+    cache_format: str = "parquet"
+    connector_id: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.connector_id:
+            object.__setattr__(self, "connector_id", f"connector.{self.id}")
 
     @classmethod
     def from_payload(cls, payload: Mapping[str, Any]) -> "SourceConfig":
@@ -39,6 +48,8 @@ class SourceConfig:
             license=str(payload["license"]),
             rate_limit=str(payload.get("rate_limit", "unknown")),
             notes=str(payload.get("notes")) if payload.get("notes") is not None else None,
+            cache_format=_cache_format(payload),
+            connector_id=str(payload.get("connector_id", "")),
         )
 
     def merged(self, payload: Mapping[str, Any]) -> "SourceConfig":
@@ -51,6 +62,10 @@ class SourceConfig:
             "license": payload.get("license", self.license),
             "rate_limit": payload.get("rate_limit", self.rate_limit),
             "notes": payload.get("notes", self.notes),
+            "cache_format": (
+                _cache_format(payload) if "cache_format" in payload else self.cache_format
+            ),
+            "connector_id": payload.get("connector_id", self.connector_id),
         }
         return replace(self, **data)
 
@@ -67,6 +82,16 @@ class SourceConfig:
         )
 
 
+def _cache_format(payload: Mapping[str, Any]) -> str:
+    value = str(payload.get("cache_format", "parquet"))
+    if value not in CACHE_FORMATS:
+        raise RegistryError(
+            f"Source '{payload.get('id', '<unknown>')}' has unknown cache_format '{value}'",
+            context={"cache_format": value, "supported": list(CACHE_FORMATS)},
+        )
+    return value
+
+
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[3]
 
@@ -123,9 +148,32 @@ def load_data_dictionary(
             "license": cfg.license,
             "rate_limit": cfg.rate_limit,
             "notes": cfg.notes,
+            "cache_format": cfg.cache_format,
+            "connector_id": cfg.connector_id,
         }
         for cfg in configs
     ]
 
 
-__all__ = ["load_registry", "load_data_dictionary", "SourceConfig"]
+def connector_cache_formats(registry: Iterable[SourceConfig] | None = None) -> Dict[str, str]:
+    """Map connector source ids to non-default cache formats."""
+
+    configs = list(registry) if registry is not None else load_registry()
+    return {cfg.connector_id: cfg.cache_format for cfg in configs if cfg.cache_format != "parquet"}
+
+
+def connector_rate_limits(registry: Iterable[SourceConfig] | None = None) -> Dict[str, str]:
+    """Map connector source ids to their registry ``rate_limit`` strings."""
+
+    configs = list(registry) if registry is not None else load_registry()
+    return {cfg.connector_id: cfg.rate_limit for cfg in configs if cfg.enabled}
+
+
+__all__ = [
+    "CACHE_FORMATS",
+    "connector_cache_formats",
+    "connector_rate_limits",
+    "load_registry",
+    "load_data_dictionary",
+    "SourceConfig",
+]
@@ -1,12 +1,33 @@
 from __future__ import annotations
 
 # Re-export convenience for tests expecting symbols at this package level
-from .repository import CacheIndex, CacheIndexRecord, CacheStore, Repository, RepositoryResult
+from .async_repository import AsyncRepository, async_connector
+from .cache_backend import CacheBackend, LocalBackend, SharedDirBackend
+from .repository import (
+    CacheGcReport,
+    CacheIndex,
+    CacheIndexRecord,
+    CacheStore,
+    NegativeCacheRecord,
+    PartitionSpec,
+    Repository,
+    RepositoryBatchResult,
+    RepositoryResult,
+)
 
 __all__ = [
+    "AsyncRepository",
+    "CacheBackend",
+    "CacheGcReport",
     "CacheIndex",
     "CacheIndexRecord",
     "CacheStore",
+    "LocalBackend",
+    "NegativeCacheRecord",
+    "PartitionSpec",
     "Repository",
+    "RepositoryBatchResult",
     "RepositoryResult",
+    "SharedDirBackend",
+    "async_connector",
 ]
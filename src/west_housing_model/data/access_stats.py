@@ -0,0 +1,196 @@
+"""Batched per-key access statistics for the artifact cache.
+
+The repository records every cache hit and connector fetch here instead of
+writing to SQLite on the hot path.  Counters accumulate in memory and are
+handed to a flush callback (``CacheIndex.record_access``) once
+``flush_interval`` seconds have passed or ``max_pending`` events are queued.
+Latencies are kept as fixed-bucket histograms so p50/p95 can be reported per
+source without storing individual samples.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+# Upper bucket edges in milliseconds; the last bucket absorbs everything slower.
+LATENCY_BUCKETS_MS: Tuple[int, ...] = (
+    1,
+    2,
+    5,
+    10,
+    20,
+    50,
+    100,
+    200,
+    500,
+    1_000,
+    2_000,
+    5_000,
+    10_000,
+    30_000,
+    60_000,
+    3_600_000,
+)
+
+LATENCY_LOAD = "load"
+LATENCY_FETCH = "fetch"
+
+DEFAULT_FLUSH_INTERVAL_S = 5.0
+DEFAULT_MAX_PENDING = 1_000
+
+KeyId = Tuple[str, str]
+LatencyKey = Tuple[str, str, int]
+
+
+def latency_bucket(elapsed_ms: float) -> int:
+    """Upper edge of the histogram bucket holding ``elapsed_ms``."""
+
+    index = min(bisect_left(LATENCY_BUCKETS_MS, elapsed_ms), len(LATENCY_BUCKETS_MS) - 1)
+    return LATENCY_BUCKETS_MS[index]
+
+
+def histogram_percentile(histogram: Mapping[int, int], quantile: float) -> Optional[float]:
+    """Approximate a percentile as the upper edge of the bucket containing it."""
+
+    total = sum(histogram.values())
+    if total == 0:
+        return None
+    threshold = quantile * total
+    seen = 0
+    for bucket in sorted(histogram):
+        seen += histogram[bucket]
+        if seen >= threshold:
+            return float(bucket)
+    return float(max(histogram))
+
+
+@dataclass
+class KeyAccess:
+    """Counters accumulated for one ``(source_id, key_hash)`` between flushes."""
+
+    hits: int = 0
+    misses: int = 0
+    load_ms: float = 0.0
+    fetch_ms: float = 0.0
+    last_accessed_at: Optional[datetime] = None
+
+    def touch(self, accessed_at: datetime) -> None:
+        if self.last_accessed_at is None or accessed_at > self.last_accessed_at:
+            self.last_accessed_at = accessed_at
+
+
+@dataclass
+class AccessBatch:
+    """Everything recorded since the previous flush."""
+
+    keys: Dict[KeyId, KeyAccess] = field(default_factory=dict)
+    latency: Dict[LatencyKey, int] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.keys)
+
+
+@dataclass(frozen=True)
+class SourceCacheStats:
+    """Per-source summary reported by ``west-housing-model cache stats``."""
+
+    source_id: str
+    keys: int
+    bytes: int
+    hits: int
+    misses: int
+    load_ms_total: float
+    fetch_ms_total: float
+    p50_load_ms: Optional[float]
+    p95_load_ms: Optional[float]
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class AccessRecorder:
+    """Thread-safe accumulator that flushes batches through ``flush``.
+
+    Flushing happens inline on the recording thread once the interval has
+    elapsed or the batch is large, so no background thread is needed; call
+    :meth:`flush` explicitly before shutdown to persist the tail.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[AccessBatch], None],
+        *,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_S,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._flush = flush
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._monotonic = monotonic
+        self._batch = AccessBatch()
+        self._pending = 0
+        self._last_flush = monotonic()
+        self._lock = threading.Lock()
+
+    def record_hit(
+        self, source_id: str, key_hash: str, accessed_at: datetime, load_ms: float
+    ) -> None:
+        self._record(source_id, key_hash, accessed_at, LATENCY_LOAD, load_ms)
+
+    def record_fetch(
+        self, source_id: str, key_hash: str, accessed_at: datetime, fetch_ms: float
+    ) -> None:
+        self._record(source_id, key_hash, accessed_at, LATENCY_FETCH, fetch_ms)
+
+    def _record(
+        self, source_id: str, key_hash: str, accessed_at: datetime, kind: str, elapsed_ms: float
+    ) -> None:
+        with self._lock:
+            entry = self._batch.keys.setdefault((source_id, key_hash), KeyAccess())
+            if kind == LATENCY_LOAD:
+                entry.hits += 1
+                entry.load_ms += elapsed_ms
+            else:
+                entry.misses += 1
+                entry.fetch_ms += elapsed_ms
+            entry.touch(accessed_at)
+            bucket = (source_id, kind, latency_bucket(elapsed_ms))
+            self._batch.latency[bucket] = self._batch.latency.get(bucket, 0) + 1
+            self._pending += 1
+            due = (
+                self._pending >= self.max_pending
+                or self._monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand the pending batch to the flush callback (no-op when empty)."""
+
+        with self._lock:
+            batch, self._batch = self._batch, AccessBatch()
+            self._pending = 0
+            self._last_flush = self._monotonic()
+        if batch:
+            self._flush(batch)
+
+
+__all__ = [
+    "AccessBatch",
+    "AccessRecorder",
+    "KeyAccess",
+    "LATENCY_BUCKETS_MS",
+    "LATENCY_FETCH",
+    "LATENCY_LOAD",
+    "SourceCacheStats",
+    "histogram_percentile",
+    "latency_bucket",
+]
@@ -0,0 +1,203 @@
+"""asyncio facade over :class:`Repository` for I/O-bound connector fan-out.
+
+:class:`AsyncRepository` runs each ``Repository.get`` (index lookup, artifact
+load, and on a miss the connector call plus cache write) on a worker thread,
+so one coroutine can ``await asyncio.gather(...)`` across every connector a
+site needs and pay roughly the slowest connector's latency instead of the sum.
+A per-source :class:`asyncio.Semaphore` bounds how many requests each upstream
+sees at once.
+
+Connectors built with :func:`async_connector` wrap a coroutine function.  When
+the repository calls their ``fetch`` from an ``AsyncRepository`` worker, the
+coroutine is scheduled back onto the caller's event loop (so native async HTTP
+clients share that loop) while single-flight locking, validation and cache
+writes stay on the existing synchronous path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import pandas as pd
+
+from west_housing_model.core.exceptions import ConnectorError, SchemaError
+from west_housing_model.data.catalog import validate_connector
+from west_housing_model.data.conditional import NotModified
+from west_housing_model.data.repository import ParquetFilters, Repository, RepositoryResult
+
+DEFAULT_SOURCE_CONCURRENCY = 4
+DEFAULT_ASYNC_WORKERS = 32
+
+# Event loop of the ``AsyncRepository.get`` call that owns the current worker thread.
+_CALLER_LOOP: ContextVar[Optional[asyncio.AbstractEventLoop]] = ContextVar(
+    "whm_async_caller_loop", default=None
+)
+
+SourceQuery = Tuple[str, Mapping[str, Any]]
+
+
+@dataclass
+class AsyncDataConnector:
+    """Connector backed by a coroutine function; usable from sync and async callers."""
+
+    source_id: str
+    afetch_func: Callable[..., Awaitable[pd.DataFrame]]
+    ttl_seconds: int = 86_400
+    schema_version: str | None = None
+
+    async def afetch(self, **query: Any) -> pd.DataFrame:
+        try:
+            frame = await self.afetch_func(**query)
+        except (ConnectorError, SchemaError, NotModified):
+            raise
+        except Exception as exc:
+            raise ConnectorError(
+                f"Connector '{self.source_id}' failed",
+                context={"source_id": self.source_id, "error": str(exc)},
+            ) from exc
+        if not isinstance(frame, pd.DataFrame):
+            frame = pd.DataFrame(frame)
+        return validate_connector(self.source_id, frame)
+
+    def fetch(self, **query: Any) -> pd.DataFrame:
+        loop = _CALLER_LOOP.get()
+        if loop is not None and loop.is_running():
+            return asyncio.run_coroutine_threadsafe(self.afetch(**query), loop).result()
+        return asyncio.run(self.afetch(**query))
+
+
+def async_connector(
+    source_id: str,
+    func: Callable[..., Awaitable[pd.DataFrame]],
+    ttl_seconds: int = 86_400,
+) -> AsyncDataConnector:
+    return AsyncDataConnector(source_id=source_id, afetch_func=func, ttl_seconds=ttl_seconds)
+
+
+class AsyncRepository:
+    """Awaitable ``get``/``gather`` on top of a (thread-safe) :class:`Repository`.
+
+    ``source_concurrency`` is either one limit for every source or a mapping
+    of per-source limits (sources missing from the mapping use the default).
+    """
+
+    def __init__(
+        self,
+        repository: Repository,
+        *,
+        source_concurrency: Union[int, Mapping[str, int]] = DEFAULT_SOURCE_CONCURRENCY,
+        max_workers: int = DEFAULT_ASYNC_WORKERS,
+    ) -> None:
+        self.repository = repository
+        self.source_concurrency = source_concurrency
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _limit_for(self, source_id: str) -> int:
+        if isinstance(self.source_concurrency, Mapping):
+            return self.source_concurrency.get(source_id, DEFAULT_SOURCE_CONCURRENCY)
+        return self.source_concurrency
+
+    def _semaphore(self, source_id: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        # Semaphores bind to the loop that first awaits them; start afresh per loop.
+        if self._semaphore_loop is not loop:
+            self._semaphores = {}
+            self._semaphore_loop = loop
+        semaphore = self._semaphores.get(source_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, self._limit_for(source_id)))
+            self._semaphores[source_id] = semaphore
+        return semaphore
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="whm-async"
+                )
+            return self._executor
+
+    async def get(
+        self,
+        source_id: str,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[ParquetFilters] = None,
+        **query: Any,
+    ) -> RepositoryResult:
+        """Awaitable :meth:`Repository.get`, bounded by the source's semaphore."""
+
+        loop = asyncio.get_running_loop()
+        call = partial(
+            self._get_on_worker, loop, source_id, columns=columns, filters=filters, **query
+        )
+        async with self._semaphore(source_id):
+            return await loop.run_in_executor(self._pool(), call)
+
+    def _get_on_worker(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        source_id: str,
+        **kwargs: Any,
+    ) -> RepositoryResult:
+        token = _CALLER_LOOP.set(loop)
+        try:
+            return self.repository.get(source_id, **kwargs)
+        finally:
+            _CALLER_LOOP.reset(token)
+
+    async def gather(
+        self, requests: Iterable[SourceQuery], *, return_exceptions: bool = False
+    ) -> List[Union[RepositoryResult, BaseException]]:
+        """Resolve ``(source_id, query)`` pairs concurrently, preserving input order."""
+
+        return await asyncio.gather(
+            *(self.get(source_id, **dict(query)) for source_id, query in requests),
+            return_exceptions=return_exceptions,
+        )
+
+    def close(self) -> None:
+        """Shut down the worker pool and close the wrapped repository."""
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.repository.close()
+
+    async def __aenter__(self) -> "AsyncRepository":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+__all__ = [
+    "AsyncDataConnector",
+    "AsyncRepository",
+    "DEFAULT_ASYNC_WORKERS",
+    "DEFAULT_SOURCE_CONCURRENCY",
+    "async_connector",
+]
@@ -0,0 +1,259 @@
+"""Storage backends for cache artifacts and index rows.
+
+:class:`CacheStore` always keeps a local working copy (the L1: blobs on disk
+plus the SQLite ``cache_index``) because reads memory-map or stream files from
+it.  A :class:`CacheBackend` passed as ``CacheStore(remote=...)`` (or
+``Repository(shared_cache=...)``) acts as a shared L2: local misses read
+through to it, and freshly written artifacts are published to it, so a fleet
+of workers shares one warm cache.
+
+Two implementations are provided:
+
+* :class:`LocalBackend` -- the current layout (blobs under a root directory and
+  rows in SQLite); suitable when every reader is on the same host.
+* :class:`SharedDirBackend` -- a directory on a shared mount (NFS-like) where
+  SQLite locking cannot be trusted.  Blobs and one small JSON file per index
+  row are committed by writing a uniquely named temp file and renaming it into
+  place, so no locks are taken and readers never see partial files.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Dict, List, Mapping, Optional, Protocol
+
+from west_housing_model.data.repository import (
+    CacheIndex,
+    CacheIndexRecord,
+    _fsync_dir,
+    _fsync_file,
+    _temp_sibling,
+)
+
+
+def record_to_json(record: CacheIndexRecord) -> Dict[str, Any]:
+    """Serialise an index row (without access bookkeeping) to plain JSON types."""
+
+    return {
+        "source_id": record.source_id,
+        "key_hash": record.key_hash,
+        "path": PurePosixPath(record.relative_path).as_posix(),
+        "created_at": record.created_at.isoformat(),
+        "as_of": record.as_of,
+        "ttl_days": record.ttl_days,
+        "rows": record.rows,
+        "schema_version": record.schema_version,
+        "schema_fingerprint": record.schema_fingerprint,
+        "content_hash": record.content_hash,
+        "bytes": record.bytes,
+        "row_offset": record.row_offset,
+        "etag": record.etag,
+        "last_modified": record.last_modified,
+    }
+
+
+def record_from_json(payload: Mapping[str, Any]) -> CacheIndexRecord:
+    return CacheIndexRecord(
+        source_id=str(payload["source_id"]),
+        key_hash=str(payload["key_hash"]),
+        relative_path=Path(payload["path"]),
+        created_at=datetime.fromisoformat(payload["created_at"]),
+        as_of=payload.get("as_of"),
+        ttl_days=int(payload["ttl_days"]),
+        rows=int(payload.get("rows") or 0),
+        schema_version=payload.get("schema_version"),
+        schema_fingerprint=payload.get("schema_fingerprint"),
+        content_hash=payload.get("content_hash"),
+        bytes=payload.get("bytes"),
+        row_offset=payload.get("row_offset"),
+        etag=payload.get("etag"),
+        last_modified=payload.get("last_modified"),
+    )
+
+
+class CacheBackend(Protocol):
+    """Blob and index-row storage addressed by cache-root-relative paths."""
+
+    def get_blob(self, relative_path: Path, destination: Path) -> bool:
+        """Copy the blob to ``destination``; ``False`` if it does not exist."""
+
+    def put_blob(self, relative_path: Path, source: Path) -> None: ...
+
+    def list_blobs(self, source_id: Optional[str] = None) -> List[Path]: ...
+
+    def delete_blob(self, relative_path: Path) -> None: ...
+
+    def get_row(self, source_id: str, key_hash: str) -> Optional[CacheIndexRecord]: ...
+
+    def put_row(self, record: CacheIndexRecord) -> None: ...
+
+    def list_rows(self, source_id: Optional[str] = None) -> List[CacheIndexRecord]: ...
+
+    def delete_row(self, source_id: str, key_hash: str) -> None: ...
+
+
+def _durable_replace(target: Path, writer: Callable[[Path], Any]) -> None:
+    """Write a unique temp sibling of ``target``, fsync it and rename it over ``target``.
+
+    The fsync comes before the rename so a published name never points at a
+    truncated file after a crash or on a lazily flushed network mount.
+    """
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temp_sibling(target.parent, target.name)
+    try:
+        writer(tmp_path)
+        _fsync_file(tmp_path)
+        os.replace(tmp_path, target)
+        _fsync_dir(target.parent)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _rename_into_place(source: Path, target: Path) -> None:
+    """Durably copy ``source`` over ``target`` via a temp sibling."""
+
+    _durable_replace(target, lambda tmp_path: shutil.copyfile(source, tmp_path))
+
+
+def _artifact_files(directory: Path) -> List[Path]:
+    return [
+        path
+        for pattern in ("*.parquet", "*.arrow", "dataset/*/*.parquet")
+        for path in directory.glob(pattern)
+    ]
+
+
+class LocalBackend:
+    """Blobs under ``root`` with rows in ``root/cache_index.sqlite`` (the L1 layout)."""
+
+    def __init__(self, root: Path, index: Optional[CacheIndex] = None) -> None:
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index = index or CacheIndex(root / "cache_index.sqlite")
+
+    def get_blob(self, relative_path: Path, destination: Path) -> bool:
+        try:
+            shutil.copyfile(self.root / relative_path, destination)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def put_blob(self, relative_path: Path, source: Path) -> None:
+        target = self.root / relative_path
+        if not target.exists():
+            _rename_into_place(source, target)
+
+    def list_blobs(self, source_id: Optional[str] = None) -> List[Path]:
+        directories = [self.root / source_id] if source_id else self.root.iterdir()
+        return [
+            path.relative_to(self.root)
+            for directory in directories
+            if directory.is_dir()
+            for path in _artifact_files(directory)
+        ]
+
+    def delete_blob(self, relative_path: Path) -> None:
+        (self.root / relative_path).unlink(missing_ok=True)
+
+    def get_row(self, source_id: str, key_hash: str) -> Optional[CacheIndexRecord]:
+        return self.index.lookup(source_id, key_hash)
+
+    def put_row(self, record: CacheIndexRecord) -> None:
+        self.index.upsert(record)
+
+    def list_rows(self, source_id: Optional[str] = None) -> List[CacheIndexRecord]:
+        return self.index.records(source_id)
+
+    def delete_row(self, source_id: str, key_hash: str) -> None:
+        self.index.delete(source_id, key_hash)
+
+
+class SharedDirBackend:
+    """Lock-free backend for a directory on a shared (NFS-like) mount.
+
+    Layout: ``blobs/<relative path>`` and ``index/<source_id>/<key_hash>.json``.
+    Every commit is a write to a uniquely named temp file followed by
+    ``os.replace``, which is atomic on POSIX filesystems including NFS.  Blobs
+    are content-addressed, so concurrent writers of the same name are
+    harmless; concurrent row writers resolve to the last rename, and
+    ``put_row`` skips the write when a newer row is already published.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.blob_root = root / "blobs"
+        self.index_root = root / "index"
+        self.blob_root.mkdir(parents=True, exist_ok=True)
+        self.index_root.mkdir(parents=True, exist_ok=True)
+
+    def _row_path(self, source_id: str, key_hash: str) -> Path:
+        return self.index_root / source_id / f"{key_hash}.json"
+
+    def get_blob(self, relative_path: Path, destination: Path) -> bool:
+        try:
+            shutil.copyfile(self.blob_root / relative_path, destination)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def put_blob(self, relative_path: Path, source: Path) -> None:
+        target = self.blob_root / relative_path
+        if not target.exists():
+            _rename_into_place(source, target)
+
+    def list_blobs(self, source_id: Optional[str] = None) -> List[Path]:
+        directories = [self.blob_root / source_id] if source_id else self.blob_root.iterdir()
+        return [
+            path.relative_to(self.blob_root)
+            for directory in directories
+            if directory.is_dir()
+            for path in _artifact_files(directory)
+        ]
+
+    def delete_blob(self, relative_path: Path) -> None:
+        (self.blob_root / relative_path).unlink(missing_ok=True)
+
+    def get_row(self, source_id: str, key_hash: str) -> Optional[CacheIndexRecord]:
+        try:
+            payload = json.loads(self._row_path(source_id, key_hash).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        return record_from_json(payload)
+
+    def put_row(self, record: CacheIndexRecord) -> None:
+        existing = self.get_row(record.source_id, record.key_hash)
+        if existing is not None and existing.created_at > record.created_at:
+            return
+        payload = json.dumps(record_to_json(record))
+        _durable_replace(
+            self._row_path(record.source_id, record.key_hash),
+            lambda tmp_path: tmp_path.write_text(payload, encoding="utf-8"),
+        )
+
+    def list_rows(self, source_id: Optional[str] = None) -> List[CacheIndexRecord]:
+        pattern = f"{source_id}/*.json" if source_id else "*/*.json"
+        rows: List[CacheIndexRecord] = []
+        for path in self.index_root.glob(pattern):
+            try:
+                rows.append(record_from_json(json.loads(path.read_text(encoding="utf-8"))))
+            except FileNotFoundError:
+                continue
+        return rows
+
+    def delete_row(self, source_id: str, key_hash: str) -> None:
+        self._row_path(source_id, key_hash).unlink(missing_ok=True)
+
+
+__all__ = [
+    "CacheBackend",
+    "LocalBackend",
+    "SharedDirBackend",
+    "record_from_json",
+    "record_to_json",
+]
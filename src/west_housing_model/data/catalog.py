@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import os
 from pathlib import Path
 from typing import Mapping
 
 import pandas as pd
 
+from west_housing_model.data.failure_log import failure_root
 from west_housing_model.data.schemas import (
     CONNECTOR_SCHEMAS,
+    SCHEMA_FINGERPRINT_ATTR,
     TABLE_SCHEMAS,
+    connector_schema_fingerprint,
     validate_connector_schema,
     validate_table_schema,
 )
@@ -30,11 +32,10 @@ def failure_capture_path(source_id: str) -> Path:
     """Directory where connector failure payloads/logs are written.
 
     Honors env var WEST_HOUSING_MODEL_FAILURE_CACHE; otherwise uses CWD/failures.
+    Failures themselves are captured asynchronously via ``data.failure_log``.
     """
 
-    root = os.getenv("WEST_HOUSING_MODEL_FAILURE_CACHE")
-    base = Path(root) if root else Path.cwd() / "failures"
-    path = base / source_id
+    path = failure_root() / source_id
     path.mkdir(parents=True, exist_ok=True)
     return path
 
@@ -132,7 +133,9 @@ DATA_DICTIONARY: Mapping[str, Mapping[str, Mapping[str, str]]] = {
 __all__ = [
     "CONNECTOR_SCHEMAS",
     "DATA_DICTIONARY",
+    "SCHEMA_FINGERPRINT_ATTR",
     "TABLE_SCHEMAS",
+    "connector_schema_fingerprint",
     "failure_capture_path",
     "validate_connector",
     "validate_table",
@@ -0,0 +1,112 @@
+"""Conditional HTTP revalidation (ETag / Last-Modified) for cache refreshes.
+
+When an index row expires, :class:`Repository` re-runs the connector inside
+:func:`revalidation_scope`, seeded with the validators stored on that row.
+HTTP helpers call :func:`conditional_headers` before sending and
+:func:`observe_response` afterwards: the first request of the fetch carries
+``If-None-Match`` / ``If-Modified-Since``, and a ``304 Not Modified`` answer
+raises :class:`NotModified` so the repository can keep the cached artifact
+and only bump its ``created_at``.
+
+Validators are only kept for fetches that made exactly one HTTP request; a
+304 on one page of a multi-request fetch says nothing about the others.
+Outside a scope both helpers are no-ops.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Mapping, Optional
+
+HTTP_NOT_MODIFIED = 304
+
+
+@dataclass(frozen=True)
+class Validators:
+    """Upstream cache validators for one artifact."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> "Validators":
+        return cls(etag=headers.get("ETag"), last_modified=headers.get("Last-Modified"))
+
+    def request_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class NotModified(Exception):
+    """The upstream answered 304 to a conditional request: the cached copy is current."""
+
+
+@dataclass
+class RevalidationScope:
+    """Validators sent and received during one connector fetch."""
+
+    previous: Validators = field(default_factory=Validators)
+    requests: int = 0
+    observed: Validators = field(default_factory=Validators)
+
+    @property
+    def validators(self) -> Validators:
+        """Validators to store with the new artifact (empty unless one request was made)."""
+
+        return self.observed if self.requests == 1 else Validators()
+
+
+_SCOPE: ContextVar[Optional[RevalidationScope]] = ContextVar("whm_revalidation_scope", default=None)
+
+
+@contextmanager
+def revalidation_scope(previous: Optional[Validators] = None) -> Iterator[RevalidationScope]:
+    scope = RevalidationScope(previous=previous or Validators())
+    token = _SCOPE.set(scope)
+    try:
+        yield scope
+    finally:
+        _SCOPE.reset(token)
+
+
+def conditional_headers(headers: Optional[Mapping[str, str]] = None) -> Dict[str, str]:
+    """``headers`` plus the stored validators when this is the scope's first request."""
+
+    merged = dict(headers or {})
+    scope = _SCOPE.get()
+    if scope is None:
+        return merged
+    scope.requests += 1
+    if scope.requests == 1:
+        merged.update(scope.previous.request_headers())
+    return merged
+
+
+def observe_response(status_code: int, headers: Mapping[str, str]) -> None:
+    """Record the response's validators; raise :class:`NotModified` on a conditional 304."""
+
+    scope = _SCOPE.get()
+    if scope is None or scope.requests != 1:
+        return
+    if status_code == HTTP_NOT_MODIFIED and scope.previous:
+        raise NotModified()
+    scope.observed = Validators.from_headers(headers)
+
+
+__all__ = [
+    "NotModified",
+    "RevalidationScope",
+    "Validators",
+    "conditional_headers",
+    "observe_response",
+    "revalidation_scope",
+]
@@ -1,29 +1,51 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Callable, Dict
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, Mapping, Sequence
 
 import pandas as pd
 
 from west_housing_model.core.exceptions import ConnectorError, SchemaError
-from west_housing_model.data.catalog import failure_capture_path, validate_connector
+from west_housing_model.data.catalog import validate_connector
+from west_housing_model.data.conditional import NotModified
 from west_housing_model.data.connectors.census_acs import (
+    ACS_VARIABLE_NAMES,
     CensusAcsConfig,
     fetch_census_acs,
+    fetch_census_acs_wide,
 )
-from west_housing_model.data.connectors.eia_v2 import EIAConfig, fetch_eia_rates
-from west_housing_model.data.connectors.fcc_bdc import FCCBDCConfig, fetch_fcc_broadband
-from west_housing_model.data.connectors.hud_fmr import HUDFMRConfig, fetch_hud_fmr
-from west_housing_model.data.connectors.pad_us import PadUSConfig, fetch_pad_us
-from west_housing_model.data.connectors.storm_events import fetch_storm_events
+from west_housing_model.data.connectors.common import pooled_session
+from west_housing_model.data.connectors.eia_v2 import (
+    EIAConfig,
+    fetch_eia_rates,
+    fetch_eia_rates_many,
+)
+from west_housing_model.data.connectors.fcc_bdc import (
+    FCCBDCConfig,
+    fetch_fcc_broadband,
+    fetch_fcc_broadband_many,
+)
+from west_housing_model.data.connectors.hud_fmr import (
+    HUDFMRConfig,
+    fetch_hud_fmr,
+    fetch_hud_fmr_many,
+)
+from west_housing_model.data.connectors.pad_us import (
+    PadUSConfig,
+    fetch_pad_us,
+    fetch_pad_us_many,
+)
+from west_housing_model.data.connectors.storm_events import STORM_EVENTS_URL, fetch_storm_events
 from west_housing_model.data.connectors.usfs_trails import (
     USFSTrailsConfig,
     fetch_usfs_trails,
+    fetch_usfs_trails_many,
 )
 from west_housing_model.data.connectors.usfs_wildfire import (
     USFSWildfireConfig,
     fetch_usfs_wildfire,
+    fetch_usfs_wildfire_many,
 )
 from west_housing_model.data.connectors.usgs_designmaps import (
     USGSDesignMapsConfig,
@@ -32,11 +54,10 @@ from west_housing_model.data.connectors.usgs_designmaps import (
 from west_housing_model.data.connectors.usgs_epqs import (
     USGSEPQSConfig,
     fetch_usgs_epqs,
+    fetch_usgs_epqs_many,
 )
-from west_housing_model.data.connectors.usgs_epqs import (
-    USGSEPQSConfig,
-    fetch_usgs_epqs,
-)
+from west_housing_model.data.failure_log import record_failure
+from west_housing_model.data.repository import QUERY_INDEX_COLUMN
 STATE_FIPS_TO_ABBR = {
     '08': 'CO',
     '16': 'ID',
@@ -56,7 +77,7 @@ class DataConnector:
     def fetch(self, **query: Any) -> pd.DataFrame:
         try:
             frame = self.fetch_func(**query)
-        except SchemaError:
+        except (SchemaError, NotModified):
             raise
         except Exception as exc:  # pragma: no cover - defensive guard
             raise ConnectorError(
@@ -70,18 +91,78 @@ class DataConnector:
         try:
             return validate_connector(self.source_id, frame)
         except SchemaError as exc:
-            _capture_schema_failure(self.source_id, frame)
+            _capture_schema_failure(self.source_id, frame, exc)
             raise SchemaError(
                 exc.message,
                 context={"source_id": self.source_id, **(exc.context or {})},
             ) from exc
 
 
-def _capture_schema_failure(source_id: str, frame: pd.DataFrame) -> None:
-    failure_dir = failure_capture_path(source_id)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
-    failure_dir.mkdir(parents=True, exist_ok=True)
-    frame.to_csv(failure_dir / f"{timestamp}.csv", index=False)
+@dataclass
+class BulkDataConnector(DataConnector):
+    """Connector that can also resolve many queries in one vectorised call.
+
+    ``fetch_many_func`` receives the query list and returns one frame indexed
+    by the position of the query each row answers (queries without data have
+    no rows).  ``fetch_many`` turns that index into ``QUERY_INDEX_COLUMN`` and
+    validates the whole frame once.
+    """
+
+    fetch_many_func: Callable[[Sequence[Mapping[str, Any]]], pd.DataFrame] = field(
+        kw_only=True
+    )
+
+    def fetch_many(self, queries: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+        try:
+            frame = self.fetch_many_func(list(queries))
+        except (ConnectorError, SchemaError):
+            raise
+        except Exception as exc:  # pragma: no cover - defensive guard
+            raise ConnectorError(
+                f"Connector '{self.source_id}' failed",
+                context={"source_id": self.source_id, "error": str(exc)},
+            ) from exc
+
+        if frame.empty:
+            return frame
+        frame = frame.rename_axis(QUERY_INDEX_COLUMN).reset_index()
+        try:
+            return validate_connector(self.source_id, frame)
+        except SchemaError as exc:
+            _capture_schema_failure(self.source_id, frame, exc)
+            raise SchemaError(
+                exc.message,
+                context={"source_id": self.source_id, **(exc.context or {})},
+            ) from exc
+
+
+def _keyed(
+    key: str, fetch_many: Callable[..., pd.DataFrame]
+) -> Callable[[Sequence[Mapping[str, Any]]], pd.DataFrame]:
+    """Adapt ``fetch_x_many(<key>s=[...])`` to a list of ``{key: value}`` queries."""
+
+    def _fetch_many(queries: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+        return fetch_many(**{f"{key}s": [str(query[key]) for query in queries]})
+
+    return _fetch_many
+
+
+def _bulk_or_callable(
+    source_id: str,
+    fetch: Callable[..., pd.DataFrame],
+    *,
+    ttl_seconds: int,
+    fetch_many: Callable[[Sequence[Mapping[str, Any]]], pd.DataFrame] | None,
+) -> DataConnector:
+    if fetch_many is None:
+        return callable_connector(source_id, fetch, ttl_seconds=ttl_seconds)
+    return BulkDataConnector(
+        source_id=source_id, fetch_func=fetch, ttl_seconds=ttl_seconds, fetch_many_func=fetch_many
+    )
+
+
+def _capture_schema_failure(source_id: str, frame: pd.DataFrame, exc: SchemaError) -> None:
+    record_failure(source_id, "schema-payload", exc.message, frame=frame.copy(deep=False))
 
 
 def callable_connector(
@@ -109,18 +190,52 @@ def make_census_acs_connector(
     source_id = "connector.census_acs"
     cfg = config or CensusAcsConfig()
 
-    def _fetch(state: str, county: str, tract: str | None = None, table: str = cfg.table, **_: Any) -> pd.DataFrame:
-        raw = (
-            fetch_override(state=state, county=county, tract=tract, table=table)
-            if fetch_override is not None
-            else fetch_census_acs(
+    def _fetch(
+        state: str,
+        county: str,
+        tract: str | None = None,
+        table: str = cfg.table,
+        variables: Sequence[str] | None = None,
+        **_: Any,
+    ) -> pd.DataFrame:
+        # ``county`` may be one code, a comma-separated list or ``*``; extra
+        # ``variables`` switch to the batched wide fetch (one request per chunk).
+        request_cfg = CensusAcsConfig(
+            dataset=cfg.dataset,
+            table=table,
+            base_url=cfg.base_url,
+            max_variables=cfg.max_variables,
+        )
+        if fetch_override is not None:
+            extras = {"variables": variables} if variables is not None else {}
+            raw = fetch_override(state=state, county=county, tract=tract, table=table, **extras)
+        elif variables is not None:
+            # ``table`` always feeds ``median_household_income`` (as in the
+            # single-table path); no other variable may claim that name.
+            names = {
+                code: name
+                for code, name in ACS_VARIABLE_NAMES.items()
+                if name != "median_household_income"
+            }
+            names[table] = "median_household_income"
+            raw = fetch_census_acs_wide(
+                states=[state],
+                counties=county.split(","),
+                variables=[table, *variables],
+                tract=tract,
+                names=names,
+                config=request_cfg,
+                session=pooled_session(cfg.base_url),
+            )
+        else:
+            raw = fetch_census_acs(
                 state=state,
                 county=county,
                 tract=tract,
                 table=table,
-                config=CensusAcsConfig(dataset=cfg.dataset, table=table, base_url=cfg.base_url),
+                config=request_cfg,
+                session=pooled_session(cfg.base_url),
             )
-        )
         frame = pd.DataFrame(raw).copy(deep=True)
         if frame.empty:
             raise SchemaError(
@@ -174,7 +289,12 @@ def make_usfs_wildfire_connector(
             return fetch_override(geo_id=geo_id, **extras)
         return fetch_usfs_wildfire(geo_id=geo_id, config=cfg)
 
-    conn = callable_connector(source_id, _fetch, ttl_seconds=ttl_seconds)
+    bulk = (
+        None
+        if fetch_override is not None
+        else _keyed("geo_id", partial(fetch_usfs_wildfire_many, config=cfg))
+    )
+    conn = _bulk_or_callable(source_id, _fetch, ttl_seconds=ttl_seconds, fetch_many=bulk)
     conn.schema_version = "1"
     register_connector(conn)
     return conn
@@ -218,7 +338,11 @@ def make_noaa_storm_events_connector(
                 context={"county_id": county_id},
             )
         county_fips = county_id[-3:]
-        frame = fetch_storm_events(county_fips=county_fips, state_abbr=resolved_state)
+        frame = fetch_storm_events(
+            county_fips=county_fips,
+            state_abbr=resolved_state,
+            session=pooled_session(STORM_EVENTS_URL),
+        )
         frame["source_id"] = source_id
         return frame
 
@@ -242,7 +366,12 @@ def make_pad_us_connector(
             return fetch_override(place_id=place_id, **extras)
         return fetch_pad_us(place_id=place_id, config=cfg)
 
-    conn = callable_connector(source_id, _fetch, ttl_seconds=ttl_seconds)
+    bulk = (
+        None
+        if fetch_override is not None
+        else _keyed("place_id", partial(fetch_pad_us_many, config=cfg))
+    )
+    conn = _bulk_or_callable(source_id, _fetch, ttl_seconds=ttl_seconds, fetch_many=bulk)
     conn.schema_version = "1"
     register_connector(conn)
     return conn
@@ -262,7 +391,12 @@ def make_fcc_bdc_connector(
             return fetch_override(geo_id=geo_id, **extras)
         return fetch_fcc_broadband(geo_id=geo_id, config=cfg)
 
-    conn = callable_connector(source_id, _fetch, ttl_seconds=ttl_seconds)
+    bulk = (
+        None
+        if fetch_override is not None
+        else _keyed("geo_id", partial(fetch_fcc_broadband_many, config=cfg))
+    )
+    conn = _bulk_or_callable(source_id, _fetch, ttl_seconds=ttl_seconds, fetch_many=bulk)
     conn.schema_version = "1"
     register_connector(conn)
     return conn
@@ -282,7 +416,12 @@ def make_hud_fmr_connector(
             return fetch_override(geo_id=geo_id, **extras)
         return fetch_hud_fmr(geo_id=geo_id, config=cfg)
 
-    conn = callable_connector(source_id, _fetch, ttl_seconds=ttl_seconds)
+    bulk = (
+        None
+        if fetch_override is not None
+        else _keyed("geo_id", partial(fetch_hud_fmr_many, config=cfg))
+    )
+    conn = _bulk_or_callable(source_id, _fetch, ttl_seconds=ttl_seconds, fetch_many=bulk)
     conn.schema_version = "1"
     register_connector(conn)
     return conn
@@ -302,7 +441,12 @@ def make_eia_v2_connector(
             return fetch_override(state=state, **extras)
         return fetch_eia_rates(state=state, config=cfg)
 
-    conn = callable_connector(source_id, _fetch, ttl_seconds=ttl_seconds)
+    bulk = (
+        None
+        if fetch_override is not None
+        else _keyed("state", partial(fetch_eia_rates_many, config=cfg))
+    )
+    conn = _bulk_or_callable(source_id, _fetch, ttl_seconds=ttl_seconds, fetch_many=bulk)
     conn.schema_version = "1"
     register_connector(conn)
     return conn
@@ -322,7 +466,12 @@ def make_usfs_trails_connector(
             return fetch_override(place_id=place_id, **extras)
         return fetch_usfs_trails(place_id=place_id, config=cfg)
 
-    conn = callable_connector(source_id, _fetch, ttl_seconds=ttl_seconds)
+    bulk = (
+        None
+        if fetch_override is not None
+        else _keyed("place_id", partial(fetch_usfs_trails_many, config=cfg))
+    )
+    conn = _bulk_or_callable(source_id, _fetch, ttl_seconds=ttl_seconds, fetch_many=bulk)
     conn.schema_version = "1"
     register_connector(conn)
     return conn
@@ -342,7 +491,12 @@ def make_usgs_epqs_connector(
             return fetch_override(place_id=place_id, **extras)
         return fetch_usgs_epqs(place_id=place_id, config=cfg)
 
-    conn = callable_connector(source_id, _fetch, ttl_seconds=ttl_seconds)
+    bulk = (
+        None
+        if fetch_override is not None
+        else _keyed("place_id", partial(fetch_usgs_epqs_many, config=cfg))
+    )
+    conn = _bulk_or_callable(source_id, _fetch, ttl_seconds=ttl_seconds, fetch_many=bulk)
     conn.schema_version = "1"
     register_connector(conn)
     return conn
@@ -362,6 +516,7 @@ make_usgs_epqs_connector()
 
 
 __all__ = [
+    "BulkDataConnector",
     "DataConnector",
     "DEFAULT_CONNECTORS",
     "callable_connector",
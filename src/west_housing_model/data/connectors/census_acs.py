@@ -1,16 +1,41 @@
-"""HTTP client for the Census ACS API."""
+"""HTTP client for the Census ACS API.
+
+Requests are batched: one call per state and per chunk of at most
+``CensusAcsConfig.max_variables`` variables covers every requested county
+(``county:*`` when none are listed).  The JSON array-of-arrays payload is
+transposed straight into column arrays, and the chunks are joined on
+``geo_id`` into one wide tract frame.
+"""
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Iterable
+from typing import Any, Dict, List, Mapping, Sequence
 
+import numpy as np
 import pandas as pd
 import requests
 
 from west_housing_model.core.exceptions import ConnectorError, SchemaError
 from west_housing_model.data.catalog import validate_connector
+from west_housing_model.data.conditional import conditional_headers, observe_response
+from west_housing_model.data.connectors.common import pooled_session
+from west_housing_model.data.rate_limit import limiter_for
+
+# The API rejects requests with more than 50 variables in ``get``.
+ACS_MAX_VARIABLES = 50
+
+# Friendly column names for the variables the feature builders use.
+ACS_VARIABLE_NAMES: Dict[str, str] = {
+    "B19013_001E": "median_household_income",
+    "B25071_001E": "median_rent_burden_pct",
+    "B11001_001E": "households",
+}
+
+_GEO_COLUMNS = ("state", "county", "tract")
+# Annotation values the API returns in place of estimates (e.g. -666666666).
+_NULL_SENTINELS = (-999999999, -888888888, -666666666, -555555555, -333333333, -222222222)
 
 
 @dataclass
@@ -18,6 +43,7 @@ class CensusAcsConfig:
     base_url: str = "https://api.census.gov/data"
     dataset: str = "2022/acs/acs5"
     table: str = "B19013_001E"
+    max_variables: int = ACS_MAX_VARIABLES
 
 
 def fetch_census_acs(
@@ -30,55 +56,134 @@ def fetch_census_acs(
     session: requests.Session | None = None,
 ) -> pd.DataFrame:
     config = config or CensusAcsConfig(table=table)
+    wide = fetch_census_acs_wide(
+        states=[state],
+        counties=[county],
+        variables=[table],
+        tract=tract,
+        names={},
+        config=config,
+        session=session,
+    )
+    columns = ["geo_id", "geo_level", "median_household_income", "observed_at", "source_id"]
+    if wide.empty:
+        frame = pd.DataFrame({column: [] for column in columns})
+    else:
+        frame = wide.assign(median_household_income=wide[table])[columns]
+    return validate_connector("connector.census_acs", frame)
+
+
+def fetch_census_acs_wide(
+    *,
+    states: Sequence[str],
+    variables: Sequence[str],
+    counties: Sequence[str] | None = None,
+    tract: str | None = None,
+    names: Mapping[str, str] | None = None,
+    config: CensusAcsConfig | None = None,
+    session: requests.Session | None = None,
+) -> pd.DataFrame:
+    """One row per tract with a column per ACS variable, for every state and county given.
+
+    ``counties`` defaults to all counties of each state.  Variables are
+    renamed through ``names`` (default :data:`ACS_VARIABLE_NAMES`); API null
+    sentinels become ``NaN``.  A CO/UT/ID pull of up to 50 variables is three
+    requests.
+    """
+
+    config = config or CensusAcsConfig()
+    codes = list(dict.fromkeys(variables))
+    if not codes:
+        raise ConnectorError("ACS request needs at least one variable")
     url = f"{config.base_url}/{config.dataset}"
-    params: dict[str, Any] = {
-        "get": ",".join(["NAME", table, "state", "county", "tract"]),
-        "for": f"tract:{tract}" if tract else "tract:*",
-        "in": f"state:{state} county:{county}",
-    }
     api_key = _get_api_key(optional=False)
-    params["key"] = api_key
-
-    http = session or requests.Session()
-    response = http.get(url, params=params, timeout=60)
+    http = session or pooled_session(url)
+    step = max(1, config.max_variables)
+    chunks = [codes[start : start + step] for start in range(0, len(codes), step)]
+    county_clause = _county_clause(counties)
+
+    frames: List[pd.DataFrame] = []
+    for state in dict.fromkeys(states):
+        parts = [
+            _request_chunk(
+                http,
+                url,
+                {
+                    "get": ",".join(chunk),
+                    "for": f"tract:{tract}" if tract else "tract:*",
+                    "in": f"state:{state} {county_clause}",
+                    "key": api_key,
+                },
+                chunk,
+            )
+            for chunk in chunks
+        ]
+        parts = [part for part in parts if not part.empty]
+        if parts:
+            # Geography columns come from the first chunk; later chunks add variables only.
+            tail = [part.drop(columns=list(_GEO_COLUMNS)) for part in parts[1:]]
+            frames.append(pd.concat([parts[0], *tail], axis=1).reset_index())
+    renames = dict(ACS_VARIABLE_NAMES if names is None else names)
+    if not frames:
+        empty = ["geo_id", "geo_level", *_GEO_COLUMNS, *codes, "observed_at", "source_id"]
+        return pd.DataFrame({column: [] for column in empty}).rename(columns=renames)
+
+    wide = pd.concat(frames, ignore_index=True)
+    wide["geo_level"] = "tract"
+    wide["observed_at"] = pd.to_datetime(date.today().replace(month=12, day=31))
+    wide["source_id"] = "connector.census_acs"
+    ordered = ["geo_id", "geo_level", *_GEO_COLUMNS, *codes, "observed_at", "source_id"]
+    # A chunk that came back empty everywhere leaves its variables as NaN columns.
+    return wide.reindex(columns=ordered).rename(columns=renames)
+
+
+def _county_clause(counties: Sequence[str] | None) -> str:
+    if not counties or "*" in counties:
+        return "county:*"
+    return "county:" + ",".join(dict.fromkeys(counties))
+
+
+def _request_chunk(
+    http: requests.Session, url: str, params: Mapping[str, Any], chunk: Sequence[str]
+) -> pd.DataFrame:
+    limiter_for("connector.census_acs").acquire()
+    response = http.get(url, params=params, headers=conditional_headers(), timeout=60)
+    observe_response(response.status_code, response.headers)
     if response.status_code not in {200, 204}:
         raise ConnectorError(
             "ACS request failed",
             context={"status": response.status_code, "url": response.url, "text": response.text},
         )
     payload = response.json() if response.text else []
-    frame = _to_frame(payload, table)
-    return validate_connector("connector.census_acs", frame)
+    return _to_columns(payload, chunk)
 
 
-def _to_frame(payload: Iterable[Iterable[Any]], table: str) -> pd.DataFrame:
-    rows = list(payload)
-    if not rows:
-        return pd.DataFrame(
-            {
-                "geo_id": [],
-                "geo_level": [],
-                "median_household_income": [],
-                "observed_at": [],
-                "source_id": [],
-            }
-        )
-    header, *rest = rows
-    expected = {"NAME", table, "state", "county", "tract"}
-    if not expected.issubset(set(header)):
+def _to_columns(payload: Sequence[Sequence[Any]], chunk: Sequence[str]) -> pd.DataFrame:
+    """Transpose an array-of-arrays payload into a ``geo_id``-indexed column frame."""
+
+    if not payload:
+        return pd.DataFrame()
+    header, rows = list(payload[0]), payload[1:]
+    expected = {*chunk, *_GEO_COLUMNS}
+    if not expected.issubset(header):
         raise SchemaError(
             "ACS response missing expected columns",
             context={"expected": sorted(expected), "header": header},
         )
-    frame = pd.DataFrame([dict(zip(header, values)) for values in rest])
-    if frame.empty:
-        raise ConnectorError("ACS returned no rows", context={"table": table})
-    frame["geo_id"] = frame["state"].astype(str) + frame["county"].astype(str) + frame["tract"].astype(str)
-    frame["geo_level"] = "tract"
-    frame["median_household_income"] = frame[table].astype(float)
-    frame["observed_at"] = pd.to_datetime(date.today().replace(month=12, day=31))
-    frame["source_id"] = "connector.census_acs"
-    return frame[["geo_id", "geo_level", "median_household_income", "observed_at", "source_id"]]
+    if not rows:
+        raise ConnectorError("ACS returned no rows", context={"variables": list(chunk)})
+    matrix = np.asarray(rows, dtype=object)
+    position = {name: index for index, name in enumerate(header)}
+    columns: Dict[str, Any] = {
+        name: matrix[:, position[name]].astype(str) for name in _GEO_COLUMNS
+    }
+    for code in chunk:
+        values = pd.to_numeric(matrix[:, position[code]], errors="coerce").astype(float)
+        values[np.isin(values, _NULL_SENTINELS)] = np.nan
+        columns[code] = values
+    geo_id = np.char.add(np.char.add(columns["state"], columns["county"]), columns["tract"])
+    frame = pd.DataFrame(columns, index=pd.Index(geo_id, name="geo_id"))
+    return frame[~frame.index.duplicated()]
 
 
 def _get_api_key(*, optional: bool = False) -> str | None:
@@ -90,4 +195,10 @@ def _get_api_key(*, optional: bool = False) -> str | None:
     return key
 
 
-__all__ = ["fetch_census_acs", "CensusAcsConfig"]
+__all__ = [
+    "ACS_MAX_VARIABLES",
+    "ACS_VARIABLE_NAMES",
+    "CensusAcsConfig",
+    "fetch_census_acs",
+    "fetch_census_acs_wide",
+]
@@ -3,20 +3,31 @@ from __future__ import annotations
 import json
 import logging
 import threading
-import time
 from dataclasses import dataclass, field
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, Dict, Iterable, Mapping, Sequence, Tuple
+from urllib.parse import urlsplit
 
+import numpy as np
+import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 
+from west_housing_model.core.exceptions import ConnectorError
+from west_housing_model.data.conditional import conditional_headers, observe_response
+from west_housing_model.data.rate_limit import RateLimiter, limiter_for
+
 
 _LOGGER = logging.getLogger(__name__)
 
+# Keep-alive connections per host; matches AsyncRepository's default worker
+# count (Repository.get_many uses 8), so concurrent fetches never queue on the pool.
+DEFAULT_POOL_MAXSIZE = 32
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
 
 class FixtureNotFoundError(FileNotFoundError):
     """Raised when a fixture lookup fails."""
@@ -45,9 +56,125 @@ class FixturePlayback:
         return self.decoder(path.read_text())
 
 
+def _pooled_adapter(retries: int, backoff_factor: float, pool_maxsize: int) -> HTTPAdapter:
+    return HTTPAdapter(
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=("GET", "POST"),
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class HttpPoolStats:
+    """Keep-alive counters for one host across the registry's sessions."""
+
+    host: str
+    requests: int
+    connections: int
+
+    @property
+    def reused(self) -> int:
+        """Requests served over an already-open connection."""
+
+        return max(0, self.requests - self.connections)
+
+
+class SessionRegistry:
+    """Process-wide ``requests.Session`` per origin with pooled keep-alive connections.
+
+    Connectors used to build a fresh session per call (or per fetcher),
+    paying a TCP+TLS handshake for every request.  Sessions here are created
+    once per ``(origin, retries, backoff_factor)`` and mounted with an
+    ``HTTPAdapter`` sized to :data:`DEFAULT_POOL_MAXSIZE`.
+    """
+
+    def __init__(self, *, pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> None:
+        self.pool_maxsize = pool_maxsize
+        self._sessions: Dict[Tuple[str, int, float], requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session_for(
+        self, url: str, *, retries: int = 3, backoff_factor: float = 0.5
+    ) -> requests.Session:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}" if parts.netloc else url
+        key = (origin, retries, backoff_factor)
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                adapter = _pooled_adapter(retries, backoff_factor, self.pool_maxsize)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[key] = session
+        return session
+
+    def stats(self) -> list[HttpPoolStats]:
+        """Requests vs. new connections per host (``reused`` shows keep-alive hits)."""
+
+        totals: Dict[str, Tuple[int, int]] = {}
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+            for adapter in adapters.values():
+                pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+                if pools is None:
+                    continue
+                for pool_key in pools.keys():
+                    pool = pools.get(pool_key)
+                    if pool is None:
+                        continue
+                    requests_seen, connections = totals.get(pool.host, (0, 0))
+                    totals[pool.host] = (
+                        requests_seen + pool.num_requests,
+                        connections + pool.num_connections,
+                    )
+        return [
+            HttpPoolStats(host=host, requests=counts[0], connections=counts[1])
+            for host, counts in sorted(totals.items())
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            session.close()
+
+
+SESSIONS = SessionRegistry()
+
+
+def pooled_session(url: str, *, retries: int = 3, backoff_factor: float = 0.5) -> requests.Session:
+    """Shared keep-alive session for ``url``'s origin from :data:`SESSIONS`."""
+
+    return SESSIONS.session_for(url, retries=retries, backoff_factor=backoff_factor)
+
+
+def http_pool_stats() -> list[HttpPoolStats]:
+    """Keep-alive counters for every host contacted through :data:`SESSIONS`."""
+
+    return SESSIONS.stats()
+
+
 @dataclass(slots=True)
 class HttpFetcher:
-    """Reusable HTTP helper with retries, rate limiting, and fixture playback."""
+    """Reusable HTTP helper with retries, rate limiting, and fixture playback.
+
+    Without an explicit ``session`` the fetcher uses the shared pooled session
+    for ``base_url``'s origin, so fetchers for the same host reuse connections.
+    With ``source_id`` requests are paced by that source's process-wide
+    limiter (:func:`~west_housing_model.data.rate_limit.limiter_for`), so every
+    fetcher for a source draws from one token bucket; ``rate_limit_per_sec``
+    paces this fetcher alone.
+    """
 
     base_url: str
     session: requests.Session | None = None
@@ -56,37 +183,32 @@ class HttpFetcher:
     timeout: float = 60.0
     rate_limit_per_sec: float | None = None
     fixture: FixturePlayback | None = None
-    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
-    _last_request_ts: float = field(default=0.0, init=False)
+    source_id: str | None = None
+    _limiter: RateLimiter | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
-        session = self._ensure_session()
-        adapter = HTTPAdapter(
-            max_retries=Retry(
-                total=self.retries,
-                backoff_factor=self.backoff_factor,
-                status_forcelist=(429, 500, 502, 503, 504),
-                allowed_methods=("GET", "POST"),
+        if self.source_id is None and self.rate_limit_per_sec and self.rate_limit_per_sec > 0:
+            self._limiter = RateLimiter(self.rate_limit_per_sec)
+        if self.session is None:
+            self.session = pooled_session(
+                self.base_url, retries=self.retries, backoff_factor=self.backoff_factor
             )
-        )
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+            return
+        adapter = _pooled_adapter(self.retries, self.backoff_factor, DEFAULT_POOL_MAXSIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _ensure_session(self) -> requests.Session:
         if self.session is None:
-            self.session = requests.Session()
+            self.session = pooled_session(
+                self.base_url, retries=self.retries, backoff_factor=self.backoff_factor
+            )
         return self.session
 
     def _respect_rate_limit(self) -> None:
-        if self.rate_limit_per_sec and self.rate_limit_per_sec > 0:
-            min_interval = 1.0 / self.rate_limit_per_sec
-            with self._lock:
-                now = time.monotonic()
-                elapsed = now - self._last_request_ts
-                if elapsed < min_interval:
-                    time.sleep(min_interval - elapsed)
-                    now = time.monotonic()
-                self._last_request_ts = now
+        limiter = limiter_for(self.source_id) if self.source_id is not None else self._limiter
+        if limiter is not None:
+            limiter.acquire()
 
     def get_json(
         self,
@@ -103,7 +225,10 @@ class HttpFetcher:
         self._respect_rate_limit()
         url = self._build_url(path)
         session = self._ensure_session()
-        response = session.get(url, params=params, headers=headers, timeout=self.timeout)
+        # Inside a repository refresh this adds If-None-Match/If-Modified-Since.
+        response = session.get(
+            url, params=params, headers=conditional_headers(headers), timeout=self.timeout
+        )
         _LOGGER.debug(
             "HTTP GET",
             extra={
@@ -113,6 +238,7 @@ class HttpFetcher:
                 "params": dict(params or {}),
             },
         )
+        observe_response(response.status_code, response.headers)
         response.raise_for_status()
         return response.json()
 
@@ -143,4 +269,148 @@ def load_static_records(name: str) -> list[dict[str, Any]]:
     return json.loads(path.read_text())
 
 
-__all__ = ["FixturePlayback", "HttpFetcher", "FixtureNotFoundError", "load_static_records"]
+class StaticDataset:
+    """A packaged fixture built once into a frame indexed by its key column.
+
+    ``lookup`` returns the first row (in file order) whose key matches, via a
+    hash index instead of a boolean-mask scan.  With ``prefix_len`` set, keys
+    with no exact match fall back to the first row whose key starts with the
+    same ``prefix_len`` characters (e.g. tract -> county FIPS).  ``upper_keys``
+    makes matching case-insensitive for codes such as state abbreviations.
+    """
+
+    def __init__(
+        self,
+        frame: pd.DataFrame,
+        key: str,
+        *,
+        prefix_len: int | None = None,
+        upper_keys: bool = False,
+    ) -> None:
+        self.frame = frame.reset_index(drop=True)
+        self.key = key
+        self.prefix_len = prefix_len
+        self.upper_keys = upper_keys
+        keys = self.frame[key].astype(str)
+        if upper_keys:
+            keys = keys.str.upper()
+        first = ~keys.duplicated()
+        self._index = pd.Index(keys[first])
+        self._positions = np.flatnonzero(first.to_numpy())
+        self._prefix_index: pd.Index | None = None
+        self._prefix_positions = np.empty(0, dtype=np.intp)
+        if prefix_len is not None:
+            eligible = keys.str.len() >= prefix_len
+            prefixes = keys[eligible].str[:prefix_len]
+            first_prefix = ~prefixes.duplicated()
+            self._prefix_index = pd.Index(prefixes[first_prefix])
+            self._prefix_positions = np.flatnonzero(eligible.to_numpy())[
+                first_prefix.to_numpy()
+            ]
+
+    def _normalize(self, keys: Iterable[str]) -> list[str]:
+        normalized = [str(key) for key in keys]
+        return [key.upper() for key in normalized] if self.upper_keys else normalized
+
+    def _positions_for(self, keys: list[str]) -> np.ndarray[Any, np.dtype[np.intp]]:
+        """Row position per key (``-1`` when neither the key nor its prefix is known)."""
+
+        found = self._index.get_indexer(keys)
+        positions = np.where(found >= 0, self._positions[np.maximum(found, 0)], -1)
+        if self._prefix_index is not None and self.prefix_len is not None:
+            missing = np.flatnonzero(
+                (positions < 0) & np.array([len(key) > self.prefix_len for key in keys])
+            )
+            if missing.size:
+                prefixes = [keys[i][: self.prefix_len] for i in missing]
+                by_prefix = self._prefix_index.get_indexer(prefixes)
+                positions[missing] = np.where(
+                    by_prefix >= 0, self._prefix_positions[np.maximum(by_prefix, 0)], -1
+                )
+        return positions
+
+    def lookup(self, key: str) -> pd.DataFrame:
+        """One-row frame for ``key`` (empty when unknown)."""
+
+        return self.lookup_many([key])
+
+    def lookup_many(self, keys: Iterable[str]) -> pd.DataFrame:
+        """Rows for ``keys`` in request order, indexed by position in ``keys``.
+
+        Unknown keys are omitted, so the index doubles as the query key of a
+        bulk fetch.
+        """
+
+        positions = self._positions_for(self._normalize(keys))
+        found = positions >= 0
+        rows = self.frame.iloc[positions[found]]
+        rows.index = pd.Index(np.flatnonzero(found))
+        return rows
+
+
+def fetch_each(keys: Sequence[str], fetch_one: Callable[[str], pd.DataFrame]) -> pd.DataFrame:
+    """Per-key fallback for endpoints without a batch API.
+
+    Returns the first row for each key indexed by its position in ``keys``;
+    keys whose fetch raises :class:`ConnectorError` (data unavailable) are
+    omitted, as in :meth:`StaticDataset.lookup_many`.
+    """
+
+    rows: list[pd.DataFrame] = []
+    for position, key in enumerate(keys):
+        try:
+            frame = fetch_one(key)
+        except ConnectorError:
+            continue
+        rows.append(frame.iloc[[0]].set_axis([position]))
+    if not rows:
+        return pd.DataFrame()
+    return pd.concat(rows)
+
+
+_STATIC_DATASETS: Dict[str, StaticDataset] = {}
+_STATIC_DATASETS_LOCK = threading.Lock()
+
+
+def static_dataset(
+    name: str,
+    key: str,
+    *,
+    build: Callable[[], pd.DataFrame] | None = None,
+    prefix_len: int | None = None,
+    upper_keys: bool = False,
+) -> StaticDataset:
+    """Process-wide :class:`StaticDataset` for packaged fixture ``name`` (built once).
+
+    ``build`` produces the typed frame; it defaults to the raw fixture records.
+    """
+
+    dataset = _STATIC_DATASETS.get(name)
+    if dataset is not None:
+        return dataset
+    with _STATIC_DATASETS_LOCK:
+        dataset = _STATIC_DATASETS.get(name)
+        if dataset is None:
+            frame = build() if build is not None else pd.DataFrame.from_records(
+                load_static_records(name)
+            )
+            dataset = StaticDataset(frame, key, prefix_len=prefix_len, upper_keys=upper_keys)
+            _STATIC_DATASETS[name] = dataset
+    return dataset
+
+
+__all__ = [
+    "FixturePlayback",
+    "FixtureNotFoundError",
+    "DEFAULT_POOL_MAXSIZE",
+    "HttpFetcher",
+    "HttpPoolStats",
+    "SESSIONS",
+    "SessionRegistry",
+    "StaticDataset",
+    "fetch_each",
+    "http_pool_stats",
+    "load_static_records",
+    "pooled_session",
+    "static_dataset",
+]
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 import pandas as pd
 
 from west_housing_model.core.exceptions import ConnectorError
-from west_housing_model.data.connectors.common import HttpFetcher, load_static_records
+from west_housing_model.data.connectors.common import (
+    HttpFetcher,
+    StaticDataset,
+    fetch_each,
+    load_static_records,
+    static_dataset,
+)
 
 
 STATIC_NAME = "eia_v2"
@@ -24,6 +31,18 @@ def _load_static() -> pd.DataFrame:
     return frame
 
 
+def _static() -> StaticDataset:
+    return static_dataset(STATIC_NAME, "state", build=_load_static, upper_keys=True)
+
+
+def _normalize(frame: pd.DataFrame) -> pd.DataFrame:
+    normalized = frame.copy()
+    normalized["state"] = normalized["state"].str.upper()
+    normalized["source_id"] = SOURCE_ID
+    normalized["observed_at"] = pd.to_datetime(normalized["observed_at"]).dt.normalize()
+    return normalized[["state", "res_price_cents_per_kwh", "observed_at", "source_id"]]
+
+
 def fetch_eia_rates(
     *,
     state: str,
@@ -35,8 +54,7 @@ def fetch_eia_rates(
         payload = http.get_json(cfg.base_url, params={"state": state})
         frame = pd.DataFrame(payload)
     else:
-        frame = _load_static()
-        frame = frame[frame["state"].str.upper() == state.upper()]
+        frame = _static().lookup(state)
 
     if frame.empty:
         raise ConnectorError(
@@ -44,11 +62,23 @@ def fetch_eia_rates(
             context={"state": state},
         )
 
-    normalized = frame.iloc[[0]].copy()
-    normalized["state"] = normalized["state"].str.upper()
-    normalized["source_id"] = SOURCE_ID
-    normalized["observed_at"] = pd.to_datetime(normalized["observed_at"]).dt.normalize()
-    return normalized[["state", "res_price_cents_per_kwh", "observed_at", "source_id"]]
+    return _normalize(frame.iloc[[0]])
+
+
+def fetch_eia_rates_many(
+    *,
+    states: Sequence[str],
+    config: EIAConfig | None = None,
+    http: HttpFetcher | None = None,
+) -> pd.DataFrame:
+    """Rows for many ``states``, indexed by position in the input (misses omitted)."""
+
+    cfg = config or EIAConfig()
+    if http and cfg.base_url:
+        return fetch_each(
+            states, lambda state: fetch_eia_rates(state=state, config=cfg, http=http)
+        )
+    return _normalize(_static().lookup_many(states))
 
 
-__all__ = ["fetch_eia_rates", "EIAConfig"]
+__all__ = ["fetch_eia_rates", "fetch_eia_rates_many", "EIAConfig"]
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 import pandas as pd
 
 from west_housing_model.core.exceptions import ConnectorError
-from west_housing_model.data.connectors.common import HttpFetcher, load_static_records
+from west_housing_model.data.connectors.common import (
+    HttpFetcher,
+    StaticDataset,
+    fetch_each,
+    load_static_records,
+    static_dataset,
+)
 
 
 STATIC_NAME = "fcc_bdc"
@@ -24,6 +31,17 @@ def _load_static() -> pd.DataFrame:
     return frame
 
 
+def _static() -> StaticDataset:
+    return static_dataset(STATIC_NAME, "geo_id", build=_load_static)
+
+
+def _normalize(frame: pd.DataFrame) -> pd.DataFrame:
+    normalized = frame.copy()
+    normalized["source_id"] = SOURCE_ID
+    normalized["observed_at"] = pd.to_datetime(normalized["observed_at"]).dt.normalize()
+    return normalized[["geo_id", "broadband_gbps_flag", "observed_at", "source_id"]]
+
+
 def fetch_fcc_broadband(
     *,
     geo_id: str,
@@ -35,8 +53,7 @@ def fetch_fcc_broadband(
         payload = http.get_json(cfg.base_url, params={"geo_id": geo_id})
         frame = pd.DataFrame(payload)
     else:
-        frame = _load_static()
-        frame = frame[frame["geo_id"] == geo_id]
+        frame = _static().lookup(geo_id)
 
     if frame.empty:
         raise ConnectorError(
@@ -44,10 +61,23 @@ def fetch_fcc_broadband(
             context={"geo_id": geo_id},
         )
 
-    normalized = frame.iloc[[0]].copy()
-    normalized["source_id"] = SOURCE_ID
-    normalized["observed_at"] = pd.to_datetime(normalized["observed_at"]).dt.normalize()
-    return normalized[["geo_id", "broadband_gbps_flag", "observed_at", "source_id"]]
+    return _normalize(frame.iloc[[0]])
+
+
+def fetch_fcc_broadband_many(
+    *,
+    geo_ids: Sequence[str],
+    config: FCCBDCConfig | None = None,
+    http: HttpFetcher | None = None,
+) -> pd.DataFrame:
+    """Rows for many ``geo_ids``, indexed by position in the input (misses omitted)."""
+
+    cfg = config or FCCBDCConfig()
+    if http and cfg.base_url:
+        return fetch_each(
+            geo_ids, lambda geo_id: fetch_fcc_broadband(geo_id=geo_id, config=cfg, http=http)
+        )
+    return _normalize(_static().lookup_many(geo_ids))
 
 
-__all__ = ["fetch_fcc_broadband", "FCCBDCConfig"]
+__all__ = ["fetch_fcc_broadband", "fetch_fcc_broadband_many", "FCCBDCConfig"]
@@ -9,10 +9,14 @@ import requests
 
 from west_housing_model.core.exceptions import ConnectorError, SchemaError
 from west_housing_model.data.catalog import validate_connector
+from west_housing_model.data.connectors.common import pooled_session
+from west_housing_model.data.rate_limit import limiter_for
 
 
 _LOGGER = logging.getLogger(__name__)
 
+STORM_EVENTS_URL = "https://www.ncdc.noaa.gov/swdiws/json/stormevents"
+
 
 def fetch_storm_events(
     *,
@@ -32,10 +36,9 @@ def fetch_storm_events(
         "endyear": end_year,
         "results": "json",
     }
-    http = session or requests.Session()
-    response = http.get(
-        "https://www.ncdc.noaa.gov/swdiws/json/stormevents", params=params, timeout=120
-    )
+    http = session or pooled_session(STORM_EVENTS_URL)
+    limiter_for("connector.noaa_storm_events").acquire()
+    response = http.get(STORM_EVENTS_URL, params=params, timeout=120)
     _check_response(response)
     payload = response.json()
     events = _extract_events(payload)
@@ -82,4 +85,4 @@ def _extract_events(payload: dict[str, Any]) -> list[dict[str, Any]]:
     return events
 
 
-__all__ = ["fetch_storm_events"]
+__all__ = ["STORM_EVENTS_URL", "fetch_storm_events"]
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 import pandas as pd
 
 from west_housing_model.core.exceptions import ConnectorError
-from west_housing_model.data.connectors.common import HttpFetcher, load_static_records
+from west_housing_model.data.connectors.common import (
+    HttpFetcher,
+    StaticDataset,
+    fetch_each,
+    load_static_records,
+    static_dataset,
+)
 
 
 STATIC_NAME = "usfs_wildfire"
@@ -23,6 +30,17 @@ def _load_static() -> pd.DataFrame:
     return pd.DataFrame.from_records(records)
 
 
+def _static() -> StaticDataset:
+    return static_dataset(STATIC_NAME, "geo_id", build=_load_static, prefix_len=5)
+
+
+def _normalize(frame: pd.DataFrame) -> pd.DataFrame:
+    normalized = frame.copy()
+    normalized["source_id"] = SOURCE_ID
+    normalized["observed_at"] = pd.to_datetime(normalized["observed_at"]).dt.normalize()
+    return normalized[["geo_id", "wildfire_risk_percentile", "observed_at", "source_id"]]
+
+
 def fetch_usfs_wildfire(
     *,
     geo_id: str,
@@ -35,12 +53,8 @@ def fetch_usfs_wildfire(
         payload = http.get_json(cfg.base_url, params={"geoid": geo_id})
         frame = pd.DataFrame(payload)
     else:
-        frame = _load_static()
-        subset = frame[frame["geo_id"] == geo_id]
-        if subset.empty and len(geo_id) > 5:
-            prefix = geo_id[:5]
-            subset = frame[frame["geo_id"].str.startswith(prefix)]
-        frame = subset
+        # Tracts without their own row fall back to their county (5-digit FIPS).
+        frame = _static().lookup(geo_id)
 
     if frame.empty:
         raise ConnectorError(
@@ -48,11 +62,23 @@ def fetch_usfs_wildfire(
             context={"geo_id": geo_id},
         )
 
-    normalized = frame.iloc[[0]].copy()
-    normalized["geo_id"] = normalized["geo_id"].iloc[0]
-    normalized["source_id"] = SOURCE_ID
-    normalized["observed_at"] = pd.to_datetime(normalized["observed_at"]).dt.normalize()
-    return normalized[["geo_id", "wildfire_risk_percentile", "observed_at", "source_id"]]
+    return _normalize(frame.iloc[[0]])
+
+
+def fetch_usfs_wildfire_many(
+    *,
+    geo_ids: Sequence[str],
+    config: USFSWildfireConfig | None = None,
+    http: HttpFetcher | None = None,
+) -> pd.DataFrame:
+    """Rows for many ``geo_ids``, indexed by position in the input (misses omitted)."""
+
+    cfg = config or USFSWildfireConfig()
+    if http and cfg.base_url:
+        return fetch_each(
+            geo_ids, lambda geo_id: fetch_usfs_wildfire(geo_id=geo_id, config=cfg, http=http)
+        )
+    return _normalize(_static().lookup_many(geo_ids))
 
 
-__all__ = ["fetch_usfs_wildfire", "USFSWildfireConfig"]
+__all__ = ["fetch_usfs_wildfire", "fetch_usfs_wildfire_many", "USFSWildfireConfig"]
@@ -48,7 +48,7 @@ def fetch_usgs_designmaps(
     http: HttpFetcher | None = None,
 ) -> pd.DataFrame:
     cfg = config or USGSDesignMapsConfig()
-    fetcher = http or HttpFetcher(cfg.base_url)
+    fetcher = http or HttpFetcher(cfg.base_url, source_id="connector.usgs_designmaps")
     request_params: Mapping[str, Any] = {
         "latitude": lat,
         "longitude": lon,
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 import pandas as pd
 
 from west_housing_model.core.exceptions import ConnectorError
-from west_housing_model.data.connectors.common import HttpFetcher, load_static_records
+from west_housing_model.data.connectors.common import (
+    HttpFetcher,
+    StaticDataset,
+    fetch_each,
+    load_static_records,
+    static_dataset,
+)
 
 
 STATIC_NAME = "usgs_epqs"
@@ -24,6 +31,17 @@ def _load_static() -> pd.DataFrame:
     return frame
 
 
+def _static() -> StaticDataset:
+    return static_dataset(STATIC_NAME, "place_id", build=_load_static)
+
+
+def _normalize(frame: pd.DataFrame) -> pd.DataFrame:
+    normalized = frame.copy()
+    normalized["source_id"] = SOURCE_ID
+    normalized["observed_at"] = pd.to_datetime(normalized["observed_at"]).dt.normalize()
+    return normalized[["place_id", "slope_gt15_pct_within_10km", "observed_at", "source_id"]]
+
+
 def fetch_usgs_epqs(
     *,
     place_id: str,
@@ -35,8 +53,7 @@ def fetch_usgs_epqs(
         payload = http.get_json(cfg.base_url, params={"place_id": place_id})
         frame = pd.DataFrame(payload)
     else:
-        frame = _load_static()
-        frame = frame[frame["place_id"] == place_id]
+        frame = _static().lookup(place_id)
 
     if frame.empty:
         raise ConnectorError(
@@ -44,10 +61,23 @@ def fetch_usgs_epqs(
             context={"place_id": place_id},
         )
 
-    normalized = frame.iloc[[0]].copy()
-    normalized["source_id"] = SOURCE_ID
-    normalized["observed_at"] = pd.to_datetime(normalized["observed_at"]).dt.normalize()
-    return normalized[["place_id", "slope_gt15_pct_within_10km", "observed_at", "source_id"]]
+    return _normalize(frame.iloc[[0]])
+
+
+def fetch_usgs_epqs_many(
+    *,
+    place_ids: Sequence[str],
+    config: USGSEPQSConfig | None = None,
+    http: HttpFetcher | None = None,
+) -> pd.DataFrame:
+    """Rows for many ``place_ids``, indexed by position in the input (misses omitted)."""
+
+    cfg = config or USGSEPQSConfig()
+    if http and cfg.base_url:
+        return fetch_each(
+            place_ids, lambda place_id: fetch_usgs_epqs(place_id=place_id, config=cfg, http=http)
+        )
+    return _normalize(_static().lookup_many(place_ids))
 
 
-__all__ = ["fetch_usgs_epqs", "USGSEPQSConfig"]
+__all__ = ["fetch_usgs_epqs", "fetch_usgs_epqs_many", "USGSEPQSConfig"]
@@ -0,0 +1,291 @@
+"""Asynchronous, batched capture of connector failures.
+
+Failures used to be written synchronously as one small file per event, which
+during an upstream outage turned every request into several filesystem
+syscalls.  :class:`FailureRecorder` instead puts events on a bounded queue
+that a single daemon thread drains in batches, appending them to rotated JSONL
+files under ``<failure root>/<source_id>/failures-<YYYYMMDD>[.<n>].jsonl``.
+
+Identical failures (same source, kind, message and details) seen again within
+``dedupe_window`` seconds are not queued; the next written copy carries the
+number of suppressed repeats.  When the queue is full new events are dropped
+and counted instead of blocking the request path.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import pandas as pd
+
+DEFAULT_MAX_QUEUE = 1_000
+DEFAULT_DEDUPE_WINDOW_S = 60.0
+DEFAULT_MAX_FILE_BYTES = 10 * 1024 * 1024
+# Schema-failure payloads keep at most this many rows of the offending frame.
+MAX_PAYLOAD_ROWS = 1_000
+_BATCH_SIZE = 256
+
+DedupeKey = Tuple[str, str, str, str, str]
+
+
+def failure_root() -> Path:
+    """Base directory for failure logs (``WEST_HOUSING_MODEL_FAILURE_CACHE`` or ``./failures``)."""
+
+    root = os.getenv("WEST_HOUSING_MODEL_FAILURE_CACHE")
+    return Path(root) if root else Path.cwd() / "failures"
+
+
+@dataclass(frozen=True)
+class FailureLogStats:
+    """Counters for a :class:`FailureRecorder`."""
+
+    written: int
+    deduplicated: int
+    dropped: int
+    queued: int
+
+
+@dataclass
+class _FailureEvent:
+    root: Path
+    source_id: str
+    payload: Dict[str, Any]
+    frame: Optional[pd.DataFrame] = None
+
+
+class FailureRecorder:
+    """Bounded background writer for failure events."""
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        dedupe_window: float = DEFAULT_DEDUPE_WINDOW_S,
+        max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.dedupe_window = dedupe_window
+        self.max_file_bytes = max_file_bytes
+        self._monotonic = monotonic
+        self._queue: "queue.Queue[_FailureEvent]" = queue.Queue(maxsize=max_queue)
+        self._seen: Dict[DedupeKey, Tuple[float, int]] = {}
+        self._written = 0
+        self._deduplicated = 0
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+
+    def record(
+        self,
+        source_id: str,
+        kind: str,
+        message: str,
+        *,
+        correlation_id: Optional[str] = None,
+        details: Optional[Mapping[str, Any]] = None,
+        frame: Optional[pd.DataFrame] = None,
+    ) -> bool:
+        """Queue a failure; returns ``False`` when it was deduplicated or dropped."""
+
+        root = failure_root()
+        detail_text = json.dumps(details or {}, default=str, sort_keys=True)
+        key = (str(root), source_id, kind, message, detail_text)
+        now = self._monotonic()
+        with self._lock:
+            first_seen, repeats = self._seen.get(key, (float("-inf"), 0))
+            if now - first_seen < self.dedupe_window:
+                self._seen[key] = (first_seen, repeats + 1)
+                self._deduplicated += 1
+                return False
+            self._seen[key] = (now, 0)
+            if len(self._seen) > self._queue.maxsize:
+                self._prune_locked(now)
+        payload: Dict[str, Any] = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "source_id": source_id,
+            "kind": kind,
+            "correlation_id": correlation_id,
+            "message": message,
+        }
+        if repeats:
+            payload["suppressed_repeats"] = repeats
+        if details:
+            payload.update(details)
+        event = _FailureEvent(root=root, source_id=source_id, payload=payload, frame=frame)
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            return False
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event is on disk; returns ``False`` on timeout."""
+
+        if self._writer is None:
+            return True
+        deadline = None if timeout is None else self._monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and self._monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def stats(self) -> FailureLogStats:
+        with self._lock:
+            return FailureLogStats(
+                written=self._written,
+                deduplicated=self._deduplicated,
+                dropped=self._dropped,
+                queued=self._queue.qsize(),
+            )
+
+    def _prune_locked(self, now: float) -> None:
+        expired = [k for k, (seen, _) in self._seen.items() if now - seen >= self.dedupe_window]
+        for key in expired:
+            del self._seen[key]
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._run, name="whm-failure-log", daemon=True
+                )
+                self._writer.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < _BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            except Exception:  # pragma: no cover - failure capture must never raise
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: List[_FailureEvent]) -> None:
+        grouped: Dict[Path, List[str]] = {}
+        for event in batch:
+            payload = dict(event.payload)
+            if event.frame is not None:
+                sample = event.frame.head(MAX_PAYLOAD_ROWS)
+                payload["rows"] = int(event.frame.shape[0])
+                payload["payload"] = json.loads(
+                    sample.to_json(orient="records", date_format="iso", default_handler=str)
+                )
+            directory = event.root / event.source_id
+            grouped.setdefault(directory, []).append(json.dumps(payload, default=str))
+        for directory, lines in grouped.items():
+            block = "\n".join(lines) + "\n"
+            try:
+                self._append(directory, block)
+            except FileNotFoundError:
+                # Only the first batch for a source pays for the mkdir.
+                directory.mkdir(parents=True, exist_ok=True)
+                self._append(directory, block)
+            with self._lock:
+                self._written += len(lines)
+
+    def _append(self, directory: Path, block: str) -> None:
+        with open(self._current_file(directory), "a", encoding="utf-8") as handle:
+            handle.write(block)
+
+    def _current_file(self, directory: Path) -> Path:
+        """Today's file, rolling over to ``.<n>`` suffixes once ``max_file_bytes`` is reached."""
+
+        stem = f"failures-{datetime.now(timezone.utc):%Y%m%d}"
+        generation = 0
+        while True:
+            name = f"{stem}.jsonl" if generation == 0 else f"{stem}.{generation}.jsonl"
+            path = directory / name
+            try:
+                if path.stat().st_size < self.max_file_bytes:
+                    return path
+            except FileNotFoundError:
+                return path
+            generation += 1
+
+
+FAILURES = FailureRecorder()
+
+
+def record_failure(
+    source_id: str,
+    kind: str,
+    message: str,
+    *,
+    correlation_id: Optional[str] = None,
+    details: Optional[Mapping[str, Any]] = None,
+    frame: Optional[pd.DataFrame] = None,
+) -> bool:
+    """Queue a failure on the process-wide :data:`FAILURES` recorder."""
+
+    return FAILURES.record(
+        source_id,
+        kind,
+        message,
+        correlation_id=correlation_id,
+        details=details,
+        frame=frame,
+    )
+
+
+def flush_failures(timeout: Optional[float] = None) -> bool:
+    """Block until the process-wide recorder has written every queued failure."""
+
+    return FAILURES.flush(timeout)
+
+
+def read_failures(source_id: str, root: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """Every captured failure for ``source_id`` in write order (flushes first)."""
+
+    flush_failures()
+    directory = (root or failure_root()) / source_id
+    entries: List[Dict[str, Any]] = []
+    for path in sorted(directory.glob("failures-*.jsonl"), key=_rotation_order):
+        with open(path, encoding="utf-8") as handle:
+            entries.extend(json.loads(line) for line in handle if line.strip())
+    return entries
+
+
+def _rotation_order(path: Path) -> Tuple[str, int]:
+    parts = path.name.split(".")
+    generation = int(parts[1]) if len(parts) == 3 else 0
+    return parts[0], generation
+
+
+# Persist the tail of the queue on interpreter shutdown.
+atexit.register(flush_failures, 5.0)
+
+
+__all__ = [
+    "DEFAULT_DEDUPE_WINDOW_S",
+    "DEFAULT_MAX_FILE_BYTES",
+    "DEFAULT_MAX_QUEUE",
+    "FAILURES",
+    "FailureLogStats",
+    "FailureRecorder",
+    "failure_root",
+    "flush_failures",
+    "read_failures",
+    "record_failure",
+]
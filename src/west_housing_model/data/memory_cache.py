@@ -0,0 +1,130 @@
+"""In-process LRU tier for validated cache artifacts.
+
+The repository consults this tier before reading Parquet from disk.  Entries
+are keyed by ``(source_id, key_hash, mtime_ns)`` so a rewrite of the artifact
+(by this or another process) naturally misses and the stale entry ages out.
+Frames stored here have already passed connector validation, which lets cache
+hits skip both the disk read and Pandera.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import pandas as pd
+
+MemoryKey = Tuple[str, str, int]
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class MemoryCacheStats:
+    """Point-in-time counters for a :class:`MemoryCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def frame_nbytes(frame: pd.DataFrame) -> int:
+    """Approximate in-memory footprint of ``frame`` including object payloads."""
+
+    return int(frame.memory_usage(deep=True, index=True).sum())
+
+
+class MemoryCache:
+    """Thread-safe LRU bounded by entry count and approximate bytes.
+
+    Frames larger than ``max_bytes`` are never admitted.  ``get`` returns a
+    copy so callers can mutate results without corrupting the cached entry.
+    """
+
+    def __init__(
+        self, *, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[MemoryKey, Tuple[pd.DataFrame, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: MemoryKey) -> Optional[pd.DataFrame]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            frame = entry[0]
+        return frame.copy()
+
+    def put(self, key: MemoryKey, frame: pd.DataFrame) -> None:
+        if self.max_entries <= 0 or self.max_bytes <= 0:
+            return
+        size = frame_nbytes(frame)
+        if size > self.max_bytes:
+            return
+        stored = frame.copy()
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (stored, size)
+            self._bytes += size
+            self._evict_locked()
+
+    def invalidate(self, source_id: str, key_hash: str) -> None:
+        """Drop every entry for ``(source_id, key_hash)`` regardless of mtime."""
+
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == source_id and k[1] == key_hash]:
+                _, size = self._entries.pop(key)
+                self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> MemoryCacheStats:
+        with self._lock:
+            return MemoryCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def _evict_locked(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_MAX_ENTRIES",
+    "MemoryCache",
+    "MemoryCacheStats",
+    "frame_nbytes",
+]
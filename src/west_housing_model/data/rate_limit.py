@@ -0,0 +1,263 @@
+"""Per-source request pacing derived from the registry ``rate_limit`` field.
+
+Registry entries describe limits as human-readable strings (``"10/s"``,
+``"40/min"``, ``"10/s burst 20"``, ``"none"``).  :func:`parse_rate_spec`
+turns them into a rate and burst size, and :class:`RateLimiter` enforces them
+as a token bucket (implemented as GCRA: one "theoretical arrival time" per
+limiter).  Callers reserve their slot under a short lock and sleep outside
+it, so concurrent workers queue at exactly the allowed rate instead of
+serialising on the lock.
+
+Limiters can share their state across worker processes through a small
+SQLite file (:class:`SharedRateState`); :func:`limiter_for` hands out the
+process-wide limiter for a source id, configured by
+:func:`configure_rate_limits`.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Mapping, Optional
+
+from west_housing_model.core.exceptions import RegistryError
+from west_housing_model.utils.logging import LogContext
+from west_housing_model.utils.logging import warning as log_warning
+
+_RATE_PATTERN = re.compile(
+    r"^\s*(\d+(?:\.\d+)?)\s*/\s*(s|sec|second|m|min|minute|h|hr|hour)"
+    r"(?:\s*[,;]?\s*burst\s*[=:]?\s*(\d+))?\s*$"
+)
+_PERIOD_SECONDS = {
+    "s": 1.0,
+    "sec": 1.0,
+    "second": 1.0,
+    "m": 60.0,
+    "min": 60.0,
+    "minute": 60.0,
+    "h": 3600.0,
+    "hr": 3600.0,
+    "hour": 3600.0,
+}
+_UNLIMITED = {"", "none", "unknown", "unlimited"}
+_STATE_TIMEOUT_S = 5.0
+
+
+@dataclass(frozen=True)
+class RateSpec:
+    """A sustained request rate plus the number of requests allowed back to back."""
+
+    rate_per_second: float
+    burst: int = 1
+
+
+def parse_rate_spec(value: Optional[str]) -> Optional[RateSpec]:
+    """Rate and burst for a registry ``rate_limit`` string (``None`` = unlimited)."""
+
+    text = (value or "").strip().lower()
+    if text in _UNLIMITED:
+        return None
+    match = _RATE_PATTERN.match(text)
+    if match is None:
+        raise RegistryError(
+            f"Invalid rate_limit '{value}', expected e.g. '10/s', '40/min' or '10/s burst 20'",
+            context={"rate_limit": value},
+        )
+    count = float(match.group(1))
+    burst = int(match.group(3) or 1)
+    if count <= 0 or burst <= 0:
+        raise RegistryError("rate_limit must be positive", context={"rate_limit": value})
+    return RateSpec(rate_per_second=count / _PERIOD_SECONDS[match.group(2)], burst=burst)
+
+
+def parse_rate_limit(value: Optional[str]) -> Optional[float]:
+    """Requests per second for a registry ``rate_limit`` string (``None`` = unlimited)."""
+
+    spec = parse_rate_spec(value)
+    return spec.rate_per_second if spec is not None else None
+
+
+class SharedRateState:
+    """Limiter state shared by every process that opens the same SQLite file.
+
+    Each limiter key stores its theoretical arrival time (wall-clock seconds);
+    a reservation reads and advances it inside one ``BEGIN IMMEDIATE``
+    transaction, so concurrent processes never hand out the same slot.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        # Connections must not cross a fork; reopen in the child process.
+        if conn is not None and getattr(self._local, "pid", None) == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=_STATE_TIMEOUT_S, isolation_level=None)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_state (key TEXT PRIMARY KEY, tat REAL NOT NULL)"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def reserve(self, key: str, now: float, interval: float, tolerance: float) -> float:
+        """Claim the next slot for ``key``; returns the seconds to wait before using it."""
+
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tat FROM rate_limit_state WHERE key = ?", (key,)).fetchone()
+            tat = max(float(row[0]) if row is not None else now, now)
+            conn.execute(
+                "INSERT INTO rate_limit_state (key, tat) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET tat = excluded.tat",
+                (key, tat + interval),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return max(0.0, tat - tolerance - now)
+
+    def close(self) -> None:
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RateLimiter:
+    """Thread-safe token bucket: ``burst`` requests at once, then one per ``1 / rate``.
+
+    With ``state`` the bucket lives in a :class:`SharedRateState` under ``key``
+    and is paced on the wall clock so every process sharing the file draws
+    from the same bucket; if the state file is unavailable the limiter falls
+    back to in-process pacing.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: Optional[float],
+        *,
+        burst: int = 1,
+        key: str = "default",
+        state: Optional[SharedRateState] = None,
+        monotonic: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self.key = key
+        self.state = state
+        self._monotonic = monotonic
+        self._sleep = sleep
+        self._clock = clock
+        self._tat = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_registry(
+        cls, value: Optional[str], *, key: str = "default", state: Optional[SharedRateState] = None
+    ) -> "RateLimiter":
+        spec = parse_rate_spec(value)
+        if spec is None:
+            return cls(None, key=key)
+        return cls(spec.rate_per_second, burst=spec.burst, key=key, state=state)
+
+    @property
+    def spec(self) -> Optional[RateSpec]:
+        if not self.rate_per_second:
+            return None
+        return RateSpec(rate_per_second=self.rate_per_second, burst=self.burst)
+
+    def acquire(self) -> float:
+        """Block until the next request may be sent; returns the seconds waited."""
+
+        if not self.rate_per_second:
+            return 0.0
+        interval = 1.0 / self.rate_per_second
+        tolerance = (self.burst - 1) * interval
+        delay = self._reserve_shared(interval, tolerance) if self.state is not None else None
+        if delay is None:
+            with self._lock:
+                now = self._monotonic()
+                tat = max(now, self._tat)
+                self._tat = tat + interval
+            delay = max(0.0, tat - tolerance - now)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    def _reserve_shared(self, interval: float, tolerance: float) -> Optional[float]:
+        assert self.state is not None
+        try:
+            return self.state.reserve(self.key, self._clock(), interval, tolerance)
+        except sqlite3.Error as exc:
+            log_warning(
+                LogContext(event="rate_limit", module="data.rate_limit", action="reserve"),
+                "rate-limit-state-unavailable",
+                key=self.key,
+                path=str(self.state.path),
+                error=str(exc),
+            )
+            return None
+
+
+_LIMITERS: Dict[str, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+_UNLIMITED_LIMITER = RateLimiter(None)
+
+
+def configure_rate_limits(
+    rate_limits: Mapping[str, Optional[str]], *, state: Optional[SharedRateState] = None
+) -> Dict[str, RateLimiter]:
+    """Install process-wide limiters from registry ``rate_limit`` strings keyed by source id.
+
+    Sources whose spec is unchanged keep their existing limiter (and its
+    position in the bucket); unlimited sources are removed.
+    """
+
+    with _LIMITERS_LOCK:
+        for source_id, value in rate_limits.items():
+            limiter = RateLimiter.from_registry(value, key=source_id, state=state)
+            if limiter.spec is None:
+                _LIMITERS.pop(source_id, None)
+                continue
+            current = _LIMITERS.get(source_id)
+            if current is None or current.spec != limiter.spec or current.state is not state:
+                _LIMITERS[source_id] = limiter
+        return dict(_LIMITERS)
+
+
+def limiter_for(source_id: str) -> RateLimiter:
+    """The process-wide limiter for ``source_id`` (a no-op limiter when none is configured)."""
+
+    return _LIMITERS.get(source_id, _UNLIMITED_LIMITER)
+
+
+def reset_rate_limits() -> None:
+    """Drop every process-wide limiter (used by tests and long-lived reconfiguration)."""
+
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
+
+
+__all__ = [
+    "RateLimiter",
+    "RateSpec",
+    "SharedRateState",
+    "configure_rate_limits",
+    "limiter_for",
+    "parse_rate_limit",
+    "parse_rate_spec",
+    "reset_rate_limits",
+]
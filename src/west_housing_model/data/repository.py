@@ -12,19 +12,58 @@ import fcntl
 import json
 import math
 import os
+import re
 import sqlite3
 import tempfile
-from contextlib import contextmanager
-from dataclasses import dataclass, field
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
-from hashlib import sha256
+from functools import partial
+from hashlib import file_digest, sha256
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Protocol
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 
 from west_housing_model.core.exceptions import CacheError, ConnectorError, SchemaError
-from west_housing_model.data.catalog import failure_capture_path, validate_connector
+from west_housing_model.data.access_stats import (
+    DEFAULT_FLUSH_INTERVAL_S,
+    LATENCY_LOAD,
+    AccessBatch,
+    AccessRecorder,
+    SourceCacheStats,
+    histogram_percentile,
+)
+from west_housing_model.data.catalog import (
+    SCHEMA_FINGERPRINT_ATTR,
+    connector_schema_fingerprint,
+    validate_connector,
+)
+from west_housing_model.data.conditional import NotModified, Validators, revalidation_scope
+from west_housing_model.data.failure_log import record_failure
+from west_housing_model.data.memory_cache import MemoryCache, MemoryCacheStats
 from west_housing_model.utils.logging import (
     LogContext,
     correlation_context,
@@ -42,6 +81,9 @@ from west_housing_model.utils.logging import (
     warning as log_warning,
 )
 
+if TYPE_CHECKING:
+    from west_housing_model.data.cache_backend import CacheBackend
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -63,10 +105,51 @@ class Connector(Protocol):
         """Fetch a dataset using structured query keywords."""
 
 
+# Column of a ``fetch_many`` frame holding the position of the query a row answers.
+QUERY_INDEX_COLUMN = "query_index"
+
+
+class BulkConnector(Connector, Protocol):
+    """Optional extension: resolve many queries in one vectorised call.
+
+    ``fetch_many`` returns one long, validated frame with a
+    :data:`QUERY_INDEX_COLUMN` column; queries without data have no rows.
+    ``Repository.get_many`` uses it for keys with no index row.
+    """
+
+    def fetch_many(
+        self, queries: Sequence[Mapping[str, Any]]
+    ) -> pd.DataFrame:  # pragma: no cover - structural type
+        """Fetch every query at once; rows are keyed by query position."""
+
+
 STATUS_FRESH = "fresh"
 STATUS_REFRESHED = "refreshed"
 STATUS_STALE = "stale"
 
+DEFAULT_MAX_WORKERS = 8
+
+# Keys per ``fetch_many`` call; bounds the key locks (open lock files) held at once.
+_BULK_KEYS_PER_CALL = 256
+
+# pyarrow filter syntax: a conjunction of ``(column, op, value)`` predicates or a
+# disjunction of such conjunctions, e.g. ``[("geo_id", "==", "08031")]``.
+ParquetFilters = Union[List[Tuple[str, str, Any]], List[List[Tuple[str, str, Any]]]]
+
+# Row groups small enough that a point lookup on a statewide artifact (sorted by
+# geography, as ACS/EPQS payloads are) touches one group, large enough that the
+# per-group footer overhead stays negligible.
+PARQUET_ROW_GROUP_ROWS = 8_192
+
+# Artifact formats selectable per source (registry ``cache_format``).  ``arrow``
+# stores uncompressed Arrow IPC (Feather v2) files that are memory-mapped on
+# load, so repeated reads of hot reference tables avoid decompression and share
+# pages across processes.
+FORMAT_PARQUET = "parquet"
+FORMAT_ARROW = "arrow"
+CACHE_FORMATS: Mapping[str, str] = {FORMAT_PARQUET: ".parquet", FORMAT_ARROW: ".arrow"}
+_BLOB_SUFFIXES = tuple(CACHE_FORMATS.values())
+
 
 @dataclass(frozen=True)
 class RepositoryResult:
@@ -89,6 +172,173 @@ class RepositoryResult:
         return self.status in {STATUS_FRESH, STATUS_STALE}
 
 
+@dataclass(frozen=True)
+class RepositoryBatchResult:
+    """Per-query results plus aggregate timing for ``Repository.get_many``.
+
+    ``errors`` pairs each failed query with its exception; it is only
+    populated when ``get_many`` is called with ``return_exceptions=True``, in
+    which case ``results`` holds the successful queries only.
+    """
+
+    source_id: str
+    results: tuple[RepositoryResult, ...]
+    duration_ms: int
+    status_counts: Mapping[str, int]
+    correlation_id: str
+    errors: tuple[tuple[Dict[str, Any], BaseException], ...] = ()
+
+    @property
+    def cache_hits(self) -> int:
+        return sum(1 for result in self.results if result.cache_hit)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[RepositoryResult]:
+        return iter(self.results)
+
+
+@dataclass(frozen=True)
+class _Projection:
+    """Column projection and row filters requested by a caller."""
+
+    columns: Optional[Tuple[str, ...]] = None
+    filters: Optional[ParquetFilters] = None
+
+    @classmethod
+    def of(
+        cls, columns: Optional[Sequence[str]], filters: Optional[ParquetFilters]
+    ) -> "_Projection":
+        return cls(tuple(columns) if columns is not None else None, filters or None)
+
+    @property
+    def is_full(self) -> bool:
+        return self.columns is None and self.filters is None
+
+    def apply(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Apply the projection in memory (for frames not read from Parquet)."""
+
+        if self.is_full:
+            return frame
+        if self.filters is not None:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            return _project_table(table, self.columns, self.filters).to_pandas()
+        try:
+            return frame[list(self.columns or ())].reset_index(drop=True)
+        except KeyError as exc:
+            raise CacheError(
+                "Invalid column projection or filter",
+                context={"columns": self.columns, "filters": self.filters, "error": str(exc)},
+            ) from exc
+
+
+_FULL_READ = _Projection()
+
+
+def _project_table(
+    table: pa.Table,
+    columns: Optional[Sequence[str]],
+    filters: Optional[ParquetFilters],
+) -> pa.Table:
+    try:
+        if filters:
+            table = table.filter(pq.filters_to_expression(filters))
+        if columns is not None:
+            table = table.select(list(columns))
+    except (KeyError, ValueError, pa.ArrowException) as exc:
+        raise CacheError(
+            "Invalid column projection or filter",
+            context={"columns": columns, "filters": filters, "error": str(exc)},
+        ) from exc
+    return table
+
+
+def _write_table(table: pa.Table, path: Path) -> None:
+    pq.write_table(table, path, row_group_size=PARQUET_ROW_GROUP_ROWS, write_statistics=True)
+
+
+def _read_arrow(
+    path: Path, columns: Optional[Sequence[str]], filters: Optional[ParquetFilters]
+) -> pd.DataFrame:
+    """Memory-map an Arrow IPC artifact and convert it, zero-copy where dtypes allow.
+
+    The resulting buffers keep the mapping alive, and blobs are never rewritten
+    in place, so the mapping stays valid even if GC unlinks the file.
+    """
+
+    table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+    return _project_table(table, columns, filters).to_pandas(split_blocks=True)
+
+
+def _read_table(path: Path) -> pa.Table:
+    if path.suffix == CACHE_FORMATS[FORMAT_ARROW]:
+        return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+    return pq.read_table(path, partitioning=None)
+
+
+def _read_row_range(
+    path: Path,
+    offset: int,
+    count: int,
+    columns: Optional[Sequence[str]],
+    filters: Optional[ParquetFilters],
+) -> pd.DataFrame:
+    """Read rows ``[offset, offset + count)`` touching only the row groups that hold them."""
+
+    parquet = pq.ParquetFile(path)
+    groups: list[int] = []
+    first_row = 0
+    start = 0
+    for index in range(parquet.metadata.num_row_groups):
+        rows = parquet.metadata.row_group(index).num_rows
+        if start + rows > offset and start < offset + count:
+            if not groups:
+                first_row = start
+            groups.append(index)
+        start += rows
+    if groups:
+        table = parquet.read_row_groups(groups).slice(offset - first_row, count)
+    else:
+        table = parquet.schema_arrow.empty_table()
+    return _project_table(table, columns, filters).to_pandas()
+
+
+@dataclass(frozen=True)
+class RevalidationStats:
+    """Counters for stale-while-revalidate background refreshes."""
+
+    scheduled: int
+    completed: int
+    failed: int
+    in_flight: int
+
+
+_PARTITION_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+@dataclass(frozen=True)
+class PartitionSpec:
+    """How a source is split into partitions in the consolidated dataset mode.
+
+    The partition is derived from ``column`` of the first row of each artifact,
+    truncated to ``prefix_len`` characters (e.g. ``geo_id`` with ``prefix_len=2``
+    partitions tract/county GEOIDs by state FIPS).  Each cache key is expected
+    to fall into a single partition.
+    """
+
+    column: str
+    prefix_len: Optional[int] = None
+
+    def partition_for(self, frame: pd.DataFrame) -> str:
+        if frame.empty or self.column not in frame.columns:
+            return "_unpartitioned"
+        value = str(frame[self.column].iloc[0])
+        if self.prefix_len is not None:
+            value = value[: self.prefix_len]
+        return _PARTITION_UNSAFE.sub("_", value) or "_unpartitioned"
+
+
 @dataclass(frozen=True)
 class CacheIndexRecord:
     """Metadata describing a cached artifact."""
@@ -101,6 +351,17 @@ class CacheIndexRecord:
     ttl_days: int
     rows: int
     schema_version: Optional[str]
+    schema_fingerprint: Optional[str] = None
+    content_hash: Optional[str] = None
+    last_accessed_at: Optional[datetime] = None
+    bytes: Optional[int] = None
+    row_offset: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def validators(self) -> Validators:
+        return Validators(etag=self.etag, last_modified=self.last_modified)
 
     def is_fresh(self, reference: datetime) -> bool:
         if self.ttl_days <= 0:
@@ -108,27 +369,184 @@ class CacheIndexRecord:
         expires_at = self.created_at + timedelta(days=self.ttl_days)
         return reference <= expires_at
 
+    def within_grace(self, reference: datetime, grace: timedelta) -> bool:
+        """True when expired but no more than ``grace`` past the TTL."""
+
+        if self.ttl_days <= 0:
+            return False
+        expires_at = self.created_at + timedelta(days=self.ttl_days)
+        return expires_at < reference <= expires_at + grace
+
+    @property
+    def last_used(self) -> datetime:
+        return self.last_accessed_at or self.created_at
+
+
+@dataclass(frozen=True)
+class NegativeCacheRecord:
+    """A remembered connector failure for a key that has never been cached."""
+
+    source_id: str
+    key_hash: str
+    error_class: str
+    message: str
+    created_at: datetime
+    expires_at: datetime
+
+    def is_active(self, reference: datetime) -> bool:
+        return reference < self.expires_at
+
+
+@dataclass(frozen=True)
+class CacheGcReport:
+    """Outcome of ``CacheStore.gc``; ``dry_run`` reports what would be removed."""
+
+    dry_run: bool
+    bytes_before: int
+    bytes_after: int
+    evicted: tuple[CacheIndexRecord, ...]
+    removed_files: tuple[Path, ...]
+
+    @property
+    def reclaimed_bytes(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds.
+_SQLITE_MAX_PARAMS = 900
+
+
+_LOOKUP_SQL = "SELECT * FROM cache_index WHERE source_id = ? AND key_hash = ?"
+
+_UPSERT_SQL = """
+    INSERT INTO cache_index (
+        source_id, key_hash, path, created_at, as_of, ttl_days, rows, schema_version,
+        schema_fingerprint, content_hash, last_accessed_at, bytes, row_offset, etag,
+        last_modified
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source_id, key_hash) DO UPDATE SET
+        path = excluded.path,
+        created_at = excluded.created_at,
+        as_of = excluded.as_of,
+        ttl_days = excluded.ttl_days,
+        rows = excluded.rows,
+        schema_version = excluded.schema_version,
+        schema_fingerprint = excluded.schema_fingerprint,
+        content_hash = excluded.content_hash,
+        last_accessed_at = excluded.last_accessed_at,
+        bytes = excluded.bytes,
+        row_offset = excluded.row_offset,
+        etag = excluded.etag,
+        last_modified = excluded.last_modified
+"""
+
+_RENEW_SQL = "UPDATE cache_index SET created_at = ? WHERE source_id = ? AND key_hash = ?"
+
+_TOUCH_SQL = """
+    UPDATE cache_index SET last_accessed_at = ?
+    WHERE source_id = ? AND key_hash = ?
+"""
+
+_RECORD_ACCESS_SQL = """
+    INSERT INTO cache_stats (
+        source_id, key_hash, hits, misses, load_ms, fetch_ms, last_accessed_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source_id, key_hash) DO UPDATE SET
+        hits = hits + excluded.hits,
+        misses = misses + excluded.misses,
+        load_ms = load_ms + excluded.load_ms,
+        fetch_ms = fetch_ms + excluded.fetch_ms,
+        last_accessed_at = MAX(COALESCE(last_accessed_at, ''), excluded.last_accessed_at)
+"""
+
+_TOUCH_IF_NEWER_SQL = """
+    UPDATE cache_index SET last_accessed_at = ?
+    WHERE source_id = ? AND key_hash = ?
+        AND (last_accessed_at IS NULL OR last_accessed_at < ?)
+"""
+
+_NEGATIVE_LOOKUP_SQL = "SELECT * FROM cache_negative WHERE source_id = ? AND key_hash = ?"
+
+_NEGATIVE_UPSERT_SQL = """
+    INSERT INTO cache_negative (
+        source_id, key_hash, error_class, message, created_at, expires_at
+    ) VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source_id, key_hash) DO UPDATE SET
+        error_class = excluded.error_class,
+        message = excluded.message,
+        created_at = excluded.created_at,
+        expires_at = excluded.expires_at
+"""
+
+_NEGATIVE_DELETE_SQL = "DELETE FROM cache_negative WHERE source_id = ? AND key_hash = ?"
+
+_RECORD_LATENCY_SQL = """
+    INSERT INTO cache_latency (source_id, kind, bucket_ms, count) VALUES (?, ?, ?, ?)
+    ON CONFLICT(source_id, kind, bucket_ms) DO UPDATE SET count = count + excluded.count
+"""
+
+# Columns added after the initial release; older index files are migrated in
+# place by ``CacheIndex._ensure_schema``.
+_MIGRATED_COLUMNS: Mapping[str, str] = {
+    "schema_fingerprint": "TEXT",
+    "content_hash": "TEXT",
+    "last_accessed_at": "TEXT",
+    "bytes": "INTEGER",
+    "row_offset": "INTEGER",
+    "etag": "TEXT",
+    "last_modified": "TEXT",
+}
+
+# Connection tuning: WAL lets readers (Streamlit UI) proceed while a writer
+# (CLI refresh) commits; NORMAL sync is durable across application crashes in
+# WAL mode and avoids an fsync per commit.
+_BUSY_TIMEOUT_MS = 5_000
+_CACHED_STATEMENTS = 64
+
 
 class CacheIndex:
     """SQLite-backed index for cached artifacts.
 
     The index is intentionally thin: it stores the canonical location on disk
     plus enough metadata to answer freshness questions without touching Parquet
-    payloads.  Each method opens a short-lived SQLite connection so that
+    payloads.  Each thread keeps one persistent connection in WAL mode so that
     multiple processes (e.g., CLI refresh + Streamlit UI) can share the index
-    safely.
+    without readers blocking on writers.  Statements are module constants so
+    SQLite's per-connection statement cache prepares each of them once.
     """
 
     def __init__(self, path: Path) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
         self._ensure_schema()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.path)
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        # Connections must not cross a fork; reopen in the child process.
+        if conn is not None and getattr(self._local, "pid", None) == os.getpid():
+            return conn
+        conn = sqlite3.connect(
+            self.path,
+            timeout=_BUSY_TIMEOUT_MS / 1000,
+            cached_statements=_CACHED_STATEMENTS,
+        )
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={_BUSY_TIMEOUT_MS}")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
         return conn
 
+    def close(self) -> None:
+        """Close the calling thread's connection (reopened lazily on next use)."""
+
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def _ensure_schema(self) -> None:
         with self._connect() as conn:
             conn.execute(
@@ -142,6 +560,13 @@ class CacheIndex:
                     ttl_days INTEGER NOT NULL,
                     rows INTEGER,
                     schema_version TEXT,
+                    schema_fingerprint TEXT,
+                    content_hash TEXT,
+                    last_accessed_at TEXT,
+                    bytes INTEGER,
+                    row_offset INTEGER,
+                    etag TEXT,
+                    last_modified TEXT,
                     PRIMARY KEY (source_id, key_hash)
                 )
                 """
@@ -152,15 +577,78 @@ class CacheIndex:
                 ON cache_index (source_id)
                 """
             )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_stats (
+                    source_id TEXT NOT NULL,
+                    key_hash TEXT NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    misses INTEGER NOT NULL DEFAULT 0,
+                    load_ms REAL NOT NULL DEFAULT 0,
+                    fetch_ms REAL NOT NULL DEFAULT 0,
+                    last_accessed_at TEXT,
+                    PRIMARY KEY (source_id, key_hash)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_latency (
+                    source_id TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    bucket_ms INTEGER NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (source_id, kind, bucket_ms)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_negative (
+                    source_id TEXT NOT NULL,
+                    key_hash TEXT NOT NULL,
+                    error_class TEXT NOT NULL,
+                    message TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    expires_at TEXT NOT NULL,
+                    PRIMARY KEY (source_id, key_hash)
+                )
+                """
+            )
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(cache_index)")}
+            for column, column_type in _MIGRATED_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE cache_index ADD COLUMN {column} {column_type}")
 
     def lookup(self, source_id: str, key_hash: str) -> Optional[CacheIndexRecord]:
         with self._connect() as conn:
-            row = conn.execute(
-                "SELECT * FROM cache_index WHERE source_id = ? AND key_hash = ?",
-                (source_id, key_hash),
-            ).fetchone()
+            row = conn.execute(_LOOKUP_SQL, (source_id, key_hash)).fetchone()
         if row is None:
             return None
+        return self._to_record(row)
+
+    def lookup_many(self, source_id: str, key_hashes: Iterable[str]) -> Dict[str, CacheIndexRecord]:
+        """Resolve many key hashes for one source, keyed by hash (misses omitted)."""
+
+        hashes = list(dict.fromkeys(key_hashes))
+        records: Dict[str, CacheIndexRecord] = {}
+        if not hashes:
+            return records
+        with self._connect() as conn:
+            for start in range(0, len(hashes), _SQLITE_MAX_PARAMS):
+                chunk = hashes[start : start + _SQLITE_MAX_PARAMS]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = conn.execute(
+                    "SELECT * FROM cache_index "
+                    f"WHERE source_id = ? AND key_hash IN ({placeholders})",
+                    (source_id, *chunk),
+                ).fetchall()
+                for row in rows:
+                    records[row["key_hash"]] = self._to_record(row)
+        return records
+
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> CacheIndexRecord:
         return CacheIndexRecord(
             source_id=row["source_id"],
             key_hash=row["key_hash"],
@@ -170,35 +658,228 @@ class CacheIndex:
             ttl_days=int(row["ttl_days"]),
             rows=int(row["rows"]) if row["rows"] is not None else 0,
             schema_version=row["schema_version"],
+            schema_fingerprint=row["schema_fingerprint"],
+            content_hash=row["content_hash"],
+            last_accessed_at=(
+                datetime.fromisoformat(row["last_accessed_at"])
+                if row["last_accessed_at"] is not None
+                else None
+            ),
+            bytes=int(row["bytes"]) if row["bytes"] is not None else None,
+            row_offset=int(row["row_offset"]) if row["row_offset"] is not None else None,
+            etag=row["etag"],
+            last_modified=row["last_modified"],
+        )
+
+    @staticmethod
+    def _to_params(record: CacheIndexRecord) -> tuple[Any, ...]:
+        return (
+            record.source_id,
+            record.key_hash,
+            str(record.relative_path),
+            record.created_at.isoformat(),
+            record.as_of,
+            record.ttl_days,
+            record.rows,
+            record.schema_version,
+            record.schema_fingerprint,
+            record.content_hash,
+            record.last_accessed_at.isoformat() if record.last_accessed_at else None,
+            record.bytes,
+            record.row_offset,
+            record.etag,
+            record.last_modified,
         )
 
     def upsert(self, record: CacheIndexRecord) -> None:
+        with self._connect() as conn:
+            conn.execute(_UPSERT_SQL, self._to_params(record))
+
+    def bulk_upsert(self, records: Iterable[CacheIndexRecord]) -> int:
+        """Upsert many records in a single transaction; returns the count written."""
+
+        params = [self._to_params(record) for record in records]
+        if not params:
+            return 0
+        with self._connect() as conn:
+            conn.executemany(_UPSERT_SQL, params)
+        return len(params)
+
+    def renew(
+        self, source_id: str, key_hash: str, created_at: datetime
+    ) -> Optional[CacheIndexRecord]:
+        """Restart a row's TTL in place (upstream confirmed the artifact is current).
+
+        Only ``created_at`` changes, so a concurrent partition compaction that
+        re-points the row is never overwritten.
+        """
+
+        with self._connect() as conn:
+            conn.execute(_RENEW_SQL, (created_at.isoformat(), source_id, key_hash))
+        return self.lookup(source_id, key_hash)
+
+    def touch(self, source_id: str, key_hash: str, accessed_at: datetime) -> None:
+        """Record a cache hit so ``CacheStore.gc`` can evict least-recently-used keys."""
+
+        with self._connect() as conn:
+            conn.execute(_TOUCH_SQL, (accessed_at.isoformat(), source_id, key_hash))
+
+    def record_access(self, batch: AccessBatch) -> None:
+        """Fold a batch of access counters into ``cache_stats`` in one transaction.
+
+        Also advances ``cache_index.last_accessed_at`` so GC sees recent reads.
+        """
+
+        stats_params = []
+        touch_params = []
+        for (source_id, key_hash), access in batch.keys.items():
+            accessed_at = (
+                access.last_accessed_at.isoformat() if access.last_accessed_at else None
+            )
+            stats_params.append(
+                (
+                    source_id,
+                    key_hash,
+                    access.hits,
+                    access.misses,
+                    access.load_ms,
+                    access.fetch_ms,
+                    accessed_at,
+                )
+            )
+            if accessed_at is not None:
+                touch_params.append((accessed_at, source_id, key_hash, accessed_at))
+        latency_params = [
+            (source_id, kind, bucket_ms, count)
+            for (source_id, kind, bucket_ms), count in batch.latency.items()
+        ]
+        with self._connect() as conn:
+            conn.executemany(_RECORD_ACCESS_SQL, stats_params)
+            conn.executemany(_TOUCH_IF_NEWER_SQL, touch_params)
+            conn.executemany(_RECORD_LATENCY_SQL, latency_params)
+
+    def source_stats(self) -> list[SourceCacheStats]:
+        """Per-source keys, bytes, hit ratio inputs and load-latency percentiles."""
+
+        with self._connect() as conn:
+            keys = dict(
+                conn.execute(
+                    "SELECT source_id, COUNT(*) FROM cache_index GROUP BY source_id"
+                ).fetchall()
+            )
+            # Keys sharing a content-addressed blob count its bytes once.
+            sizes = dict(
+                conn.execute(
+                    "SELECT source_id, COALESCE(SUM(bytes), 0) FROM "
+                    "(SELECT DISTINCT source_id, path, bytes FROM cache_index) "
+                    "GROUP BY source_id"
+                ).fetchall()
+            )
+            counters = {
+                row["source_id"]: row
+                for row in conn.execute(
+                    "SELECT source_id, SUM(hits) AS hits, SUM(misses) AS misses, "
+                    "SUM(load_ms) AS load_ms, SUM(fetch_ms) AS fetch_ms "
+                    "FROM cache_stats GROUP BY source_id"
+                )
+            }
+            histograms: Dict[str, Dict[int, int]] = {}
+            for row in conn.execute(
+                "SELECT source_id, bucket_ms, count FROM cache_latency WHERE kind = ?",
+                (LATENCY_LOAD,),
+            ):
+                histograms.setdefault(row["source_id"], {})[row["bucket_ms"]] = row["count"]
+
+        summaries = []
+        for source_id in sorted({*keys, *counters}):
+            counter = counters.get(source_id)
+            histogram = histograms.get(source_id, {})
+            summaries.append(
+                SourceCacheStats(
+                    source_id=source_id,
+                    keys=int(keys.get(source_id, 0)),
+                    bytes=int(sizes.get(source_id, 0)),
+                    hits=int(counter["hits"]) if counter else 0,
+                    misses=int(counter["misses"]) if counter else 0,
+                    load_ms_total=float(counter["load_ms"]) if counter else 0.0,
+                    fetch_ms_total=float(counter["fetch_ms"]) if counter else 0.0,
+                    p50_load_ms=histogram_percentile(histogram, 0.5),
+                    p95_load_ms=histogram_percentile(histogram, 0.95),
+                )
+            )
+        return summaries
+
+    def records(self, source_id: Optional[str] = None) -> list[CacheIndexRecord]:
+        """Every index row, optionally restricted to one source."""
+
+        with self._connect() as conn:
+            if source_id is None:
+                rows = conn.execute("SELECT * FROM cache_index").fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM cache_index WHERE source_id = ?", (source_id,)
+                ).fetchall()
+        return [self._to_record(row) for row in rows]
+
+    def records_under(self, source_id: str, directory: Path) -> list[CacheIndexRecord]:
+        """Rows whose artifact lives directly inside ``directory`` (relative to the root)."""
+
+        prefix = f"{directory.as_posix()}/"
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM cache_index WHERE source_id = ? AND substr(path, 1, ?) = ?",
+                (source_id, len(prefix), prefix),
+            ).fetchall()
+        return [self._to_record(row) for row in rows]
+
+    def delete(self, source_id: str, key_hash: str) -> None:
         with self._connect() as conn:
             conn.execute(
-                """
-                INSERT INTO cache_index (
-                    source_id, key_hash, path, created_at, as_of, ttl_days, rows, schema_version
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(source_id, key_hash) DO UPDATE SET
-                    path = excluded.path,
-                    created_at = excluded.created_at,
-                    as_of = excluded.as_of,
-                    ttl_days = excluded.ttl_days,
-                    rows = excluded.rows,
-                    schema_version = excluded.schema_version
-                """,
+                "DELETE FROM cache_index WHERE source_id = ? AND key_hash = ?",
+                (source_id, key_hash),
+            )
+
+    def lookup_negative(self, source_id: str, key_hash: str) -> Optional[NegativeCacheRecord]:
+        with self._connect() as conn:
+            row = conn.execute(_NEGATIVE_LOOKUP_SQL, (source_id, key_hash)).fetchone()
+        if row is None:
+            return None
+        return NegativeCacheRecord(
+            source_id=row["source_id"],
+            key_hash=row["key_hash"],
+            error_class=row["error_class"],
+            message=row["message"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            expires_at=datetime.fromisoformat(row["expires_at"]),
+        )
+
+    def upsert_negative(self, record: NegativeCacheRecord) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                _NEGATIVE_UPSERT_SQL,
                 (
                     record.source_id,
                     record.key_hash,
-                    str(record.relative_path),
+                    record.error_class,
+                    record.message,
                     record.created_at.isoformat(),
-                    record.as_of,
-                    record.ttl_days,
-                    record.rows,
-                    record.schema_version,
+                    record.expires_at.isoformat(),
                 ),
             )
 
+    def delete_negative(self, source_id: str, key_hash: str) -> None:
+        with self._connect() as conn:
+            conn.execute(_NEGATIVE_DELETE_SQL, (source_id, key_hash))
+
+    def purge_negative(self, reference: datetime) -> int:
+        """Drop negative entries that expired before ``reference``; returns the count."""
+
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM cache_negative WHERE expires_at <= ?", (reference.isoformat(),)
+            )
+        return int(cursor.rowcount)
+
 
 def _normalize_value(value: Any) -> Any:
     if isinstance(value, datetime):
@@ -252,6 +933,30 @@ def _extract_as_of(frame: pd.DataFrame) -> Optional[str]:
     return None
 
 
+def _validated_fingerprint(source_id: str, frame: pd.DataFrame) -> Optional[str]:
+    """Schema fingerprint for frames stamped by ``validate_connector``.
+
+    Frames that did not pass connector validation (e.g. test doubles calling
+    the repository directly) carry no stamp, so their cache hits are always
+    re-validated.
+    """
+
+    stamped = frame.attrs.get(SCHEMA_FINGERPRINT_ATTR)
+    if stamped is not None and stamped == connector_schema_fingerprint(source_id):
+        return str(stamped)
+    return None
+
+
+def _file_sha256(path: Path) -> str:
+    with open(path, "rb") as handle:
+        return file_digest(handle, "sha256").hexdigest()
+
+
+def _connector_ttl_days(connector: Connector) -> int:
+    ttl_seconds = int(getattr(connector, "ttl_seconds", 86_400))
+    return max(1, math.ceil(ttl_seconds / 86_400)) if ttl_seconds > 0 else 0
+
+
 def _connector_schema_version(connector: Connector) -> Optional[str]:
     return getattr(connector, "schema_version", None)
 
@@ -261,24 +966,296 @@ def _elapsed_ms(start: datetime, end: datetime) -> int:
 
 
 @contextmanager
-def _source_lock(lock_path: Path) -> Iterator[None]:
-    """Context manager that serialises writes per ``source_id``.
-
-    Without this lock, two workers refreshing the same connector could race and
-    overwrite each other's artifacts.  A simple filesystem lock keeps the
-    implementation portable and works even when the repository is used from the
-    CLI.
+def _file_lock(lock_path: Path, *, blocking: bool = True) -> Iterator[bool]:
+    """Exclusive ``fcntl`` lock on ``lock_path`` (created on demand).
+
+    Used for per-key locks so that two workers refreshing the same cache key
+    cannot race, while different keys of the same source write in parallel.
+    A simple filesystem lock keeps the implementation portable and works even
+    when the repository is used from the CLI.  Yields whether the lock is
+    held, which is only ``False`` when ``blocking=False`` and another holder
+    has it.
+
+    ``CacheStore.gc`` unlinks idle lock files while holding their lock, so
+    after acquiring it we re-check that the locked inode is still the one at
+    ``lock_path`` and retry on a fresh file otherwise.
     """
 
     lock_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(lock_path, "w") as lock_file:
-        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+    flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+    while True:
+        lock_file = open(lock_path, "a")
+        try:
+            fcntl.flock(lock_file.fileno(), flags)
+            if _is_current_inode(lock_file.fileno(), lock_path):
+                break
+        except BlockingIOError:
+            lock_file.close()
+            yield False
+            return
+        except BaseException:
+            lock_file.close()
+            raise
+        lock_file.close()
+    try:
+        yield True
+    finally:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        lock_file.close()
+
+
+def _is_current_inode(fd: int, path: Path) -> bool:
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        return False
+    opened = os.fstat(fd)
+    return (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino)
+
+
+def _root_cause(exc: BaseException) -> BaseException:
+    """The innermost exception of an explicit ``raise ... from`` chain."""
+
+    seen = {id(exc)}
+    while exc.__cause__ is not None and id(exc.__cause__) not in seen:
+        exc = exc.__cause__
+        seen.add(id(exc))
+    return exc
+
+
+def _failure_status(exc: BaseException) -> Optional[int]:
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None and isinstance(exc, ConnectorError):
+        status = (exc.context or {}).get("status")
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_transient_failure(exc: BaseException) -> bool:
+    """True when any link in the cause chain is a network error or an HTTP 429/5xx.
+
+    ``requests`` exceptions subclass :class:`OSError`, as do socket timeouts
+    and connection resets; an HTTP error with a 4xx status (other than 429)
+    is an answer about the data and is not transient.
+    """
+
+    current: Optional[BaseException] = exc
+    seen: set[int] = set()
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        status = _failure_status(current)
+        if status is not None:
+            if status == 429 or status >= 500:
+                return True
+        elif isinstance(current, OSError):
+            return True
+        current = current.__cause__
+    return False
+
+
+def _temp_sibling(directory: Path, name: str) -> Path:
+    fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    os.close(fd)
+    return Path(tmp_name)
+
+
+def _fsync_file(path: Path) -> None:
+    with open(path, "rb") as handle:
+        os.fsync(handle.fileno())
+
+
+def _fsync_dir(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _atomic_write(target: Path, writer: Callable[[Path], Any]) -> None:
+    """Call ``writer`` on a temp file next to ``target`` then rename it into place."""
+
+    tmp_path = _temp_sibling(target.parent, target.name)
+    try:
+        writer(tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_blob(directory: Path, suffix: str, writer: Callable[[Path], Any]) -> tuple[Path, str]:
+    """Durably write a content-addressed blob and return ``(path, sha256)``.
+
+    The payload is written to a temp file, fsynced, hashed and renamed to
+    ``{sha256}{suffix}``.  If a blob with the same digest already exists the
+    temp file is discarded, so identical payloads share one file, and the
+    existing blob's mtime is refreshed so GC treats it as recently written.
+    """
+
+    directory.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temp_sibling(directory, "blob")
+    try:
+        writer(tmp_path)
+        _fsync_file(tmp_path)
+        digest = _file_sha256(tmp_path)
+        target = directory / f"{digest}{suffix}"
+        try:
+            # Refresh the mtime so GC's grace period covers the blob until our row commits.
+            os.utime(target)
+        except FileNotFoundError:
+            os.replace(tmp_path, target)
+            _fsync_dir(directory)
+        else:
+            tmp_path.unlink()
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return target, digest
+
+
+class _KeyLockTable:
+    """Process-local, reference-counted locks keyed by lock-file path.
+
+    Threads waiting on the same key block on a shared ``threading.Lock`` before
+    touching the filesystem lock, so only one thread per process holds the
+    ``fcntl`` lock at a time and entries are dropped once nobody waits.
+    """
+
+    def __init__(self) -> None:
+        self._guard = threading.Lock()
+        self._locks: Dict[str, tuple[threading.Lock, int]] = {}
+
+    @contextmanager
+    def hold(self, key: str, *, blocking: bool = True) -> Iterator[bool]:
+        with self._guard:
+            lock, waiters = self._locks.get(key, (threading.Lock(), 0))
+            self._locks[key] = (lock, waiters + 1)
+        try:
+            acquired = lock.acquire(blocking=blocking)
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    lock.release()
+        finally:
+            with self._guard:
+                lock, waiters = self._locks[key]
+                if waiters <= 1:
+                    del self._locks[key]
+                else:
+                    self._locks[key] = (lock, waiters - 1)
+
+
+_KEY_LOCKS = _KeyLockTable()
+
+class _IndexBatch:
+    """Group commit for the index rows of one ``get_many``'s fetch workers.
+
+    A worker calls :meth:`commit` while it still holds the key's single-flight
+    lock.  The first worker to arrive commits every queued row in one
+    ``CacheIndex.bulk_upsert`` and rows queued meanwhile join the next group,
+    so concurrent writes share transactions.  ``commit`` returns only once its
+    row is committed: a caller that waited on the key lock always finds it.
+    """
+
+    def __init__(self, index: CacheIndex) -> None:
+        self._index = index
+        self._cond = threading.Condition()
+        self._pending: list[tuple[int, CacheIndexRecord]] = []
+        self._queued = 0
+        self._committed = 0
+        self._committing = False
+        self._errors: Dict[int, BaseException] = {}
+
+    def commit(self, record: CacheIndexRecord) -> None:
+        with self._cond:
+            self._queued += 1
+            ticket = self._queued
+            self._pending.append((ticket, record))
+            while self._committed < ticket:
+                if self._committing:
+                    self._cond.wait()
+                    continue
+                self._committing = True
+                group, self._pending = self._pending, []
+                error: Optional[BaseException] = None
+                self._cond.release()
+                try:
+                    self._index.bulk_upsert([queued for _, queued in group])
+                except BaseException as exc:
+                    error = exc
+                finally:
+                    self._cond.acquire()
+                    self._committing = False
+                    self._committed = group[-1][0]
+                    if error is not None:
+                        self._errors.update((queued, error) for queued, _ in group)
+                    self._cond.notify_all()
+            failure = self._errors.pop(ticket, None)
+        if failure is not None:
+            raise failure
+
+
+# Temp files and unreferenced blobs younger than this may belong to a write in
+# progress (blob renamed, index row not yet committed), so GC leaves them alone.
+_ORPHAN_GRACE = timedelta(hours=1)
+
+
+def _preview_blobs(preview: Path) -> list[Path]:
+    """Blob paths a JSON preview sidecar may belong to."""
+
+    return [preview.with_suffix(suffix) for suffix in _BLOB_SUFFIXES]
+
+
+def _modified_since(path: Path, cutoff: float) -> bool:
+    try:
+        return path.stat().st_mtime >= cutoff
+    except FileNotFoundError:
+        return False
+
+
+def _unlink_unheld_lock(lock_path: Path) -> bool:
+    """Remove ``lock_path`` if nobody holds its ``fcntl`` lock; True when removed.
+
+    The unlink happens while we hold the lock, and :func:`_file_lock` re-checks
+    the inode after locking, so a caller that opened the old file in the
+    meantime retries on a new one instead of locking an unlinked inode.
+    """
+
+    try:
+        lock_file = open(lock_path, "r")
+    except FileNotFoundError:
+        return False
+    with lock_file:
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
         try:
-            yield
+            if not _is_current_inode(lock_file.fileno(), lock_path):
+                return False
+            lock_path.unlink()
+            return True
         finally:
             fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
 
+def _flush_access_batch(index: CacheIndex, batch: AccessBatch) -> None:
+    """Persist access counters; stats are best-effort and never fail a read."""
+
+    try:
+        index.record_access(batch)
+    except sqlite3.Error as exc:
+        context = LogContext(
+            event="repository.access-stats", module="data.repository", action="flush"
+        )
+        log_warning(context, "access-stats.flush-failed", status="error", error=str(exc))
+
+
 def _record_failure(
     source_id: str,
     message: str,
@@ -286,47 +1263,300 @@ def _record_failure(
     correlation_id: str,
     details: Optional[Mapping[str, Any]] = None,
 ) -> None:
-    failure_dir = failure_capture_path(source_id)
-    timestamp = _utcnow().strftime("%Y%m%dT%H%M%S%f")
-    payload: Dict[str, Any] = {
-        "timestamp": timestamp,
-        "source_id": source_id,
-        "correlation_id": correlation_id,
-        "message": message,
-    }
-    if details:
-        payload.update(details)
-    log_path = failure_dir / f"{timestamp}.log"
-    log_path.write_text(json.dumps(payload, default=str, indent=2))
+    record_failure(
+        source_id,
+        "repository-failure",
+        message,
+        correlation_id=correlation_id,
+        details=details,
+    )
 
 
 @dataclass
 class CacheStore:
-    """Manages artifact storage and lookup."""
+    """Manages artifact storage and lookup.
+
+    Sources listed in ``partitions`` use the consolidated dataset mode: instead
+    of one blob per cache key, each write appends a Parquet part file under
+    ``{source_id}/dataset/part={value}/`` and index rows point at a row range
+    (``row_offset`` + ``rows``) inside a part file.  GC compacts each
+    partition's part files into one.
+
+    ``remote`` is an optional shared L2 (see ``data.cache_backend``): local
+    misses read through to it and newly written blobs are published to it.
+    Partitioned sources stay local, since their files are shared across keys.
+    """
 
     root: Path
+    partitions: Mapping[str, PartitionSpec] = field(default_factory=dict)
+    formats: Mapping[str, str] = field(default_factory=dict)
+    remote: Optional["CacheBackend"] = None
     index: CacheIndex = field(init=False)
 
     def __post_init__(self) -> None:
+        unknown = {fmt for fmt in self.formats.values() if fmt not in CACHE_FORMATS}
+        if unknown:
+            raise CacheError(
+                "Unknown cache format",
+                context={"formats": sorted(unknown), "supported": sorted(CACHE_FORMATS)},
+            )
         self.root.mkdir(parents=True, exist_ok=True)
         self.index = CacheIndex(self.root / "cache_index.sqlite")
 
-    def artifact_path(self, source_id: str, key_hash: str) -> Path:
-        return self.root / source_id / f"{key_hash}.parquet"
+    def format_for(self, source_id: str) -> str:
+        return self.formats.get(source_id, FORMAT_PARQUET)
 
-    def lock_path(self, source_id: str) -> Path:
-        return self.root / source_id / ".lock"
+    def blob_path(self, source_id: str, content_hash: str) -> Path:
+        """Content-addressed artifact location shared by every key with that payload."""
 
-    def load(self, record: CacheIndexRecord) -> pd.DataFrame:
-        artifact = self.root / record.relative_path
-        if not artifact.exists():
-            raise CacheError(
-                "Cached artifact missing",
-                context={"source_id": record.source_id, "path": str(artifact)},
-            )
-        return pd.read_parquet(artifact)
+        suffix = CACHE_FORMATS[self.format_for(source_id)]
+        return self.root / source_id / f"{content_hash}{suffix}"
 
-    def write(
+    def key_lock_path(self, source_id: str, key_hash: str) -> Path:
+        return self.root / source_id / ".locks" / f"{key_hash}.lock"
+
+    def partition_dir(self, source_id: str, partition: str) -> Path:
+        return self.root / source_id / "dataset" / f"part={partition}"
+
+    def partition_lock_path(self, source_id: str, partition: str) -> Path:
+        return self.root / source_id / ".locks" / f"part={partition}.lock"
+
+    @contextmanager
+    def key_lock(self, source_id: str, key_hash: str, *, blocking: bool = True) -> Iterator[bool]:
+        """Exclusive per-key lock held across threads and processes.
+
+        Yields whether the lock is held; with ``blocking=False`` it is not
+        when another thread or process holds the key.
+        """
+
+        lock_path = self.key_lock_path(source_id, key_hash)
+        with _KEY_LOCKS.hold(str(lock_path), blocking=blocking) as held:
+            if not held:
+                yield False
+                return
+            with _file_lock(lock_path, blocking=blocking) as locked:
+                yield locked
+
+    def _managed_files(self) -> Dict[Path, os.stat_result]:
+        """Files the store owns: blobs, previews, temp files and key locks.
+
+        Anything else under the root (the SQLite index, failure logs when the
+        failure cache lives inside the cache root) is never touched by GC.
+        """
+
+        files: Dict[Path, os.stat_result] = {}
+        for source_dir in self.root.iterdir():
+            if not source_dir.is_dir():
+                continue
+            candidates = [
+                *source_dir.glob("*.parquet"),
+                *source_dir.glob("*.arrow"),
+                *source_dir.glob("*.json"),
+                *source_dir.glob(".*.tmp"),
+                *source_dir.glob("dataset/*/*.parquet"),
+                *source_dir.glob("dataset/*/.*.tmp"),
+                *source_dir.glob(".locks/*.lock"),
+            ]
+            for path in candidates:
+                try:
+                    files[path] = path.stat()
+                except FileNotFoundError:
+                    continue
+        return files
+
+    def gc(
+        self,
+        *,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+        dry_run: bool = False,
+        now: Optional[datetime] = None,
+    ) -> CacheGcReport:
+        """Evict cache entries and reclaim orphaned files.
+
+        Keys not used within ``max_age`` are evicted first.  If the store is
+        still larger than ``max_bytes``, TTL-expired keys and then the least
+        recently used ones are evicted until it fits.  A blob is deleted once no
+        index row references it and it is older than the grace period (a
+        write that dedupes onto a blob refreshes its mtime before committing
+        its row).  Files the index does not know about (legacy
+        artifacts, previews without a blob, abandoned temp files, unheld key
+        locks) are removed once older than a short grace period.  Each eviction
+        re-checks the row under the key's lock and keeps it if it was rewritten
+        concurrently.  Expired negative-cache entries are purged as well.
+        Partitioned sources are compacted first (see :meth:`compact_partitions`)
+        unless ``dry_run`` is set.
+        """
+
+        now = now or _utcnow()
+        if not dry_run:
+            self.compact_partitions()
+        files = self._managed_files()
+        bytes_before = sum(stat.st_size for stat in files.values())
+        grace_cutoff = (now - _ORPHAN_GRACE).timestamp()
+
+        records = self.index.records()
+        references: Dict[Path, int] = {}
+        for record in records:
+            blob = self.root / record.relative_path
+            references[blob] = references.get(blob, 0) + 1
+
+        evicted: list[CacheIndexRecord] = []
+        kept: list[CacheIndexRecord] = []
+        for record in records:
+            if max_age is not None and now - record.last_used > max_age:
+                evicted.append(record)
+            else:
+                kept.append(record)
+        for record in evicted:
+            references[self.root / record.relative_path] -= 1
+
+        live_keys = {(record.source_id, record.key_hash) for record in kept}
+        freed_blobs = {blob for blob, count in references.items() if count <= 0}
+        removable: set[Path] = set()
+        for path, stat in files.items():
+            if path.suffix == ".lock":
+                if (path.parent.parent.name, path.stem) in live_keys:
+                    continue
+            elif path.suffix in _BLOB_SUFFIXES:
+                if references.get(path, 0) > 0:
+                    continue
+                if path in freed_blobs:
+                    if stat.st_mtime < grace_cutoff:
+                        removable.add(path)
+                    continue
+            elif path.suffix == ".json":
+                blobs = _preview_blobs(path)
+                if any(references.get(blob, 0) > 0 for blob in blobs):
+                    continue
+                if any(blob in freed_blobs for blob in blobs):
+                    if not any(_modified_since(blob, grace_cutoff) for blob in blobs):
+                        removable.add(path)
+                    continue
+            if stat.st_mtime < grace_cutoff:
+                removable.add(path)
+
+        current = bytes_before - sum(files[path].st_size for path in removable)
+        if max_bytes is not None and current > max_bytes:
+            # TTL-expired keys go first, then least recently used.
+            for record in sorted(kept, key=lambda r: (r.is_fresh(now), r.last_used)):
+                if current <= max_bytes:
+                    break
+                blob = self.root / record.relative_path
+                if _modified_since(blob, grace_cutoff):
+                    # A write may be deduping onto this blob; keep it for now.
+                    continue
+                evicted.append(record)
+                references[blob] -= 1
+                if references[blob] > 0:
+                    continue
+                for path in (blob, blob.with_suffix(".json")):
+                    if path in files and path not in removable:
+                        removable.add(path)
+                        current -= files[path].st_size
+
+        if not dry_run:
+            for record in evicted:
+                with self.key_lock(record.source_id, record.key_hash):
+                    latest = self.index.lookup(record.source_id, record.key_hash)
+                    if latest is not None and (
+                        latest.relative_path == record.relative_path
+                        and latest.created_at == record.created_at
+                    ):
+                        self.index.delete(record.source_id, record.key_hash)
+            self.index.purge_negative(now)
+            # Re-read the index so blobs re-referenced by concurrent writes survive.
+            referenced = {self.root / record.relative_path for record in self.index.records()}
+            removed: list[Path] = []
+            for path in sorted(removable):
+                blobs = _preview_blobs(path) if path.suffix == ".json" else [path]
+                if any(blob in referenced for blob in blobs):
+                    continue
+                if path.suffix in (*_BLOB_SUFFIXES, ".json") and any(
+                    _modified_since(blob, grace_cutoff) for blob in blobs
+                ):
+                    # Deduped onto since planning: its row may not be committed yet.
+                    continue
+                if path.suffix == ".lock":
+                    if _unlink_unheld_lock(path):
+                        removed.append(path)
+                    continue
+                path.unlink(missing_ok=True)
+                removed.append(path)
+            bytes_after = bytes_before - sum(files[path].st_size for path in removed)
+        else:
+            removed = sorted(removable)
+            bytes_after = bytes_before - sum(files[path].st_size for path in removed)
+
+        return CacheGcReport(
+            dry_run=dry_run,
+            bytes_before=bytes_before,
+            bytes_after=bytes_after,
+            evicted=tuple(evicted),
+            removed_files=tuple(removed),
+        )
+
+    def load(
+        self,
+        record: CacheIndexRecord,
+        *,
+        verify: bool = False,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[ParquetFilters] = None,
+    ) -> pd.DataFrame:
+        """Read an artifact; ``verify`` checks its bytes against ``content_hash``.
+
+        ``columns`` and ``filters`` are pushed down to pyarrow, so only the
+        requested column chunks of row groups whose statistics can match the
+        filters are read.
+        """
+
+        artifact = self.root / record.relative_path
+        if not artifact.exists():
+            if record.row_offset is not None:
+                # Compaction merged the part file concurrently; follow the index.
+                latest = self.index.lookup(record.source_id, record.key_hash)
+                if latest is not None and latest.relative_path != record.relative_path:
+                    return self.load(latest, verify=verify, columns=columns, filters=filters)
+            raise CacheError(
+                "Cached artifact missing",
+                context={"source_id": record.source_id, "path": str(artifact)},
+            )
+        if verify and record.content_hash is not None:
+            actual = _file_sha256(artifact)
+            if actual != record.content_hash:
+                raise CacheError(
+                    "Cached artifact checksum mismatch",
+                    context={
+                        "source_id": record.source_id,
+                        "path": str(artifact),
+                        "expected": record.content_hash,
+                        "actual": actual,
+                    },
+                )
+        if record.row_offset is not None:
+            return _read_row_range(artifact, record.row_offset, record.rows, columns, filters)
+        if artifact.suffix == CACHE_FORMATS[FORMAT_ARROW]:
+            return _read_arrow(artifact, columns, filters)
+        try:
+            return pd.read_parquet(
+                artifact,
+                columns=list(columns) if columns is not None else None,
+                filters=filters or None,
+            )
+        except (KeyError, ValueError, pa.ArrowException) as exc:
+            raise CacheError(
+                "Invalid column projection or filter",
+                context={
+                    "source_id": record.source_id,
+                    "path": str(artifact),
+                    "columns": columns,
+                    "filters": filters,
+                    "error": str(exc),
+                },
+            ) from exc
+
+    def write(
         self,
         source_id: str,
         key_hash: str,
@@ -335,16 +1565,63 @@ class CacheStore:
         schema_version: Optional[str],
         *,
         created_at: Optional[datetime] = None,
+        update_index: bool = True,
+        validators: Optional[Validators] = None,
     ) -> CacheIndexRecord:
-        artifact = self.artifact_path(source_id, key_hash)
-        artifact.parent.mkdir(parents=True, exist_ok=True)
-        frame.to_parquet(artifact, index=False)
+        """Persist ``frame`` and return its index record.
+
+        Artifacts are content-addressed: the Parquet bytes are written to a
+        temp file, fsynced and renamed to ``{sha256}.parquet`` under the source
+        directory, and the index maps ``key_hash`` onto that blob.  A crash
+        mid-write never leaves a truncated file behind an index row, and keys
+        returning identical payloads share one file.  Pass
+        ``update_index=False`` to defer the index write, e.g. so a batch can
+        commit every record in one ``CacheIndex.bulk_upsert``.  Partitioned
+        sources always commit the index, under the partition lock.
+        ``validators`` (upstream ETag/Last-Modified) are stored on the row for
+        conditional revalidation.
+        """
+
+        validators = validators or Validators()
+        if source_id in self.partitions:
+            (record,) = self._append_partition(
+                source_id,
+                self.partitions[source_id].partition_for(frame),
+                {key_hash: frame},
+                ttl_days,
+                schema_version,
+                created_at or _utcnow(),
+                {key_hash: validators},
+            )
+            return record
+        if self.format_for(source_id) == FORMAT_ARROW:
+            artifact, content_hash = _write_blob(
+                self.root / source_id,
+                CACHE_FORMATS[FORMAT_ARROW],
+                # Uncompressed so the file can be memory-mapped without decoding.
+                lambda tmp: feather.write_feather(frame, tmp, compression="uncompressed"),
+            )
+        else:
+            artifact, content_hash = _write_blob(
+                self.root / source_id,
+                CACHE_FORMATS[FORMAT_PARQUET],
+                lambda tmp: frame.to_parquet(
+                    tmp,
+                    index=False,
+                    row_group_size=PARQUET_ROW_GROUP_ROWS,
+                    write_statistics=True,
+                ),
+            )
         data_payload_path = artifact.with_suffix(".json")
-        try:
-            frame.head(20).to_json(data_payload_path, orient="records", date_format="iso")
-        except Exception:
-            if data_payload_path.exists():
-                data_payload_path.unlink(missing_ok=True)
+        if not data_payload_path.exists():
+            try:
+                _atomic_write(
+                    data_payload_path,
+                    lambda tmp: frame.head(20).to_json(tmp, orient="records", date_format="iso"),
+                )
+            except Exception:
+                if data_payload_path.exists():
+                    data_payload_path.unlink(missing_ok=True)
         record = CacheIndexRecord(
             source_id=source_id,
             key_hash=key_hash,
@@ -354,10 +1631,337 @@ class CacheStore:
             ttl_days=ttl_days,
             rows=_deterministic_rows(frame),
             schema_version=schema_version,
+            schema_fingerprint=_validated_fingerprint(source_id, frame),
+            content_hash=content_hash,
+            bytes=artifact.stat().st_size,
+            etag=validators.etag,
+            last_modified=validators.last_modified,
+        )
+        if update_index:
+            self.index.upsert(record)
+        self.publish(record)
+        return record
+
+    def write_many(
+        self,
+        source_id: str,
+        frames: Mapping[str, pd.DataFrame],
+        ttl_days: int,
+        schema_version: Optional[str],
+        *,
+        created_at: Optional[datetime] = None,
+    ) -> list[CacheIndexRecord]:
+        """Persist one frame per key hash and commit their index rows together.
+
+        Blob sources write each artifact as :meth:`write` does and commit the
+        rows in one ``CacheIndex.bulk_upsert``.  Partitioned sources group the
+        frames by partition and append each group as a single part file, so
+        warming N keys into one partition writes one file instead of N.
+        """
+
+        created_at = created_at or _utcnow()
+        if source_id in self.partitions:
+            spec = self.partitions[source_id]
+            grouped: Dict[str, Dict[str, pd.DataFrame]] = {}
+            for key_hash, frame in frames.items():
+                grouped.setdefault(spec.partition_for(frame), {})[key_hash] = frame
+            records: list[CacheIndexRecord] = []
+            for partition, members in grouped.items():
+                records.extend(
+                    self._append_partition(
+                        source_id, partition, members, ttl_days, schema_version, created_at, {}
+                    )
+                )
+            return records
+        records = [
+            self.write(
+                source_id=source_id,
+                key_hash=key_hash,
+                frame=frame,
+                ttl_days=ttl_days,
+                schema_version=schema_version,
+                created_at=created_at,
+                update_index=False,
+            )
+            for key_hash, frame in frames.items()
+        ]
+        self.index.bulk_upsert(records)
+        return records
+
+    def pull_remote(
+        self,
+        source_id: str,
+        key_hash: str,
+        local: Optional[CacheIndexRecord] = None,
+    ) -> Optional[CacheIndexRecord]:
+        """Copy a key's row and blob from the shared L2 into the local cache.
+
+        Returns the new local record, or ``None`` when there is no remote,
+        the remote has nothing newer than ``local``, or the copy fails its
+        checksum.  The blob lands in a temp sibling and is renamed into place,
+        so concurrent readers never see a partial file.
+        """
+
+        if self.remote is None or source_id in self.partitions:
+            return None
+        context = LogContext(
+            event="repository.shared-cache",
+            module="data.repository",
+            action="pull",
+            source_id=source_id,
         )
+        try:
+            record = self.remote.get_row(source_id, key_hash)
+        except (OSError, ValueError, KeyError) as exc:
+            log_warning(context, "shared-cache.row-unreadable", status="error", error=str(exc))
+            return None
+        if record is None or record.row_offset is not None:
+            return None
+        if local is not None and record.created_at <= local.created_at:
+            return None
+        target = self.root / record.relative_path
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _temp_sibling(target.parent, target.name)
+            try:
+                copied = self.remote.get_blob(record.relative_path, tmp_path)
+                if copied and record.content_hash is not None:
+                    copied = _file_sha256(tmp_path) == record.content_hash
+                    if not copied:
+                        log_warning(
+                            context,
+                            "shared-cache.checksum-mismatch",
+                            status="error",
+                            cache_key=key_hash,
+                            path=str(record.relative_path),
+                        )
+                if not copied:
+                    tmp_path.unlink(missing_ok=True)
+                    return None
+                os.replace(tmp_path, target)
+            except OSError as exc:
+                tmp_path.unlink(missing_ok=True)
+                log_warning(context, "shared-cache.pull-failed", status="error", error=str(exc))
+                return None
+        record = replace(record, last_accessed_at=None)
         self.index.upsert(record)
+        log_info(context, "shared-cache.hit", cache_key=key_hash, path=str(record.relative_path))
         return record
 
+    def publish(self, record: CacheIndexRecord) -> None:
+        """Best-effort write-through of a blob and its row to the shared L2."""
+
+        if self.remote is None or record.row_offset is not None:
+            return
+        try:
+            self.remote.put_blob(record.relative_path, self.root / record.relative_path)
+            # Blob first: a published row always points at a complete blob.
+            self.remote.put_row(record)
+        except OSError as exc:
+            context = LogContext(
+                event="repository.shared-cache",
+                module="data.repository",
+                action="publish",
+                source_id=record.source_id,
+            )
+            log_warning(context, "shared-cache.publish-failed", status="error", error=str(exc))
+
+    def _append_partition(
+        self,
+        source_id: str,
+        partition: str,
+        frames: Mapping[str, pd.DataFrame],
+        ttl_days: int,
+        schema_version: Optional[str],
+        created_at: datetime,
+        validators: Mapping[str, Validators],
+    ) -> list[CacheIndexRecord]:
+        """Append every frame in ``frames`` to ``partition`` as one new part file.
+
+        Only the appended rows are written (as a content-addressed blob in the
+        partition directory), so a write costs the same however many keys the
+        partition already holds.  Earlier rows of the appended keys stay in
+        their part files until :meth:`compact_partitions` merges the partition
+        or GC reclaims files no index row references any more.
+        """
+
+        directory = self.partition_dir(source_id, partition)
+        lock_path = self.partition_lock_path(source_id, partition)
+        with _KEY_LOCKS.hold(str(lock_path)), _file_lock(lock_path):
+            combined = pa.concat_tables(
+                [pa.Table.from_pandas(frame, preserve_index=False) for frame in frames.values()],
+                promote_options="default",
+            )
+            artifact, content_hash = _write_blob(
+                directory, ".parquet", lambda tmp: _write_table(combined, tmp)
+            )
+            relative = artifact.relative_to(self.root)
+            size = artifact.stat().st_size
+            records: list[CacheIndexRecord] = []
+            offset = 0
+            for key_hash, frame in frames.items():
+                key_validators = validators.get(key_hash) or Validators()
+                records.append(
+                    CacheIndexRecord(
+                        source_id=source_id,
+                        key_hash=key_hash,
+                        relative_path=relative,
+                        created_at=created_at,
+                        as_of=_extract_as_of(frame),
+                        ttl_days=ttl_days,
+                        rows=_deterministic_rows(frame),
+                        schema_version=schema_version,
+                        schema_fingerprint=_validated_fingerprint(source_id, frame),
+                        content_hash=content_hash,
+                        bytes=size,
+                        row_offset=offset,
+                        etag=key_validators.etag,
+                        last_modified=key_validators.last_modified,
+                    )
+                )
+                offset += _deterministic_rows(frame)
+            self.index.bulk_upsert(records)
+        return records
+
+    def compact_partitions(self, source_id: Optional[str] = None) -> int:
+        """Merge each partition's part files into one file; returns partitions merged.
+
+        Rows still referenced by the index are rewritten into a single
+        content-addressed blob under the partition lock, every row is
+        re-pointed in one transaction, and the merged part files are removed.
+        If the part files' schemas no longer concatenate (e.g. after a
+        connector schema bump), only the keys sharing the newest part's schema
+        are kept and the others are un-indexed so they refetch.
+        """
+
+        sources = [source_id] if source_id is not None else sorted(self.partitions)
+        compacted = 0
+        for source in sources:
+            dataset = self.root / source / "dataset"
+            if source not in self.partitions or not dataset.is_dir():
+                continue
+            for directory in sorted(dataset.glob("part=*")):
+                partition = directory.name.removeprefix("part=")
+                if self._compact_partition(source, partition):
+                    compacted += 1
+        return compacted
+
+    def _compact_partition(self, source_id: str, partition: str) -> bool:
+        directory = self.partition_dir(source_id, partition)
+        lock_path = self.partition_lock_path(source_id, partition)
+        with _KEY_LOCKS.hold(str(lock_path)), _file_lock(lock_path):
+            members = sorted(
+                self.index.records_under(source_id, directory.relative_to(self.root)),
+                key=lambda member: (str(member.relative_path), member.row_offset or 0),
+            )
+            if len({member.relative_path for member in members}) < 2:
+                return False
+            tables: Dict[Path, pa.Table] = {}
+            kept: list[CacheIndexRecord] = []
+            for member in members:
+                path = self.root / member.relative_path
+                if path not in tables:
+                    try:
+                        tables[path] = _read_table(path)
+                    except FileNotFoundError:
+                        continue
+                kept.append(member)
+            if not kept:
+                return False
+
+            def _rows(member: CacheIndexRecord) -> pa.Table:
+                table = tables[self.root / member.relative_path]
+                return table.slice(member.row_offset or 0, member.rows)
+
+            try:
+                combined = pa.concat_tables(
+                    [_rows(member) for member in kept], promote_options="default"
+                )
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # The schema drifted between part files: keep the newest schema
+                # and un-index the other keys so they refetch.
+                newest = max(kept, key=lambda member: member.created_at)
+                schema = tables[self.root / newest.relative_path].schema
+                kept = [
+                    member
+                    for member in kept
+                    if tables[self.root / member.relative_path].schema.equals(schema)
+                ]
+                combined = pa.concat_tables(
+                    [_rows(member) for member in kept], promote_options="default"
+                )
+            artifact, content_hash = _write_blob(
+                directory, ".parquet", lambda tmp: _write_table(combined, tmp)
+            )
+            relative = artifact.relative_to(self.root)
+            size = artifact.stat().st_size
+            repointed: list[CacheIndexRecord] = []
+            offset = 0
+            for member in kept:
+                repointed.append(
+                    replace(
+                        member,
+                        relative_path=relative,
+                        content_hash=content_hash,
+                        bytes=size,
+                        row_offset=offset,
+                    )
+                )
+                offset += member.rows
+            self.index.bulk_upsert(repointed)
+            kept_keys = {member.key_hash for member in kept}
+            for member in members:
+                if member.key_hash not in kept_keys:
+                    self.index.delete(member.source_id, member.key_hash)
+            for path in set(tables) - {artifact}:
+                path.unlink(missing_ok=True)
+        return True
+
+    def scan(
+        self,
+        source_id: str,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[ParquetFilters] = None,
+    ) -> pd.DataFrame:
+        """Read every cached row of ``source_id`` in one pass over its files.
+
+        Each artifact is read once; for partitioned sources only the row ranges
+        still referenced by the index are kept.  Keys sharing a blob contribute
+        its rows once.
+        """
+
+        for attempt in range(2):
+            whole: set[Path] = set()
+            spans: Dict[Path, list[tuple[int, int]]] = {}
+            for record in self.index.records(source_id):
+                path = self.root / record.relative_path
+                if record.row_offset is None:
+                    whole.add(path)
+                else:
+                    spans.setdefault(path, []).append((record.row_offset, record.rows))
+            tables: list[pa.Table] = []
+            try:
+                for path in sorted(whole):
+                    tables.append(_read_table(path))
+                for path, ranges in sorted(spans.items()):
+                    table = _read_table(path)
+                    ranges.sort()
+                    if sum(count for _, count in ranges) == table.num_rows:
+                        tables.append(table)
+                    else:
+                        tables.extend(table.slice(start, count) for start, count in ranges)
+            except FileNotFoundError:
+                # A partition was compacted mid-scan; re-read the index once.
+                if attempt:
+                    raise
+                continue
+            break
+        if not tables:
+            return pd.DataFrame(columns=list(columns) if columns is not None else None)
+        combined = pa.concat_tables(tables, promote_options="default")
+        return _project_table(combined, columns, filters).to_pandas()
+
 
 @dataclass
 class Repository:
@@ -367,8 +1971,22 @@ class Repository:
     cache_dir: Optional[Path] = None
     offline: bool = False
     clock: Callable[[], datetime] = _utcnow
+    memory_cache: Optional[MemoryCache] = None
+    paranoid: bool = False
+    stale_while_revalidate: Optional[timedelta] = None
+    revalidate_workers: int = 2
+    access_flush_interval: float = DEFAULT_FLUSH_INTERVAL_S
+    partitions: Optional[Mapping[str, PartitionSpec]] = None
+    cache_formats: Optional[Mapping[str, str]] = None
+    negative_ttl: Optional[timedelta] = None
+    shared_cache: Optional["CacheBackend"] = None
     _store: CacheStore = field(init=False)
+    _access: AccessRecorder = field(init=False)
     _connectors: Mapping[str, Connector] = field(init=False)
+    _revalidator: Optional[ThreadPoolExecutor] = field(init=False, default=None)
+    _revalidating: Dict[str, Future[RepositoryResult]] = field(init=False, default_factory=dict)
+    _revalidation_lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+    _revalidation_counts: Dict[str, int] = field(init=False, default_factory=dict)
 
     def __post_init__(self) -> None:
         configure_logging()
@@ -388,9 +2006,333 @@ class Repository:
             else:
                 # Ephemeral per-process cache to avoid test interference
                 root = Path(tempfile.mkdtemp(prefix="whm-cache-"))
-        self._store = CacheStore(Path(root))
+        self._store = CacheStore(
+            Path(root),
+            partitions=dict(self.partitions or {}),
+            formats=dict(self.cache_formats or {}),
+            remote=self.shared_cache,
+        )
+        self._access = AccessRecorder(
+            partial(_flush_access_batch, self._store.index),
+            flush_interval=self.access_flush_interval,
+        )
+        # Persist the tail of the access counters when the repository goes away.
+        weakref.finalize(self, self._access.flush)
+
+    def get(
+        self,
+        source_id: str,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[ParquetFilters] = None,
+        **query: Any,
+    ) -> RepositoryResult:
+        """Resolve ``query`` for ``source_id`` through the cache.
+
+        ``columns`` and ``filters`` (pyarrow syntax) only shape the returned
+        frame: the cache key and the stored artifact always cover the full
+        query, and cache hits push both down to the Parquet reader.
+        """
+
+        return self._get(source_id, query, projection=_Projection.of(columns, filters))
+
+    def get_many(
+        self,
+        source_id: str,
+        queries: Iterable[Mapping[str, Any]],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        return_exceptions: bool = False,
+    ) -> RepositoryBatchResult:
+        """Resolve many queries for one source with a single index lookup.
+
+        Key hashes are resolved against ``cache_index`` in one pass; fresh hits
+        are loaded and misses are sent to the connector on a bounded thread
+        pool.  Keys the local index cannot serve are first pulled from the
+        shared L2, if one is configured.  When the connector implements
+        :class:`BulkConnector`, keys still without an index row are then
+        fetched, validated and written with batched ``fetch_many`` calls; keys
+        it has no rows for take the per-key path, whose workers share index commits
+        rather than paying one transaction per key.  Duplicate queries are
+        resolved once.  Results are returned in input order; the first error
+        (in input order) is re-raised once every query has settled, unless
+        ``return_exceptions`` is set, in which case failed queries are
+        reported in ``errors`` instead.
+        """
 
-    def get(self, source_id: str, **query: Any) -> RepositoryResult:
+        connector = self._resolve_connector(source_id)
+        query_list = [dict(query) for query in queries]
+        key_hashes = [_key_hash(source_id, query) for query in query_list]
+        unique: Dict[str, Dict[str, Any]] = {}
+        for key_hash, query in zip(key_hashes, query_list):
+            unique.setdefault(key_hash, query)
+
+        with correlation_context() as correlation_id:
+            started_at = self.clock()
+            context = LogContext(
+                event="repository.fetch",
+                module="data.repository",
+                action="get_many",
+                source_id=source_id,
+            )
+            log_info(
+                context,
+                "fetch-many.start",
+                queries=len(query_list),
+                unique_keys=len(unique),
+                max_workers=max_workers,
+                offline=self.offline,
+            )
+            records = self._store.index.lookup_many(source_id, unique.keys())
+            if self._store.remote is not None:
+                # Read local misses through to the shared L2 before fetching upstream.
+                now = self.clock()
+                for key_hash in unique:
+                    local = records.get(key_hash)
+                    if not self._is_servable(local, now):
+                        pulled = self._store.pull_remote(source_id, key_hash, local)
+                        if pulled is not None:
+                            records[key_hash] = pulled
+
+            outcomes: Dict[str, RepositoryResult] = {}
+            errors: Dict[str, BaseException] = {}
+            if not self.offline and hasattr(connector, "fetch_many"):
+                outcomes.update(
+                    self._fetch_bulk(
+                        source_id,
+                        cast(BulkConnector, connector),
+                        {
+                            key_hash: query
+                            for key_hash, query in unique.items()
+                            if key_hash not in records
+                        },
+                        correlation_id,
+                    )
+                )
+            pending = {
+                key_hash: query for key_hash, query in unique.items() if key_hash not in outcomes
+            }
+            # Partition appends re-point other keys' rows, so they commit on their own.
+            index_batch = (
+                None if source_id in self._store.partitions else _IndexBatch(self._store.index)
+            )
+            workers = max(1, min(max_workers, len(pending) or 1))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="whm-repository"
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        self._get,
+                        source_id,
+                        query,
+                        index_records=records,
+                        index_batch=index_batch,
+                    ): key_hash
+                    for key_hash, query in pending.items()
+                }
+                for future in as_completed(futures):
+                    key_hash = futures[future]
+                    try:
+                        outcomes[key_hash] = future.result()
+                    except Exception as exc:
+                        errors[key_hash] = exc
+
+            duration_ms = _elapsed_ms(started_at, self.clock())
+            status_counts: Dict[str, int] = {}
+            for key_hash in key_hashes:
+                status = outcomes[key_hash].status if key_hash in outcomes else "error"
+                status_counts[status] = status_counts.get(status, 0) + 1
+            log_method = log_warning if errors else log_info
+            log_method(
+                context,
+                "fetch-many.complete",
+                status="error" if errors else "ok",
+                queries=len(query_list),
+                unique_keys=len(unique),
+                index_hits=len(records),
+                duration_ms=duration_ms,
+                status_counts=status_counts,
+            )
+
+        if not return_exceptions:
+            for key_hash in key_hashes:
+                if key_hash in errors:
+                    raise errors[key_hash]
+        return RepositoryBatchResult(
+            source_id=source_id,
+            results=tuple(outcomes[key_hash] for key_hash in key_hashes if key_hash in outcomes),
+            duration_ms=duration_ms,
+            status_counts=status_counts,
+            correlation_id=correlation_id,
+            errors=tuple(
+                (query, errors[key_hash])
+                for key_hash, query in zip(key_hashes, query_list)
+                if key_hash in errors
+            ),
+        )
+
+    def _fetch_bulk(
+        self,
+        source_id: str,
+        connector: BulkConnector,
+        misses: Mapping[str, Mapping[str, Any]],
+        correlation_id: str,
+    ) -> Dict[str, RepositoryResult]:
+        """Fetch, validate and cache uncached keys with batched ``fetch_many`` calls.
+
+        Keys known to be missing (negative cache) are left to the per-key
+        path, which raises their stored error.  Each call covers up to
+        ``_BULK_KEYS_PER_CALL`` keys and holds their single-flight locks until
+        the rows are committed; keys whose lock another caller holds are left
+        to the per-key path, which waits for that caller and reuses its row.
+        Partitioned sources append each partition's keys as one part file (see
+        :meth:`CacheStore.write_many`).  Any connector or schema error falls
+        back to the per-key path for every key of the call.
+        """
+
+        context = LogContext(
+            event="repository.fetch",
+            module="data.repository",
+            action="fetch_many",
+            source_id=source_id,
+        )
+        now = self.clock()
+        candidates: Dict[str, Mapping[str, Any]] = {}
+        outcomes: Dict[str, RepositoryResult] = {}
+        for key_hash, query in misses.items():
+            if self.negative_ttl is not None:
+                negative = self._store.index.lookup_negative(source_id, key_hash)
+                if negative is not None and negative.is_active(now):
+                    continue
+            candidates[key_hash] = query
+
+        pending = list(candidates)
+        for start in range(0, len(pending), _BULK_KEYS_PER_CALL):
+            with ExitStack() as held:
+                locked = [
+                    key_hash
+                    for key_hash in pending[start : start + _BULK_KEYS_PER_CALL]
+                    if held.enter_context(self._store.key_lock(source_id, key_hash, blocking=False))
+                ]
+                # A concurrent caller may have committed some keys before we locked them.
+                written = self._store.index.lookup_many(source_id, locked)
+                chunk = {
+                    key_hash: candidates[key_hash] for key_hash in locked if key_hash not in written
+                }
+                if chunk:
+                    outcomes.update(
+                        self._fetch_bulk_locked(
+                            source_id, connector, chunk, context, now, correlation_id
+                        )
+                    )
+        return outcomes
+
+    def _fetch_bulk_locked(
+        self,
+        source_id: str,
+        connector: BulkConnector,
+        chunk: Mapping[str, Mapping[str, Any]],
+        context: LogContext,
+        now: datetime,
+        correlation_id: str,
+    ) -> Dict[str, RepositoryResult]:
+        """One ``fetch_many`` call for keys whose single-flight locks are held."""
+
+        outcomes: Dict[str, RepositoryResult] = {}
+        key_hashes = list(chunk)
+        fetch_started = time.perf_counter()
+        try:
+            frame = connector.fetch_many([chunk[key_hash] for key_hash in key_hashes])
+        except (ConnectorError, SchemaError) as exc:
+            log_warning(
+                context,
+                "fetch-many.bulk-failed",
+                status="error",
+                keys=len(key_hashes),
+                error=str(exc),
+            )
+            return outcomes
+        fetch_ms = (time.perf_counter() - fetch_started) * 1000
+        if not frame.empty and QUERY_INDEX_COLUMN not in frame.columns:
+            log_warning(
+                context,
+                "fetch-many.bulk-failed",
+                status="error",
+                keys=len(key_hashes),
+                error=f"fetch_many returned no '{QUERY_INDEX_COLUMN}' column",
+            )
+            return outcomes
+
+        ttl_days = _connector_ttl_days(connector)
+        schema_version = _connector_schema_version(connector)
+        frames: Dict[str, pd.DataFrame] = {}
+        if not frame.empty:
+            for position, rows in frame.groupby(QUERY_INDEX_COLUMN, sort=False):
+                key_hash = key_hashes[int(cast(int, position))]
+                frames[key_hash] = rows.drop(columns=[QUERY_INDEX_COLUMN]).reset_index(drop=True)
+        written = self._store.write_many(
+            source_id, frames, ttl_days, schema_version, created_at=now
+        )
+        per_key_ms = fetch_ms / max(1, len(key_hashes))
+        for record in written:
+            if self.negative_ttl is not None:
+                self._store.index.delete_negative(source_id, record.key_hash)
+            self._access.record_fetch(source_id, record.key_hash, self.clock(), per_key_ms)
+            outcomes[record.key_hash] = RepositoryResult(
+                source_id=source_id,
+                frame=frames[record.key_hash],
+                status=STATUS_REFRESHED,
+                artifact_path=self._store.root / record.relative_path,
+                cache_key=record.key_hash,
+                correlation_id=correlation_id,
+                metadata={
+                    "rows": record.rows,
+                    "ttl_days": record.ttl_days,
+                    "schema_version": record.schema_version,
+                    "as_of": record.as_of,
+                    "bulk": True,
+                },
+            )
+        log_info(
+            context,
+            "fetch-many.bulk",
+            keys=len(key_hashes),
+            resolved=len(outcomes),
+            duration_ms=round(fetch_ms),
+        )
+        return outcomes
+
+    def missing_queries(
+        self, source_id: str, queries: Iterable[Mapping[str, Any]]
+    ) -> list[Dict[str, Any]]:
+        """Return the distinct queries that a ``get`` would send to the connector.
+
+        A query is missing when it has no index row, its row has expired, or
+        its artifact is gone from disk.  The index is consulted in a single
+        ``lookup_many`` pass and duplicate queries are reported once.
+        """
+
+        unique: Dict[str, Dict[str, Any]] = {}
+        for query in queries:
+            unique.setdefault(_key_hash(source_id, query), dict(query))
+        records = self._store.index.lookup_many(source_id, unique.keys())
+        now = self.clock()
+        return [
+            query
+            for key_hash, query in unique.items()
+            if not self._is_servable(records.get(key_hash), now)
+        ]
+
+    def _get(
+        self,
+        source_id: str,
+        query: Mapping[str, Any],
+        *,
+        index_records: Optional[Mapping[str, CacheIndexRecord]] = None,
+        index_batch: Optional[_IndexBatch] = None,
+        allow_stale: bool = True,
+        projection: _Projection = _FULL_READ,
+    ) -> RepositoryResult:
         connector = self._resolve_connector(source_id)
         key_hash = _key_hash(source_id, query)
         query_signature = _stable_query_signature(query)
@@ -411,8 +2353,14 @@ class Repository:
                 offline=self.offline,
             )
 
-            record = self._store.index.lookup(source_id, key_hash)
+            if index_records is not None:
+                record = index_records.get(key_hash)
+            else:
+                record = self._store.index.lookup(source_id, key_hash)
             now = self.clock()
+            if self._store.remote is not None and not self._is_servable(record, now):
+                # Read through to the shared L2 before treating this as a miss.
+                record = self._store.pull_remote(source_id, key_hash, record) or record
 
             if self.offline:
                 if record is None:
@@ -427,7 +2375,7 @@ class Repository:
                         f"Offline mode: no cached artifact for '{source_id}'",
                         context={"source_id": source_id, "cache_key": key_hash},
                     )
-                frame = validate_connector(source_id, self._store.load(record), lazy=True)
+                frame = self._load_validated(source_id, record, projection)
                 artifact_path = self._store.root / record.relative_path
                 duration_ms = _elapsed_ms(started_at, self.clock())
                 metadata = {
@@ -455,24 +2403,116 @@ class Repository:
                     metadata=metadata,
                 )
 
-            lock_path = self._store.lock_path(source_id)
-
-            if record and record.is_fresh(now):
+            if (
+                allow_stale
+                and self.stale_while_revalidate is not None
+                and record is not None
+                and record.within_grace(now, self.stale_while_revalidate)
+                and (self._store.root / record.relative_path).exists()
+            ):
+                frame = self._load_validated(source_id, record, projection)
                 artifact_path = self._store.root / record.relative_path
-                if not artifact_path.exists():
-                    frame = validate_connector(source_id, connector.fetch(**query))
-                    with _source_lock(lock_path):
+                scheduled = self._schedule_revalidation(source_id, key_hash, query)
+                duration_ms = _elapsed_ms(started_at, self.clock())
+                metadata = {
+                    "rows": record.rows,
+                    "ttl_days": record.ttl_days,
+                    "schema_version": record.schema_version,
+                    "as_of": record.as_of,
+                    "revalidating": True,
+                }
+                log_info(
+                    context,
+                    "fetch.stale-while-revalidate",
+                    status=STATUS_STALE,
+                    cache_key=key_hash,
+                    query_signature=query_signature,
+                    artifact=str(artifact_path),
+                    duration_ms=duration_ms,
+                    revalidation_scheduled=scheduled,
+                )
+                return RepositoryResult(
+                    source_id=source_id,
+                    frame=frame,
+                    status=STATUS_STALE,
+                    artifact_path=artifact_path,
+                    cache_key=key_hash,
+                    correlation_id=correlation_id,
+                    metadata=metadata,
+                )
+
+            if record is None:
+                self._raise_if_known_missing(context, source_id, key_hash, query_signature, now)
+
+            coalesced = False
+            with ExitStack() as flight:
+                if not self._is_servable(record, now):
+                    # Single-flight: the first caller for this key fetches while
+                    # concurrent callers (threads or processes) wait here, then
+                    # re-check the index and reuse the artifact it wrote.
+                    flight.enter_context(self._store.key_lock(source_id, key_hash))
+                    latest = self._store.index.lookup(source_id, key_hash)
+                    now = self.clock()
+                    if self._is_servable(latest, now):
+                        record = latest
+                        coalesced = True
+                    elif latest is None:
+                        # The caller that held the lock may have just failed.
+                        self._raise_if_known_missing(
+                            context, source_id, key_hash, query_signature, now
+                        )
+
+                if record and record.is_fresh(now):
+                    artifact_path = self._store.root / record.relative_path
+                    if not artifact_path.exists():
+                        fetch_started = time.perf_counter()
+                        with revalidation_scope() as revalidation:
+                            frame = validate_connector(source_id, connector.fetch(**query))
                         record = self._store.write(
                             source_id=source_id,
                             key_hash=key_hash,
                             frame=frame,
-                            ttl_days=max(
-                                1,
-                                math.ceil(int(getattr(connector, "ttl_seconds", 86_400)) / 86_400),
-                            ),
+                            ttl_days=max(1, _connector_ttl_days(connector)),
                             schema_version=_connector_schema_version(connector),
                             created_at=self.clock(),
+                            update_index=index_batch is None,
+                            validators=revalidation.validators,
+                        )
+                        if index_batch is not None:
+                            index_batch.commit(record)
+                        self._access.record_fetch(
+                            source_id,
+                            key_hash,
+                            self.clock(),
+                            (time.perf_counter() - fetch_started) * 1000,
+                        )
+                        duration_ms = _elapsed_ms(started_at, self.clock())
+                        metadata = {
+                            "rows": record.rows,
+                            "ttl_days": record.ttl_days,
+                            "schema_version": record.schema_version,
+                            "as_of": record.as_of,
+                        }
+                        log_info(
+                            context,
+                            "fetch.connector-success",
+                            status=STATUS_REFRESHED,
+                            cache_key=key_hash,
+                            query_signature=query_signature,
+                            artifact=str(artifact_path),
+                            duration_ms=duration_ms,
+                            ttl_days=record.ttl_days,
                         )
+                        return RepositoryResult(
+                            source_id=source_id,
+                            frame=projection.apply(frame),
+                            status=STATUS_REFRESHED,
+                            artifact_path=artifact_path,
+                            cache_key=key_hash,
+                            correlation_id=correlation_id,
+                            metadata=metadata,
+                        )
+                    frame = self._load_validated(source_id, record, projection)
                     duration_ms = _elapsed_ms(started_at, self.clock())
                     metadata = {
                         "rows": record.rows,
@@ -482,202 +2522,231 @@ class Repository:
                     }
                     log_info(
                         context,
-                        "fetch.connector-success",
-                        status=STATUS_REFRESHED,
+                        "fetch.cache-hit",
+                        status=STATUS_FRESH,
                         cache_key=key_hash,
                         query_signature=query_signature,
                         artifact=str(artifact_path),
                         duration_ms=duration_ms,
-                        ttl_days=record.ttl_days,
+                        coalesced=coalesced or None,
                     )
                     return RepositoryResult(
                         source_id=source_id,
                         frame=frame,
-                        status=STATUS_REFRESHED,
+                        status=STATUS_FRESH,
                         artifact_path=artifact_path,
                         cache_key=key_hash,
                         correlation_id=correlation_id,
                         metadata=metadata,
                     )
-                frame = validate_connector(source_id, self._store.load(record), lazy=True)
-                duration_ms = _elapsed_ms(started_at, self.clock())
-                metadata = {
-                    "rows": record.rows,
-                    "ttl_days": record.ttl_days,
-                    "schema_version": record.schema_version,
-                    "as_of": record.as_of,
-                }
+
                 log_info(
                     context,
-                    "fetch.cache-hit",
-                    status=STATUS_FRESH,
+                    "fetch.connector.request",
                     cache_key=key_hash,
                     query_signature=query_signature,
-                    artifact=str(artifact_path),
-                    duration_ms=duration_ms,
                 )
-                return RepositoryResult(
-                    source_id=source_id,
-                    frame=frame,
-                    status=STATUS_FRESH,
-                    artifact_path=artifact_path,
-                    cache_key=key_hash,
-                    correlation_id=correlation_id,
-                    metadata=metadata,
+                fetch_started = time.perf_counter()
+                # Expired rows with upstream validators are refetched conditionally.
+                previous_validators = (
+                    record.validators
+                    if record is not None and (self._store.root / record.relative_path).exists()
+                    else None
                 )
-
-            log_info(
-                context,
-                "fetch.connector.request",
-                cache_key=key_hash,
-                query_signature=query_signature,
-            )
-            try:
-                frame = connector.fetch(**query)
-                # Minimal schema sanity: require at least source_id or observed_at
-                if not isinstance(frame, pd.DataFrame) or (
-                    "source_id" not in frame.columns and "observed_at" not in frame.columns
-                ):
-                    _record_failure(
+                try:
+                    with revalidation_scope(previous_validators) as revalidation:
+                        frame = connector.fetch(**query)
+                    # Minimal schema sanity: require at least source_id or observed_at
+                    if not isinstance(frame, pd.DataFrame) or (
+                        "source_id" not in frame.columns and "observed_at" not in frame.columns
+                    ):
+                        _record_failure(
+                            source_id,
+                            "schema-validation-failed",
+                            correlation_id=correlation_id,
+                            details={"cache_key": key_hash},
+                        )
+                        raise SchemaError(
+                            "Connector schema invalid", context={"source_id": source_id}
+                        )
+                except NotModified:
+                    # 304: keep the artifact and restart its TTL instead of rewriting it.
+                    renewed = self._store.index.renew(source_id, key_hash, self.clock())
+                    if renewed is None:
+                        raise CacheError(
+                            "Cache row vanished during conditional revalidation",
+                            context={"source_id": source_id, "cache_key": key_hash},
+                        )
+                    self._store.publish(renewed)
+                    self._access.record_fetch(
                         source_id,
-                        "schema-validation-failed",
-                        correlation_id=correlation_id,
-                        details={"cache_key": key_hash},
+                        key_hash,
+                        self.clock(),
+                        (time.perf_counter() - fetch_started) * 1000,
                     )
-                    raise SchemaError("Connector schema invalid", context={"source_id": source_id})
-            except SchemaError as exc:
-                _record_failure(
-                    source_id,
-                    str(exc),
-                    correlation_id=correlation_id,
-                    details={
-                        "cache_key": key_hash,
-                        "query_signature": query_signature,
-                        "error": exc.message,
-                    },
-                )
-                log_error(
-                    context,
-                    "fetch.schema-error",
-                    status="error",
-                    cache_key=key_hash,
-                    query_signature=query_signature,
-                    error=str(exc),
-                )
-                raise
-            except ConnectorError as exc:
-                if record:
-                    artifact_path = self._store.root / record.relative_path
+                    frame = self._load_validated(source_id, renewed, projection)
+                    artifact_path = self._store.root / renewed.relative_path
                     duration_ms = _elapsed_ms(started_at, self.clock())
                     metadata = {
-                        "rows": record.rows,
-                        "ttl_days": record.ttl_days,
-                        "schema_version": record.schema_version,
-                        "as_of": record.as_of,
-                        "fallback_reason": str(exc),
+                        "rows": renewed.rows,
+                        "ttl_days": renewed.ttl_days,
+                        "schema_version": renewed.schema_version,
+                        "as_of": renewed.as_of,
+                        "revalidated": True,
                     }
-                    log_warning(
+                    log_info(
                         context,
-                        "fetch.fallback",
-                        status=STATUS_STALE,
+                        "fetch.not-modified",
+                        status=STATUS_FRESH,
                         cache_key=key_hash,
                         query_signature=query_signature,
                         artifact=str(artifact_path),
                         duration_ms=duration_ms,
-                        error=str(exc),
                     )
-                    _record_failure(
-                        source_id,
-                        str(exc),
-                        correlation_id=correlation_id,
-                        details={"cache_key": key_hash},
-                    )
-                    frame = validate_connector(source_id, self._store.load(record), lazy=True)
                     return RepositoryResult(
                         source_id=source_id,
                         frame=frame,
-                        status=STATUS_STALE,
+                        status=STATUS_FRESH,
                         artifact_path=artifact_path,
                         cache_key=key_hash,
                         correlation_id=correlation_id,
                         metadata=metadata,
                     )
-                _record_failure(
-                    source_id,
-                    str(exc),
-                    correlation_id=correlation_id,
-                    details={"cache_key": key_hash},
-                )
-                log_error(
-                    context,
-                    "fetch.connector-error",
-                    status="error",
-                    cache_key=key_hash,
-                    query_signature=query_signature,
-                    error=str(exc),
-                )
-                raise
-            except Exception as exc:  # pragma: no cover - defensive guard
-                wrapped = ConnectorError(
-                    f"Connector '{source_id}' raised an unexpected error",
-                    context={"source_id": source_id},
-                )
-                if record:
-                    artifact_path = self._store.root / record.relative_path
-                    metadata = {
-                        "rows": record.rows,
-                        "ttl_days": record.ttl_days,
-                        "schema_version": record.schema_version,
-                        "as_of": record.as_of,
-                        "fallback_reason": str(wrapped),
-                    }
-                    log_warning(
+                except SchemaError as exc:
+                    _record_failure(
+                        source_id,
+                        str(exc),
+                        correlation_id=correlation_id,
+                        details={
+                            "cache_key": key_hash,
+                            "query_signature": query_signature,
+                            "error": exc.message,
+                        },
+                    )
+                    log_error(
                         context,
-                        "fetch.fallback-unexpected",
-                        status=STATUS_STALE,
+                        "fetch.schema-error",
+                        status="error",
                         cache_key=key_hash,
                         query_signature=query_signature,
-                        artifact=str(artifact_path),
                         error=str(exc),
                     )
+                    raise
+                except ConnectorError as exc:
+                    if record:
+                        artifact_path = self._store.root / record.relative_path
+                        duration_ms = _elapsed_ms(started_at, self.clock())
+                        metadata = {
+                            "rows": record.rows,
+                            "ttl_days": record.ttl_days,
+                            "schema_version": record.schema_version,
+                            "as_of": record.as_of,
+                            "fallback_reason": str(exc),
+                        }
+                        log_warning(
+                            context,
+                            "fetch.fallback",
+                            status=STATUS_STALE,
+                            cache_key=key_hash,
+                            query_signature=query_signature,
+                            artifact=str(artifact_path),
+                            duration_ms=duration_ms,
+                            error=str(exc),
+                        )
+                        _record_failure(
+                            source_id,
+                            str(exc),
+                            correlation_id=correlation_id,
+                            details={"cache_key": key_hash},
+                        )
+                        frame = self._load_validated(source_id, record, projection)
+                        return RepositoryResult(
+                            source_id=source_id,
+                            frame=frame,
+                            status=STATUS_STALE,
+                            artifact_path=artifact_path,
+                            cache_key=key_hash,
+                            correlation_id=correlation_id,
+                            metadata=metadata,
+                        )
                     _record_failure(
                         source_id,
-                        str(wrapped),
+                        str(exc),
                         correlation_id=correlation_id,
                         details={"cache_key": key_hash},
                     )
-                    frame = self._store.load(record)
-                    return RepositoryResult(
-                        source_id=source_id,
-                        frame=frame,
-                        status=STATUS_STALE,
-                        artifact_path=artifact_path,
+                    self._remember_failure(source_id, key_hash, exc)
+                    log_error(
+                        context,
+                        "fetch.connector-error",
+                        status="error",
                         cache_key=key_hash,
+                        query_signature=query_signature,
+                        error=str(exc),
+                    )
+                    raise
+                except Exception as exc:  # pragma: no cover - defensive guard
+                    wrapped = ConnectorError(
+                        f"Connector '{source_id}' raised an unexpected error",
+                        context={"source_id": source_id},
+                    )
+                    if record:
+                        artifact_path = self._store.root / record.relative_path
+                        metadata = {
+                            "rows": record.rows,
+                            "ttl_days": record.ttl_days,
+                            "schema_version": record.schema_version,
+                            "as_of": record.as_of,
+                            "fallback_reason": str(wrapped),
+                        }
+                        log_warning(
+                            context,
+                            "fetch.fallback-unexpected",
+                            status=STATUS_STALE,
+                            cache_key=key_hash,
+                            query_signature=query_signature,
+                            artifact=str(artifact_path),
+                            error=str(exc),
+                        )
+                        _record_failure(
+                            source_id,
+                            str(wrapped),
+                            correlation_id=correlation_id,
+                            details={"cache_key": key_hash},
+                        )
+                        frame = self._store.load(
+                            record, columns=projection.columns, filters=projection.filters
+                        )
+                        return RepositoryResult(
+                            source_id=source_id,
+                            frame=frame,
+                            status=STATUS_STALE,
+                            artifact_path=artifact_path,
+                            cache_key=key_hash,
+                            correlation_id=correlation_id,
+                            metadata=metadata,
+                        )
+                    _record_failure(
+                        source_id,
+                        str(wrapped),
                         correlation_id=correlation_id,
-                        metadata=metadata,
+                        details={"cache_key": key_hash},
                     )
-                _record_failure(
-                    source_id,
-                    str(wrapped),
-                    correlation_id=correlation_id,
-                    details={"cache_key": key_hash},
-                )
-                log_error(
-                    context,
-                    "fetch.unexpected-error",
-                    status="error",
-                    cache_key=key_hash,
-                    query_signature=query_signature,
-                    error=str(exc),
-                )
-                raise wrapped from exc
+                    log_error(
+                        context,
+                        "fetch.unexpected-error",
+                        status="error",
+                        cache_key=key_hash,
+                        query_signature=query_signature,
+                        error=str(exc),
+                    )
+                    raise wrapped from exc
 
-            ttl_seconds = int(getattr(connector, "ttl_seconds", 86_400))
-            ttl_days = max(1, math.ceil(ttl_seconds / 86_400)) if ttl_seconds > 0 else 0
-            schema_version = _connector_schema_version(connector)
+                ttl_days = _connector_ttl_days(connector)
+                schema_version = _connector_schema_version(connector)
 
-            lock_path = self._store.lock_path(source_id)
-            with _source_lock(lock_path):
+                # Writes happen under the per-key single-flight lock taken above;
+                # ``get_many`` commits the row with its workers' group commit.
                 record = self._store.write(
                     source_id=source_id,
                     key_hash=key_hash,
@@ -685,40 +2754,284 @@ class Repository:
                     ttl_days=ttl_days,
                     schema_version=schema_version,
                     created_at=self.clock(),
+                    update_index=index_batch is None,
+                    validators=revalidation.validators,
+                )
+                if index_batch is not None:
+                    index_batch.commit(record)
+                if self.negative_ttl is not None:
+                    self._store.index.delete_negative(source_id, key_hash)
+                self._access.record_fetch(
+                    source_id, key_hash, self.clock(), (time.perf_counter() - fetch_started) * 1000
                 )
 
-            artifact_path = self._store.root / record.relative_path
-            duration_ms = _elapsed_ms(started_at, self.clock())
-            metadata = {
-                "rows": record.rows,
-                "ttl_days": record.ttl_days,
-                "schema_version": record.schema_version,
-                "as_of": record.as_of,
-            }
-            log_info(
-                context,
-                "fetch.connector-success",
-                status=STATUS_REFRESHED,
-                cache_key=key_hash,
-                query_signature=query_signature,
-                artifact=str(artifact_path),
-                duration_ms=duration_ms,
-                ttl_days=ttl_days,
-            )
-            return RepositoryResult(
-                source_id=source_id,
-                frame=frame,
-                status=STATUS_REFRESHED,
-                artifact_path=artifact_path,
-                cache_key=key_hash,
-                correlation_id=correlation_id,
-                metadata=metadata,
-            )
+                artifact_path = self._store.root / record.relative_path
+                duration_ms = _elapsed_ms(started_at, self.clock())
+                metadata = {
+                    "rows": record.rows,
+                    "ttl_days": record.ttl_days,
+                    "schema_version": record.schema_version,
+                    "as_of": record.as_of,
+                }
+                log_info(
+                    context,
+                    "fetch.connector-success",
+                    status=STATUS_REFRESHED,
+                    cache_key=key_hash,
+                    query_signature=query_signature,
+                    artifact=str(artifact_path),
+                    duration_ms=duration_ms,
+                    ttl_days=ttl_days,
+                )
+                return RepositoryResult(
+                    source_id=source_id,
+                    frame=projection.apply(frame),
+                    status=STATUS_REFRESHED,
+                    artifact_path=artifact_path,
+                    cache_key=key_hash,
+                    correlation_id=correlation_id,
+                    metadata=metadata,
+                )
 
     def refresh(
         self, source_id: str, queries: Iterable[Mapping[str, Any]]
     ) -> list[RepositoryResult]:
-        return [self.get(source_id, **query) for query in queries]
+        return list(self.get_many(source_id, queries).results)
+
+    def scan(
+        self,
+        source_id: str,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[ParquetFilters] = None,
+    ) -> pd.DataFrame:
+        """Every cached row of ``source_id`` in one read, for bulk feature builds.
+
+        Reads what is already cached (never calls the connector); warm the
+        cache with :meth:`get_many` first.
+        """
+
+        self._resolve_connector(source_id)
+        return self._store.scan(source_id, columns=columns, filters=filters)
+
+    @property
+    def revalidation_stats(self) -> RevalidationStats:
+        """How often stale-while-revalidate refreshes completed versus failed."""
+
+        with self._revalidation_lock:
+            return RevalidationStats(
+                scheduled=self._revalidation_counts.get("scheduled", 0),
+                completed=self._revalidation_counts.get("completed", 0),
+                failed=self._revalidation_counts.get("failed", 0),
+                in_flight=len(self._revalidating),
+            )
+
+    def wait_for_revalidations(self, timeout: Optional[float] = None) -> None:
+        """Block until background refreshes scheduled so far have finished."""
+
+        with self._revalidation_lock:
+            pending = list(self._revalidating.values())
+        wait(pending, timeout=timeout)
+
+    def close(self) -> None:
+        """Finish background refreshes, flush access stats and release workers."""
+
+        if self._revalidator is not None:
+            self._revalidator.shutdown(wait=True)
+            self._revalidator = None
+        self._access.flush()
+
+    def flush_access_stats(self) -> None:
+        """Write pending hit/fetch counters to the index now."""
+
+        self._access.flush()
+
+    def _schedule_revalidation(
+        self, source_id: str, key_hash: str, query: Mapping[str, Any]
+    ) -> bool:
+        """Queue one background refresh per key; returns False if already queued."""
+
+        with self._revalidation_lock:
+            if key_hash in self._revalidating:
+                return False
+            if self._revalidator is None:
+                self._revalidator = ThreadPoolExecutor(
+                    max_workers=max(1, self.revalidate_workers),
+                    thread_name_prefix="whm-revalidate",
+                )
+            future = self._revalidator.submit(self._revalidate, source_id, dict(query))
+            self._revalidating[key_hash] = future
+            self._revalidation_counts["scheduled"] = (
+                self._revalidation_counts.get("scheduled", 0) + 1
+            )
+        future.add_done_callback(lambda done: self._finish_revalidation(source_id, key_hash, done))
+        return True
+
+    def _revalidate(self, source_id: str, query: Mapping[str, Any]) -> RepositoryResult:
+        return self._get(source_id, query, allow_stale=False)
+
+    def _finish_revalidation(
+        self, source_id: str, key_hash: str, future: Future[RepositoryResult]
+    ) -> None:
+        error = future.exception()
+        # A connector failure with a cached record falls back to a stale result
+        # instead of raising, so that counts as a failed revalidation too.
+        failed = error is not None or future.result().status == STATUS_STALE
+        outcome = "failed" if failed else "completed"
+        with self._revalidation_lock:
+            self._revalidating.pop(key_hash, None)
+            self._revalidation_counts[outcome] = self._revalidation_counts.get(outcome, 0) + 1
+        context = LogContext(
+            event="repository.revalidate",
+            module="data.repository",
+            action="revalidate",
+            source_id=source_id,
+        )
+        log_method = log_warning if failed else log_info
+        log_method(
+            context,
+            f"revalidate.{outcome}",
+            status="error" if failed else STATUS_REFRESHED,
+            cache_key=key_hash,
+            error=str(error) if error is not None else None,
+        )
+
+    @property
+    def store(self) -> CacheStore:
+        """The artifact store backing this repository (e.g. for ``CacheStore.gc``)."""
+
+        return self._store
+
+    @property
+    def memory_stats(self) -> Optional[MemoryCacheStats]:
+        """Hit/miss/eviction counters for the in-memory tier, if enabled."""
+
+        return self.memory_cache.stats() if self.memory_cache is not None else None
+
+    def _raise_if_known_missing(
+        self,
+        context: LogContext,
+        source_id: str,
+        key_hash: str,
+        query_signature: str,
+        now: datetime,
+    ) -> None:
+        """Fail fast with the remembered error while a negative entry is active."""
+
+        if self.negative_ttl is None:
+            return
+        negative = self._store.index.lookup_negative(source_id, key_hash)
+        if negative is None or not negative.is_active(now):
+            return
+        log_info(
+            context,
+            "fetch.negative-cache-hit",
+            status="error",
+            cache_key=key_hash,
+            query_signature=query_signature,
+            error_class=negative.error_class,
+            expires_at=negative.expires_at.isoformat(),
+        )
+        raise ConnectorError(
+            negative.message,
+            context={
+                "source_id": source_id,
+                "cache_key": key_hash,
+                "negative_cache": True,
+                "error_class": negative.error_class,
+                "expires_at": negative.expires_at.isoformat(),
+            },
+        )
+
+    def _remember_failure(self, source_id: str, key_hash: str, exc: ConnectorError) -> None:
+        """Store a negative-cache entry so repeats fail fast until ``negative_ttl`` passes.
+
+        Only "data unavailable" failures are remembered; transient ones
+        (network errors, timeouts, HTTP 429/5xx) are retried on the next call.
+        """
+
+        if self.negative_ttl is None or _is_transient_failure(exc):
+            return
+        cause = _root_cause(exc)
+        created_at = self.clock()
+        self._store.index.upsert_negative(
+            NegativeCacheRecord(
+                source_id=source_id,
+                key_hash=key_hash,
+                error_class=type(cause).__name__,
+                message=cause.message if isinstance(cause, ConnectorError) else str(cause),
+                created_at=created_at,
+                expires_at=created_at + self.negative_ttl,
+            )
+        )
+
+    def _is_servable(self, record: Optional[CacheIndexRecord], now: datetime) -> bool:
+        return (
+            record is not None
+            and record.is_fresh(now)
+            and (self._store.root / record.relative_path).exists()
+        )
+
+    def _load_validated(
+        self,
+        source_id: str,
+        record: CacheIndexRecord,
+        projection: _Projection = _FULL_READ,
+    ) -> pd.DataFrame:
+        """Load a cached artifact, serving validated frames from memory when possible."""
+
+        started = time.perf_counter()
+        frame = self._load_from_tiers(source_id, record, projection)
+        load_ms = (time.perf_counter() - started) * 1000
+        self._access.record_hit(source_id, record.key_hash, self.clock(), load_ms)
+        return frame
+
+    def _load_from_tiers(
+        self, source_id: str, record: CacheIndexRecord, projection: _Projection
+    ) -> pd.DataFrame:
+        if self.memory_cache is None:
+            return self._read_artifact(source_id, record, projection)
+        artifact = self._store.root / record.relative_path
+        try:
+            mtime_ns = artifact.stat().st_mtime_ns
+        except FileNotFoundError:
+            return self._read_artifact(source_id, record, projection)
+        key = (source_id, record.key_hash, mtime_ns)
+        cached = self.memory_cache.get(key)
+        if cached is not None:
+            return projection.apply(cached)
+        if not projection.is_full:
+            # Partial reads are served straight from Parquet and never admitted
+            # to the memory tier, which only holds complete validated frames.
+            return self._read_artifact(source_id, record, projection)
+        frame = self._read_artifact(source_id, record)
+        self.memory_cache.invalidate(source_id, record.key_hash)
+        self.memory_cache.put(key, frame)
+        return frame
+
+    def _read_artifact(
+        self,
+        source_id: str,
+        record: CacheIndexRecord,
+        projection: _Projection = _FULL_READ,
+    ) -> pd.DataFrame:
+        """Read an artifact, skipping Pandera when its schema fingerprint still matches.
+
+        ``paranoid`` mode verifies the content hash and always re-validates.
+        Projections are pushed down to Parquet only when validation is skipped;
+        otherwise the full frame is validated and then projected.
+        """
+
+        if (
+            not self.paranoid
+            and record.schema_fingerprint is not None
+            and record.schema_fingerprint == connector_schema_fingerprint(source_id)
+        ):
+            return self._store.load(
+                record, columns=projection.columns, filters=projection.filters
+            )
+        frame = self._store.load(record, verify=self.paranoid)
+        return projection.apply(validate_connector(source_id, frame, lazy=True))
 
     def _resolve_connector(self, source_id: str) -> Connector:
         try:
@@ -731,10 +3044,18 @@ class Repository:
 
 
 __all__ = [
+    "CACHE_FORMATS",
+    "FORMAT_ARROW",
+    "FORMAT_PARQUET",
+    "PARQUET_ROW_GROUP_ROWS",
+    "CacheGcReport",
     "CacheIndex",
     "CacheIndexRecord",
     "CacheStore",
     "Connector",
+    "ParquetFilters",
+    "PartitionSpec",
     "Repository",
+    "RepositoryBatchResult",
     "RepositoryResult",
 ]
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
-from typing import Iterable, Literal, Mapping, MutableMapping, Optional
+from hashlib import sha256
+from typing import Any, Dict, Iterable, Literal, Mapping, MutableMapping, Optional, Tuple
 
 import pandas as pd
 import pandera as pa
@@ -324,6 +326,53 @@ def _validate(
     return validated
 
 
+SCHEMA_FINGERPRINT_ATTR = "schema_fingerprint"
+
+_FINGERPRINT_CACHE: Dict[Tuple[str, int], str] = {}
+
+
+def _describe_schema(schema: DataFrameSchema) -> Mapping[str, Any]:
+    columns = {
+        name: {
+            "dtype": str(column.dtype),
+            "nullable": column.nullable,
+            "required": column.required,
+            "coerce": column.coerce,
+            "unique": column.unique,
+            "checks": [repr(check) for check in column.checks],
+        }
+        for name, column in schema.columns.items()
+    }
+    return {
+        "name": schema.name,
+        "columns": columns,
+        "coerce": schema.coerce,
+        "strict": schema.strict,
+        "ordered": schema.ordered,
+        "checks": [repr(check) for check in schema.checks],
+    }
+
+
+def connector_schema_fingerprint(source_id: str) -> Optional[str]:
+    """Stable digest of the registered connector schema (``None`` if unregistered).
+
+    The repository stores this alongside cached artifacts; a matching
+    fingerprint on read proves the payload was validated against the same
+    schema and can skip Pandera.
+    """
+
+    schema = CONNECTOR_SCHEMAS.get(source_id)
+    if schema is None:
+        return None
+    cache_key = (source_id, id(schema))
+    cached = _FINGERPRINT_CACHE.get(cache_key)
+    if cached is None:
+        encoded = json.dumps(_describe_schema(schema), sort_keys=True, default=str)
+        cached = sha256(encoded.encode("utf-8")).hexdigest()
+        _FINGERPRINT_CACHE[cache_key] = cached
+    return cached
+
+
 def validate_table_schema(table: str, frame: pd.DataFrame, *, lazy: bool = False) -> pd.DataFrame:
     """Validate a canonical table DataFrame against the registered schema."""
 
@@ -335,13 +384,21 @@ def validate_connector_schema(
 ) -> pd.DataFrame:
     """Validate a connector payload against the registered schema."""
 
-    return _validate(source_id, frame, mapping=CONNECTOR_SCHEMAS, kind="connector", lazy=lazy)
+    validated = _validate(
+        source_id, frame, mapping=CONNECTOR_SCHEMAS, kind="connector", lazy=lazy
+    )
+    fingerprint = connector_schema_fingerprint(source_id)
+    if fingerprint is not None:
+        validated.attrs[SCHEMA_FINGERPRINT_ATTR] = fingerprint
+    return validated
 
 
 __all__ = [
     "CONNECTOR_SCHEMAS",
+    "SCHEMA_FINGERPRINT_ATTR",
     "SchemaKind",
     "TABLE_SCHEMAS",
+    "connector_schema_fingerprint",
     "validate_connector_schema",
     "validate_table_schema",
 ]
@@ -0,0 +1,300 @@
+"""Portable cache snapshots for bootstrapping offline machines and CI runners.
+
+A bundle is a gzip-compressed tar holding ``manifest.json`` (the selected
+``cache_index`` rows plus a SHA-256 and size for every artifact) followed by
+the artifact files under ``files/<relative path>``.  :func:`import_bundle`
+verifies every checksum before touching the index, writes artifacts next to
+their final location and renames them into place, then merges the index rows
+in one transaction, so the importing cache serves the keys without a refetch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import tarfile
+from dataclasses import dataclass, replace
+from pathlib import Path, PurePosixPath
+from typing import IO, Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from west_housing_model.core.exceptions import CacheError
+from west_housing_model.data.cache_backend import record_from_json, record_to_json
+from west_housing_model.data.repository import (
+    CacheIndexRecord,
+    CacheStore,
+    _file_sha256,
+    _key_hash,
+    _temp_sibling,
+    _utcnow,
+)
+from west_housing_model.utils.logging import LogContext
+from west_housing_model.utils.logging import info as log_info
+
+BUNDLE_FORMAT = "west-housing-model/cache-bundle"
+BUNDLE_VERSION = 1
+_MANIFEST_NAME = "manifest.json"
+_FILES_PREFIX = "files"
+_CHUNK = 1024 * 1024
+
+KeyId = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class BundleReport:
+    """Outcome of an export or import; ``skipped`` keys were already newer locally."""
+
+    path: Path
+    records: int
+    files: int
+    bytes: int
+    skipped: int = 0
+
+
+def load_key_manifest(path: Path) -> List[KeyId]:
+    """Read ``[{"source_id": ..., "key_hash": ...} | {"source_id": ..., "query": {...}}]``."""
+
+    try:
+        entries = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise CacheError("Unreadable bundle manifest", context={"path": str(path)}) from exc
+    keys: List[KeyId] = []
+    for entry in entries:
+        source_id = str(entry["source_id"])
+        if "key_hash" in entry:
+            keys.append((source_id, str(entry["key_hash"])))
+        else:
+            keys.append((source_id, _key_hash(source_id, entry.get("query", {}))))
+    return keys
+
+
+def _select(
+    store: CacheStore,
+    sources: Optional[Iterable[str]],
+    as_of_from: Optional[str],
+    as_of_to: Optional[str],
+    keys: Optional[Iterable[KeyId]],
+) -> List[CacheIndexRecord]:
+    wanted_sources = set(sources) if sources is not None else None
+    wanted_keys = set(keys) if keys is not None else None
+    selected: List[CacheIndexRecord] = []
+    for record in store.index.records():
+        if wanted_sources is not None and record.source_id not in wanted_sources:
+            continue
+        if wanted_keys is not None and (record.source_id, record.key_hash) not in wanted_keys:
+            continue
+        if as_of_from is not None or as_of_to is not None:
+            if record.as_of is None:
+                continue
+            if as_of_from is not None and record.as_of < as_of_from:
+                continue
+            if as_of_to is not None and record.as_of > as_of_to:
+                continue
+        if not (store.root / record.relative_path).exists():
+            continue
+        selected.append(record)
+    return selected
+
+
+def export_bundle(
+    store: CacheStore,
+    path: Path,
+    *,
+    sources: Optional[Iterable[str]] = None,
+    as_of_from: Optional[str] = None,
+    as_of_to: Optional[str] = None,
+    keys: Optional[Iterable[KeyId]] = None,
+) -> BundleReport:
+    """Pack the selected index rows and their artifacts into ``path``.
+
+    Filters combine: ``sources`` limits by source id, ``as_of_from``/``as_of_to``
+    keep rows whose ``as_of`` falls in the inclusive range (rows without an
+    ``as_of`` are dropped when a range is given), and ``keys`` restricts to
+    explicit ``(source_id, key_hash)`` pairs.  Artifacts shared by several
+    keys (content-addressed blobs, partition files) are stored once.
+    """
+
+    records = _select(store, sources, as_of_from, as_of_to, keys)
+    files: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        name = PurePosixPath(record.relative_path).as_posix()
+        if name not in files:
+            artifact = store.root / record.relative_path
+            files[name] = {"sha256": _file_sha256(artifact), "bytes": artifact.stat().st_size}
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "created_at": _utcnow().isoformat(),
+        "records": [record_to_json(record) for record in records],
+        "files": files,
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temp_sibling(path.parent, path.name)
+    try:
+        with tarfile.open(tmp_path, "w:gz") as bundle:
+            payload = json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+            info = tarfile.TarInfo(_MANIFEST_NAME)
+            info.size = len(payload)
+            bundle.addfile(info, io.BytesIO(payload))
+            for name in files:
+                bundle.add(store.root / name, arcname=f"{_FILES_PREFIX}/{name}", recursive=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    report = BundleReport(
+        path=path,
+        records=len(records),
+        files=len(files),
+        bytes=path.stat().st_size,
+    )
+    log_info(
+        LogContext(event="cache.bundle", module="data.snapshot", action="export"),
+        "bundle.export",
+        path=str(path),
+        records=report.records,
+        files=report.files,
+        bytes=report.bytes,
+    )
+    return report
+
+
+def _read_manifest(bundle: tarfile.TarFile, path: Path) -> Dict[str, Any]:
+    try:
+        handle = bundle.extractfile(_MANIFEST_NAME)
+    except KeyError:
+        handle = None
+    if handle is None:
+        raise CacheError("Bundle has no manifest", context={"path": str(path)})
+    manifest: Dict[str, Any] = json.load(handle)
+    if manifest.get("format") != BUNDLE_FORMAT or manifest.get("version") != BUNDLE_VERSION:
+        raise CacheError(
+            "Unsupported cache bundle",
+            context={
+                "path": str(path),
+                "format": manifest.get("format"),
+                "version": manifest.get("version"),
+            },
+        )
+    return manifest
+
+
+def _safe_target(root: Path, name: str) -> Path:
+    relative = PurePosixPath(name)
+    if relative.is_absolute() or ".." in relative.parts:
+        raise CacheError("Bundle entry escapes the cache root", context={"entry": name})
+    return root.joinpath(*relative.parts)
+
+
+def _copy_verified(source: IO[bytes], target: Path, expected: str, name: str) -> None:
+    """Stream ``source`` to a temp sibling of ``target`` and rename it if the digest matches."""
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temp_sibling(target.parent, target.name)
+    digest = hashlib.sha256()
+    try:
+        with open(tmp_path, "wb") as handle:
+            for chunk in iter(lambda: source.read(_CHUNK), b""):
+                digest.update(chunk)
+                handle.write(chunk)
+            handle.flush()
+            os.fsync(handle.fileno())
+        if digest.hexdigest() != expected:
+            raise CacheError(
+                "Bundle checksum mismatch",
+                context={"entry": name, "expected": expected, "actual": digest.hexdigest()},
+            )
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def import_bundle(store: CacheStore, path: Path, *, overwrite: bool = False) -> BundleReport:
+    """Merge a bundle written by :func:`export_bundle` into ``store``.
+
+    Every artifact is checksum-verified before any index row is written; a
+    corrupt bundle raises :class:`CacheError` and leaves the index untouched.
+    Keys that already have a newer (or equally new) servable artifact locally
+    are skipped unless ``overwrite`` is set.  Imported rows keep their original
+    ``created_at`` so TTLs stay honest.
+    """
+
+    if not path.exists():
+        raise CacheError("Bundle not found", context={"path": str(path)})
+    try:
+        bundle = tarfile.open(path, "r:gz")
+    except (tarfile.TarError, OSError) as exc:
+        raise CacheError("Unreadable cache bundle", context={"path": str(path)}) from exc
+
+    with bundle:
+        manifest = _read_manifest(bundle, path)
+        records = [record_from_json(item) for item in manifest.get("records", [])]
+        files: Mapping[str, Mapping[str, Any]] = manifest.get("files", {})
+
+        accepted: List[CacheIndexRecord] = []
+        skipped = 0
+        for record in records:
+            existing = store.index.lookup(record.source_id, record.key_hash)
+            if (
+                not overwrite
+                and existing is not None
+                and existing.created_at >= record.created_at
+                and (store.root / existing.relative_path).exists()
+            ):
+                skipped += 1
+                continue
+            accepted.append(replace(record, last_accessed_at=None))
+
+        needed = {PurePosixPath(record.relative_path).as_posix() for record in accepted}
+        missing = needed - set(files)
+        if missing:
+            raise CacheError(
+                "Bundle manifest references unknown files",
+                context={"path": str(path), "files": sorted(missing)[:5]},
+            )
+        copied = 0
+        for name in sorted(needed):
+            target = _safe_target(store.root, name)
+            if target.exists() and _file_sha256(target) == files[name]["sha256"]:
+                continue
+            try:
+                source = bundle.extractfile(f"{_FILES_PREFIX}/{name}")
+            except KeyError:
+                source = None
+            if source is None:
+                raise CacheError("Bundle is missing an artifact", context={"entry": name})
+            with source:
+                _copy_verified(source, target, str(files[name]["sha256"]), name)
+            copied += 1
+
+    store.index.bulk_upsert(accepted)
+    report = BundleReport(
+        path=path,
+        records=len(accepted),
+        files=copied,
+        bytes=path.stat().st_size,
+        skipped=skipped,
+    )
+    log_info(
+        LogContext(event="cache.bundle", module="data.snapshot", action="import"),
+        "bundle.import",
+        path=str(path),
+        records=report.records,
+        files=report.files,
+        skipped=report.skipped,
+    )
+    return report
+
+
+__all__ = [
+    "BUNDLE_FORMAT",
+    "BUNDLE_VERSION",
+    "BundleReport",
+    "export_bundle",
+    "import_bundle",
+    "load_key_manifest",
+]
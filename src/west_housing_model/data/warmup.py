@@ -0,0 +1,342 @@
+"""Cache warm-up planner for a portfolio of properties.
+
+Every connector query that the site, place and ops builders issue for a
+property is a pure function of its coordinates, tract, county and place.
+:func:`plan_queries` derives that set (deduplicated per source) from a
+portfolio file, :meth:`Repository.missing_queries` diffs it against the cache
+index, and :func:`warm_cache` fetches only the missing or expired keys with
+one batched :meth:`Repository.get_many` call per source.  Upstream requests
+are paced per source by the process-wide token buckets in
+:mod:`west_housing_model.data.rate_limit`, configured from the registry
+``rate_limit`` strings.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import pandas as pd
+
+from west_housing_model.core.exceptions import SchemaError
+from west_housing_model.data.connectors import STATE_FIPS_TO_ABBR
+from west_housing_model.data.rate_limit import SharedRateState, configure_rate_limits
+from west_housing_model.data.repository import Repository, RepositoryBatchResult
+from west_housing_model.utils.logging import LogContext
+from west_housing_model.utils.logging import info as log_info
+from west_housing_model.utils.logging import warning as log_warning
+
+DEFAULT_WARMUP_WORKERS = 8
+DEFAULT_ACS_TABLES: Tuple[str, ...] = ("B19013_001E",)
+
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass(frozen=True)
+class PortfolioProperty:
+    """Location keys for one property; any of them may be unknown."""
+
+    property_id: str
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    tract: Optional[str] = None
+    county: Optional[str] = None
+    place_id: Optional[str] = None
+    state: Optional[str] = None
+
+    @property
+    def county_fips(self) -> Optional[str]:
+        """Five-digit state+county FIPS, derived from the tract when absent."""
+
+        if self.county:
+            return self.county.zfill(5)
+        if self.tract and len(self.tract) == 11:
+            return self.tract[:5]
+        return None
+
+    @property
+    def state_abbr(self) -> Optional[str]:
+        if self.state:
+            return self.state.upper()
+        county = self.county_fips
+        return STATE_FIPS_TO_ABBR.get(county[:2]) if county else None
+
+
+def _optional_text(value: Any) -> Optional[str]:
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    text = _optional_text(value)
+    return float(text) if text is not None else None
+
+
+def load_portfolio(path: Path) -> List[PortfolioProperty]:
+    """Read a portfolio from CSV or JSON (a list of property records)."""
+
+    if not path.exists():
+        raise SchemaError("Portfolio file not found", context={"path": str(path)})
+    if path.suffix.lower() == ".json":
+        rows = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(rows, Mapping):
+            rows = rows.get("properties", [])
+    else:
+        rows = pd.read_csv(path, dtype=str, keep_default_na=False).to_dict(orient="records")
+
+    properties: List[PortfolioProperty] = []
+    for position, row in enumerate(rows):
+        property_id = _optional_text(row.get("property_id")) or f"row-{position + 1}"
+        try:
+            lat = _optional_float(row.get("lat"))
+            lon = _optional_float(row.get("lon"))
+        except ValueError as exc:
+            raise SchemaError(
+                "Portfolio coordinates must be numeric",
+                context={"path": str(path), "property_id": property_id},
+            ) from exc
+        properties.append(
+            PortfolioProperty(
+                property_id=property_id,
+                lat=lat,
+                lon=lon,
+                tract=_optional_text(row.get("tract")),
+                county=_optional_text(row.get("county")),
+                place_id=_optional_text(row.get("place_id")),
+                state=_optional_text(row.get("state")),
+            )
+        )
+    return properties
+
+
+def property_queries(
+    prop: PortfolioProperty, acs_tables: Iterable[str] = DEFAULT_ACS_TABLES
+) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    """Yield ``(source_id, query)`` for every connector lookup one property needs."""
+
+    county = prop.county_fips
+    state = prop.state_abbr
+    if county:
+        for table in acs_tables:
+            acs_query = {"state": county[:2], "county": county[2:], "table": table}
+            yield "connector.census_acs", acs_query
+        yield "connector.noaa_storm_events", {"county_id": county}
+    if prop.tract:
+        yield "connector.usfs_wildfire", {"geo_id": prop.tract}
+        yield "connector.fcc_bdc", {"geo_id": prop.tract}
+        yield "connector.hud_fmr", {"geo_id": prop.tract}
+    if prop.lat is not None and prop.lon is not None:
+        yield "connector.usgs_designmaps", {"lat": prop.lat, "lon": prop.lon}
+    if prop.place_id:
+        for source_id in ("connector.pad_us", "connector.usfs_trails", "connector.usgs_epqs"):
+            yield source_id, {"place_id": prop.place_id}
+    if state:
+        yield "connector.eia_v2", {"state": state}
+
+
+@dataclass(frozen=True)
+class WarmupPlan:
+    """Distinct connector queries per source, in first-seen order."""
+
+    queries: Mapping[str, Tuple[Dict[str, Any], ...]]
+    properties: int
+
+    @property
+    def total(self) -> int:
+        return sum(len(queries) for queries in self.queries.values())
+
+
+def plan_queries(
+    properties: Iterable[PortfolioProperty],
+    *,
+    sources: Optional[Iterable[str]] = None,
+    acs_tables: Iterable[str] = DEFAULT_ACS_TABLES,
+) -> WarmupPlan:
+    """Derive every connector query the feature builders need for ``properties``.
+
+    ``sources`` restricts the plan (e.g. to the registered connectors).
+    Queries shared by several properties (same county, tract or state) appear
+    once.
+    """
+
+    allowed = set(sources) if sources is not None else None
+    tables = tuple(acs_tables)
+    seen: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    count = 0
+    for prop in properties:
+        count += 1
+        for source_id, query in property_queries(prop, tables):
+            if allowed is not None and source_id not in allowed:
+                continue
+            signature = json.dumps(query, sort_keys=True, default=str)
+            seen.setdefault(source_id, {}).setdefault(signature, query)
+    return WarmupPlan(
+        queries={source_id: tuple(items.values()) for source_id, items in seen.items()},
+        properties=count,
+    )
+
+
+@dataclass
+class SourceWarmup:
+    """Per-source outcome of a warm-up run."""
+
+    source_id: str
+    planned: int = 0
+    cached: int = 0
+    fetched: int = 0
+    failed: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def missing(self) -> int:
+        return self.planned - self.cached
+
+
+@dataclass(frozen=True)
+class WarmupSummary:
+    """Result of :func:`warm_cache`; ``fetched`` is zero for a dry run."""
+
+    sources: Tuple[SourceWarmup, ...]
+    duration_s: float
+    dry_run: bool
+
+    @property
+    def planned(self) -> int:
+        return sum(item.planned for item in self.sources)
+
+    @property
+    def missing(self) -> int:
+        return sum(item.missing for item in self.sources)
+
+    @property
+    def fetched(self) -> int:
+        return sum(item.fetched for item in self.sources)
+
+    @property
+    def failed(self) -> int:
+        return sum(item.failed for item in self.sources)
+
+
+def warm_cache(
+    repo: Repository,
+    plan: WarmupPlan,
+    *,
+    max_workers: int = DEFAULT_WARMUP_WORKERS,
+    rate_limits: Optional[Mapping[str, str]] = None,
+    rate_state: Optional[SharedRateState] = None,
+    progress: Optional[ProgressCallback] = None,
+    dry_run: bool = False,
+) -> WarmupSummary:
+    """Fetch the planned queries that are missing or expired in ``repo``'s cache.
+
+    Each source's missing queries are resolved by one
+    :meth:`Repository.get_many` call, so bulk connectors answer them with a
+    single ``fetch_many`` request; sources warm concurrently, each with up to
+    ``max_workers`` fetch threads.  ``rate_limits`` (registry strings such as
+    ``"10/s"`` or ``"10/s burst 20"``) are installed as the process-wide
+    token buckets the HTTP clients draw from before each upstream request;
+    ``rate_state`` shares those buckets with other processes.  Failures are
+    counted per source rather than aborting the run.  ``progress`` is called
+    with ``(done, total)`` queries after each source settles.
+    """
+
+    started = time.monotonic()
+    context = LogContext(event="repository.warmup", module="data.warmup", action="warm")
+    outcomes: Dict[str, SourceWarmup] = {}
+    batches: Dict[str, List[Dict[str, Any]]] = {}
+    for source_id, queries in plan.queries.items():
+        missing = repo.missing_queries(source_id, queries)
+        outcomes[source_id] = SourceWarmup(
+            source_id=source_id, planned=len(queries), cached=len(queries) - len(missing)
+        )
+        if missing:
+            batches[source_id] = missing
+    total = sum(len(missing) for missing in batches.values())
+    log_info(
+        context,
+        "warmup.plan",
+        properties=plan.properties,
+        planned=plan.total,
+        missing=total,
+        dry_run=dry_run,
+    )
+
+    if not dry_run and batches:
+        if rate_limits is not None:
+            configure_rate_limits(rate_limits, state=rate_state)
+
+        def _warm(source_id: str) -> RepositoryBatchResult:
+            return repo.get_many(
+                source_id, batches[source_id], max_workers=max_workers, return_exceptions=True
+            )
+
+        if progress is not None:
+            progress(0, total)
+        done = 0
+        with ThreadPoolExecutor(
+            max_workers=len(batches), thread_name_prefix="whm-warmup"
+        ) as executor:
+            futures = {executor.submit(_warm, source_id): source_id for source_id in batches}
+            for future in as_completed(futures):
+                source_id = futures[future]
+                outcome = outcomes[source_id]
+                try:
+                    batch = future.result()
+                except Exception as exc:
+                    # Raised before any query settled (e.g. an unknown source id).
+                    outcome.failed += len(batches[source_id])
+                    outcome.errors.append(str(exc))
+                    log_warning(context, "warmup.error", source_id=source_id, error=str(exc))
+                else:
+                    outcome.fetched += len(batch.results)
+                    outcome.failed += len(batch.errors)
+                    for query, error in batch.errors:
+                        outcome.errors.append(f"{query}: {error}")
+                        log_warning(
+                            context,
+                            "warmup.error",
+                            source_id=source_id,
+                            query=query,
+                            error=str(error),
+                        )
+                done += len(batches[source_id])
+                if progress is not None:
+                    progress(done, total)
+
+    summary = WarmupSummary(
+        sources=tuple(outcomes[source_id] for source_id in sorted(outcomes)),
+        duration_s=time.monotonic() - started,
+        dry_run=dry_run,
+    )
+    log_method = log_warning if summary.failed else log_info
+    log_method(
+        context,
+        "warmup.complete",
+        status="error" if summary.failed else "ok",
+        planned=summary.planned,
+        missing=summary.missing,
+        fetched=summary.fetched,
+        failed=summary.failed,
+        duration_s=round(summary.duration_s, 3),
+    )
+    return summary
+
+
+__all__ = [
+    "DEFAULT_ACS_TABLES",
+    "DEFAULT_WARMUP_WORKERS",
+    "PortfolioProperty",
+    "SourceWarmup",
+    "WarmupPlan",
+    "WarmupSummary",
+    "load_portfolio",
+    "plan_queries",
+    "property_queries",
+    "warm_cache",
+]
@@ -1,4 +1,4 @@
-"""Runtime settings helpers for scoring weights.
+"""Runtime settings helpers for scoring weights and cache tuning.
 
 Weights can be overridden via environment variables; defaults follow the
 architecture spec (equal weights for pillars, 45/35/20 for returns).
@@ -7,7 +7,9 @@ architecture spec (equal weights for pillars, 45/35/20 for returns).
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Dict
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
 
 if TYPE_CHECKING:
     from west_housing_model.scoring.deal_quality import ReturnsWeights
@@ -56,4 +58,31 @@ def get_returns_weights() -> "ReturnsWeights":
     )
 
 
-__all__ = ["get_pillar_weights", "get_returns_weights"]
+def get_negative_cache_ttl() -> Optional[timedelta]:
+    """How long connector failures are remembered (``WHM_NEGATIVE_CACHE_TTL_S``; 0 disables)."""
+
+    seconds = _get_env_float("WHM_NEGATIVE_CACHE_TTL_S", 900.0)
+    return timedelta(seconds=seconds) if seconds > 0 else None
+
+
+def get_shared_cache_dir() -> Optional[Path]:
+    """Shared L2 cache directory (``WEST_HOUSING_MODEL_SHARED_CACHE``), if configured."""
+
+    raw = os.getenv("WEST_HOUSING_MODEL_SHARED_CACHE")
+    return Path(raw) if raw else None
+
+
+def get_rate_limit_state_path() -> Optional[Path]:
+    """SQLite file shared by worker processes for rate limiting (``WHM_RATE_LIMIT_STATE``)."""
+
+    raw = os.getenv("WHM_RATE_LIMIT_STATE")
+    return Path(raw) if raw else None
+
+
+__all__ = [
+    "get_negative_cache_ttl",
+    "get_pillar_weights",
+    "get_rate_limit_state_path",
+    "get_returns_weights",
+    "get_shared_cache_dir",
+]
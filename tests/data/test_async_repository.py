@@ -0,0 +1,107 @@
+"""Tests for the asyncio repository facade."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any, List
+
+import pandas as pd
+
+from west_housing_model.data.async_repository import AsyncRepository, async_connector
+from west_housing_model.data.connectors import callable_connector
+from west_housing_model.data.repository import STATUS_FRESH, STATUS_REFRESHED, Repository
+from west_housing_model.data.warmup import PortfolioProperty, property_queries
+
+
+def _geo_frame(source_id: str, value_column: str, geo_id: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "geo_id": [geo_id],
+            value_column: [1.0],
+            "observed_at": ["2025-01-01"],
+            "source_id": [source_id],
+        }
+    )
+
+
+def test_gather_fans_out_across_sources_concurrently(tmp_path: Path) -> None:
+    sources = {
+        "connector.hud_fmr": "hud_fmr_2br",
+        "connector.usfs_wildfire": "wildfire_risk_percentile",
+        "connector.fcc_bdc": "broadband_gbps_flag",
+    }
+    # Every fetch waits for the others: this only completes if they overlap.
+    barrier = threading.Barrier(len(sources), timeout=5)
+
+    def _make(source_id: str, column: str):
+        def _fetch(geo_id: str, **_: Any) -> pd.DataFrame:
+            barrier.wait()
+            return _geo_frame(source_id, column, geo_id)
+
+        return callable_connector(source_id, _fetch)
+
+    repo = Repository(
+        {source_id: _make(source_id, column) for source_id, column in sources.items()},
+        cache_dir=tmp_path,
+    )
+    site = PortfolioProperty(property_id="s-1", tract="08031001000")
+    requests = [(sid, q) for sid, q in property_queries(site) if sid in sources]
+    assert sorted(sid for sid, _ in requests) == sorted(sources)
+
+    async def _run() -> List[Any]:
+        async with AsyncRepository(repo) as arepo:
+            first = await arepo.gather(requests)
+            second = await arepo.gather(requests)
+        return [first, second]
+
+    first, second = asyncio.run(_run())
+    assert [result.status for result in first] == [STATUS_REFRESHED] * 3
+    assert [result.status for result in second] == [STATUS_FRESH] * 3
+    assert [result.source_id for result in first] == [sid for sid, _ in requests]
+
+
+def test_native_async_connector_runs_on_caller_loop_with_source_limit(tmp_path: Path) -> None:
+    in_flight = 0
+    peak = 0
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    async def _fetch(state: str, **_: Any) -> pd.DataFrame:
+        nonlocal in_flight, peak
+        loops.append(asyncio.get_running_loop())
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return pd.DataFrame(
+            {
+                "state": [state],
+                "res_price_cents_per_kwh": [14.2],
+                "observed_at": ["2025-01-01"],
+                "source_id": ["connector.eia_v2"],
+            }
+        )
+
+    connector = async_connector("connector.eia_v2", _fetch)
+    repo = Repository({"connector.eia_v2": connector}, cache_dir=tmp_path)
+    states = ["CO", "UT", "ID", "NM"]
+
+    async def _run() -> List[Any]:
+        arepo = AsyncRepository(repo, source_concurrency={"connector.eia_v2": 1})
+        try:
+            results = await arepo.gather(
+                [("connector.eia_v2", {"state": state}) for state in states]
+            )
+            return [results, asyncio.get_running_loop()]
+        finally:
+            arepo.close()
+
+    results, loop = asyncio.run(_run())
+    assert [result.frame["state"].iloc[0] for result in results] == states
+    assert peak == 1
+    assert loops and all(seen is loop for seen in loops)
+
+    # Outside an event loop the same connector still works synchronously.
+    sync_repo = Repository({"connector.eia_v2": connector}, cache_dir=tmp_path / "sync")
+    assert sync_repo.get("connector.eia_v2", state="WY").status == STATUS_REFRESHED
@@ -0,0 +1,182 @@
+"""Tests for cache storage backends and the shared L2 read-through."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, List
+
+import pandas as pd
+import pytest
+
+from west_housing_model.data import cache_backend
+from west_housing_model.data.cache_backend import LocalBackend, SharedDirBackend
+from west_housing_model.data.connectors import BulkDataConnector, callable_connector
+from west_housing_model.data.repository import STATUS_FRESH, STATUS_REFRESHED, Repository
+
+SOURCE_ID = "connector.hud_fmr"
+
+
+def _counting_connector(calls: List[str]):
+    def _fetch(geo_id: str, **_: Any) -> pd.DataFrame:
+        calls.append(geo_id)
+        return pd.DataFrame(
+            {
+                "geo_id": [geo_id],
+                "hud_fmr_2br": [1450.0],
+                "observed_at": ["2025-01-01"],
+                "source_id": [SOURCE_ID],
+            }
+        )
+
+    return callable_connector(SOURCE_ID, _fetch)
+
+
+def test_workers_share_one_warm_cache_through_shared_dir(tmp_path: Path) -> None:
+    shared = SharedDirBackend(tmp_path / "shared")
+    first_calls: List[str] = []
+    second_calls: List[str] = []
+    first = Repository(
+        {SOURCE_ID: _counting_connector(first_calls)},
+        cache_dir=tmp_path / "worker-a",
+        shared_cache=shared,
+    )
+    second = Repository(
+        {SOURCE_ID: _counting_connector(second_calls)},
+        cache_dir=tmp_path / "worker-b",
+        shared_cache=shared,
+    )
+
+    assert first.get(SOURCE_ID, geo_id="08031").status == STATUS_REFRESHED
+    published = shared.list_rows(SOURCE_ID)
+    assert len(published) == 1
+    assert shared.list_blobs(SOURCE_ID) == [published[0].relative_path]
+
+    result = second.get(SOURCE_ID, geo_id="08031")
+    assert result.status == STATUS_FRESH
+    assert result.frame["hud_fmr_2br"].tolist() == [1450.0]
+    assert second_calls == []
+    # The blob is now in worker B's L1, so later reads never touch the L2.
+    assert (tmp_path / "worker-b" / published[0].relative_path).exists()
+    assert second.store.index.lookup(SOURCE_ID, published[0].key_hash) is not None
+
+    # A shared mount works for offline workers too.
+    offline = Repository(
+        {SOURCE_ID: _counting_connector([])},
+        cache_dir=tmp_path / "worker-c",
+        shared_cache=shared,
+        offline=True,
+    )
+    assert offline.get(SOURCE_ID, geo_id="08031").frame.shape[0] == 1
+    for repo in (first, second, offline):
+        repo.close()
+
+
+def test_get_many_reads_shared_dir_before_bulk_fetching(tmp_path: Path) -> None:
+    shared = SharedDirBackend(tmp_path / "shared")
+    bulk_calls: List[List[str]] = []
+
+    def _fetch_many(queries: Any) -> pd.DataFrame:
+        geo_ids = [query["geo_id"] for query in queries]
+        bulk_calls.append(geo_ids)
+        return pd.DataFrame(
+            {
+                "geo_id": geo_ids,
+                "hud_fmr_2br": [1450.0] * len(geo_ids),
+                "observed_at": ["2025-01-01"] * len(geo_ids),
+                "source_id": [SOURCE_ID] * len(geo_ids),
+            }
+        )
+
+    def _worker(name: str) -> Repository:
+        connector = BulkDataConnector(
+            source_id=SOURCE_ID,
+            fetch_func=_counting_connector([]).fetch_func,
+            fetch_many_func=_fetch_many,
+        )
+        return Repository({SOURCE_ID: connector}, cache_dir=tmp_path / name, shared_cache=shared)
+
+    first, second = _worker("worker-a"), _worker("worker-b")
+    queries = [{"geo_id": "08031"}, {"geo_id": "49035"}]
+    assert [result.status for result in first.get_many(SOURCE_ID, queries)] == [
+        STATUS_REFRESHED
+    ] * 2
+    assert len(shared.list_rows(SOURCE_ID)) == 2
+
+    # Worker B serves both keys from the L2 and bulk-fetches only the new one.
+    batch = second.get_many(SOURCE_ID, [*queries, {"geo_id": "16001"}])
+    assert [result.status for result in batch] == [STATUS_FRESH, STATUS_FRESH, STATUS_REFRESHED]
+    assert bulk_calls == [["08031", "49035"], ["16001"]]
+    for repo in (first, second):
+        repo.close()
+
+
+def test_corrupt_shared_blob_is_ignored(tmp_path: Path) -> None:
+    shared = SharedDirBackend(tmp_path / "shared")
+    writer = Repository(
+        {SOURCE_ID: _counting_connector([])}, cache_dir=tmp_path / "a", shared_cache=shared
+    )
+    writer.get(SOURCE_ID, geo_id="08031")
+    (relative,) = shared.list_blobs(SOURCE_ID)
+    (shared.blob_root / relative).write_bytes(b"truncated")
+
+    calls: List[str] = []
+    reader = Repository(
+        {SOURCE_ID: _counting_connector(calls)}, cache_dir=tmp_path / "b", shared_cache=shared
+    )
+    assert reader.get(SOURCE_ID, geo_id="08031").status == STATUS_REFRESHED
+    assert calls == ["08031"]
+    assert not list((tmp_path / "b").rglob("*.tmp"))
+    for repo in (writer, reader):
+        repo.close()
+
+
+def test_backends_support_row_and_blob_crud(tmp_path: Path) -> None:
+    repo = Repository({SOURCE_ID: _counting_connector([])}, cache_dir=tmp_path / "l1")
+    repo.get(SOURCE_ID, geo_id="08031")
+    (record,) = repo.store.index.records(SOURCE_ID)
+    artifact = repo.store.root / record.relative_path
+
+    for backend in (LocalBackend(tmp_path / "local"), SharedDirBackend(tmp_path / "nfs")):
+        backend.put_blob(record.relative_path, artifact)
+        backend.put_row(record)
+        assert backend.get_row(SOURCE_ID, record.key_hash) == record
+        assert [row.key_hash for row in backend.list_rows()] == [record.key_hash]
+        assert backend.list_blobs() == [record.relative_path]
+        copy = tmp_path / f"{type(backend).__name__}.copy"
+        assert backend.get_blob(record.relative_path, copy)
+        assert copy.read_bytes() == artifact.read_bytes()
+
+        backend.delete_row(SOURCE_ID, record.key_hash)
+        backend.delete_blob(record.relative_path)
+        assert backend.get_row(SOURCE_ID, record.key_hash) is None
+        assert not backend.get_blob(record.relative_path, copy)
+    repo.close()
+
+
+def test_shared_dir_fsyncs_before_publishing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    events: List[str] = []
+    real_fsync, real_replace = cache_backend._fsync_file, cache_backend.os.replace
+
+    def _fsync(path: Path) -> None:
+        events.append(f"fsync:{Path(path).suffix}")
+        real_fsync(path)
+
+    def _replace(source: Any, target: Any) -> None:
+        events.append(f"replace:{Path(target).suffix}")
+        real_replace(source, target)
+
+    monkeypatch.setattr(cache_backend, "_fsync_file", _fsync)
+    monkeypatch.setattr(cache_backend.os, "replace", _replace)
+    repo = Repository({SOURCE_ID: _counting_connector([])}, cache_dir=tmp_path / "l1")
+    repo.get(SOURCE_ID, geo_id="08031")
+    (record,) = repo.store.index.records(SOURCE_ID)
+    shared = SharedDirBackend(tmp_path / "nfs")
+    events.clear()
+
+    shared.put_blob(record.relative_path, repo.store.root / record.relative_path)
+    shared.put_row(record)
+
+    assert events == ["fsync:.tmp", "replace:.parquet", "fsync:.tmp", "replace:.json"]
+    repo.close()
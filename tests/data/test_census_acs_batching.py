@@ -0,0 +1,139 @@
+"""Tests for batched, wide Census ACS requests."""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Dict, List, Mapping
+
+import pytest
+
+from west_housing_model.data.connectors import make_census_acs_connector
+from west_housing_model.data.connectors.census_acs import CensusAcsConfig, fetch_census_acs_wide
+
+_TRACTS = {"08": ("001", "000100"), "49": ("035", "101100"), "16": ("001", "020100")}
+
+
+class _FakeResponse:
+    def __init__(self, payload: List[List[str]]) -> None:
+        self.status_code = 200
+        self.headers: Dict[str, str] = {}
+        self.url = "https://api.census.test/data"
+        self._payload = payload
+        self.text = json.dumps(payload)
+
+    def json(self) -> List[List[str]]:
+        return self._payload
+
+
+class _AcsSession:
+    """Answers every chunk with two tracts per state, in a different order per chunk."""
+
+    def __init__(self) -> None:
+        self.requests: List[Mapping[str, Any]] = []
+
+    def get(self, url: str, params: Mapping[str, Any], headers=None, timeout=None) -> _FakeResponse:
+        self.requests.append(dict(params))
+        variables = params["get"].split(",")
+        state = params["in"].split()[0].split(":")[1]
+        county, tract = _TRACTS[state]
+        rows = [
+            [str(index + 1000) for index, _ in enumerate(variables)] + [state, county, tract],
+            ["-666666666"] * len(variables) + [state, county, "999999"],
+        ]
+        if len(self.requests) % 2 == 0:
+            rows.reverse()
+        return _FakeResponse([[*variables, "state", "county", "tract"], *rows])
+
+
+def test_wide_fetch_chunks_variables_and_uses_county_wildcard(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("CENSUS_API_KEY", "dummy")
+    session = _AcsSession()
+    variables = ["B19013_001E", "B25071_001E", "B11001_001E"]
+
+    wide = fetch_census_acs_wide(
+        states=["08", "49", "16"],
+        variables=variables,
+        config=CensusAcsConfig(max_variables=2),
+        session=session,
+    )
+
+    # Three states x two variable chunks, each covering every county.
+    assert len(session.requests) == 6
+    assert {params["in"] for params in session.requests} == {
+        "state:08 county:*",
+        "state:49 county:*",
+        "state:16 county:*",
+    }
+    assert [params["get"] for params in session.requests[:2]] == [
+        "B19013_001E,B25071_001E",
+        "B11001_001E",
+    ]
+    assert wide.shape[0] == 6
+    row = wide.set_index("geo_id").loc["49035101100"]
+    assert row["median_household_income"] == 1000.0
+    assert row["median_rent_burden_pct"] == 1001.0
+    # The second chunk's rows arrive in another order and still align by geo_id.
+    assert row["households"] == 1000.0
+    assert math.isnan(wide.set_index("geo_id").loc["08001999999", "households"])
+
+
+def test_connector_accepts_variable_and_county_lists(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CENSUS_API_KEY", "dummy")
+    session = _AcsSession()
+    monkeypatch.setattr(
+        "west_housing_model.data.connectors.pooled_session", lambda *_, **__: session
+    )
+    connector = make_census_acs_connector()
+
+    frame = connector.fetch(state="08", county="001,005", variables=["B11001_001E"])
+
+    assert [params["in"] for params in session.requests] == ["state:08 county:001,005"]
+    assert session.requests[0]["get"] == "B19013_001E,B11001_001E"
+    assert {"geo_id", "median_household_income", "households"}.issubset(frame.columns)
+    assert frame["geo_id"].tolist() == ["08001000100", "08001999999"]
+
+
+def test_connector_maps_non_default_table_to_income_column(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("CENSUS_API_KEY", "dummy")
+    session = _AcsSession()
+    monkeypatch.setattr(
+        "west_housing_model.data.connectors.pooled_session", lambda *_, **__: session
+    )
+    connector = make_census_acs_connector()
+
+    frame = connector.fetch(
+        state="08", county="005", table="B25071_001E", variables=["B19013_001E", "B11001_001E"]
+    )
+
+    assert session.requests[0]["get"] == "B25071_001E,B19013_001E,B11001_001E"
+    assert frame["median_household_income"].tolist()[0] == 1000.0
+    # Other variables keep their friendly names unless they would collide.
+    assert frame["households"].tolist()[0] == 1002.0
+    assert frame["B19013_001E"].tolist()[0] == 1001.0
+
+
+def test_wide_fetch_keeps_columns_of_an_empty_chunk(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CENSUS_API_KEY", "dummy")
+
+    class _EmptySecondChunk(_AcsSession):
+        def get(self, url: str, params: Mapping[str, Any], headers=None, timeout=None):
+            if params["get"] == "B11001_001E":
+                self.requests.append(dict(params))
+                return _FakeResponse([])
+            return super().get(url, params, headers=headers, timeout=timeout)
+
+    wide = fetch_census_acs_wide(
+        states=["08", "49"],
+        variables=["B19013_001E", "B25071_001E", "B11001_001E"],
+        config=CensusAcsConfig(max_variables=2),
+        session=_EmptySecondChunk(),
+    )
+
+    assert wide.shape[0] == 4
+    assert wide["households"].isna().all()
+    assert wide.set_index("geo_id").loc["49035101100", "median_household_income"] == 1000.0
@@ -0,0 +1,69 @@
+"""Tests for the asynchronous failure recorder."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from west_housing_model.data import failure_log
+from west_housing_model.data.failure_log import FailureRecorder, read_failures
+
+
+def test_recorder_dedupes_within_window_and_rotates(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("WEST_HOUSING_MODEL_FAILURE_CACHE", str(tmp_path))
+    clock = [0.0]
+    recorder = FailureRecorder(dedupe_window=60.0, max_file_bytes=1, monotonic=lambda: clock[0])
+    monkeypatch.setattr(failure_log, "FAILURES", recorder)
+
+    message = "PAD-US acres unavailable"
+    assert recorder.record("connector.pad_us", "repository-failure", message)
+    assert recorder.flush(timeout=5)
+    for _ in range(4):
+        assert not recorder.record("connector.pad_us", "repository-failure", message)
+    clock[0] += 61.0
+    assert recorder.record("connector.pad_us", "repository-failure", message)
+    assert recorder.record("connector.pad_us", "repository-failure", "other", details={"k": 1})
+
+    entries = read_failures("connector.pad_us")
+    assert [entry["message"] for entry in entries] == [
+        "PAD-US acres unavailable",
+        "PAD-US acres unavailable",
+        "other",
+    ]
+    assert entries[1]["suppressed_repeats"] == 4
+    assert entries[2]["k"] == 1
+    # max_file_bytes=1 rolls over to a new generation after every batch.
+    assert len(list((tmp_path / "connector.pad_us").glob("failures-*.jsonl"))) >= 2
+    stats = recorder.stats()
+    assert (stats.written, stats.deduplicated, stats.dropped) == (3, 4, 0)
+
+
+def test_recorder_drops_when_queue_is_full(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("WEST_HOUSING_MODEL_FAILURE_CACHE", str(tmp_path))
+    recorder = FailureRecorder(max_queue=2)
+    gate = threading.Event()
+    original = recorder._write_batch
+
+    def _blocked(batch: list) -> None:
+        gate.wait(timeout=5)
+        original(batch)
+
+    monkeypatch.setattr(recorder, "_write_batch", _blocked)
+
+    accepted = [
+        recorder.record("connector.fcc_bdc", "repository-failure", f"e{i}") for i in range(6)
+    ]
+    gate.set()
+    assert recorder.flush(timeout=5)
+
+    stats = recorder.stats()
+    assert stats.dropped == accepted.count(False) > 0
+    assert stats.written == accepted.count(True)
+
+
+@pytest.fixture(autouse=True)
+def _drain_global_recorder():
+    yield
+    failure_log.flush_failures(timeout=5)
@@ -0,0 +1,61 @@
+"""Tests for the shared keep-alive session registry."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+
+from west_housing_model.data.connectors.common import HttpFetcher, SessionRegistry
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def base_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_registry_reuses_one_session_and_connection_per_host(base_url: str) -> None:
+    registry = SessionRegistry(pool_maxsize=4)
+    session = registry.session_for(f"{base_url}/a")
+    assert registry.session_for(f"{base_url}/b?x=1") is session
+    assert registry.session_for(base_url, retries=0) is not session
+
+    first = HttpFetcher(base_url, session=registry.session_for(base_url))
+    second = HttpFetcher(base_url, session=registry.session_for(base_url))
+    assert first.get_json("one") == {"path": "/one"}
+    assert second.get_json("two") == {"path": "/two"}
+
+    (stats,) = registry.stats()
+    assert (stats.host, stats.requests, stats.connections) == ("127.0.0.1", 2, 1)
+    assert stats.reused == 1
+    registry.close()
+    assert registry.stats() == []
+
+
+def test_fetchers_default_to_the_process_registry(base_url: str) -> None:
+    assert HttpFetcher(base_url).session is HttpFetcher(f"{base_url}/v2").session
@@ -0,0 +1,79 @@
+"""Tests for the in-process LRU tier fronting cached artifacts."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from west_housing_model.data import repository as repository_module
+from west_housing_model.data.connectors import callable_connector
+from west_housing_model.data.memory_cache import MemoryCache, frame_nbytes
+from west_housing_model.data.repository import STATUS_FRESH, Repository
+
+
+def _frame(value: float) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "place_id": ["p-001"],
+            "metric": ["msa_jobs_t12"],
+            "value": [value],
+            "observed_at": ["2024-01-01"],
+            "source_id": ["connector.place_context"],
+        }
+    )
+
+
+def test_memory_cache_evicts_least_recently_used_by_count() -> None:
+    cache = MemoryCache(max_entries=2)
+    cache.put(("s", "a", 1), _frame(1.0))
+    cache.put(("s", "b", 1), _frame(2.0))
+    assert cache.get(("s", "a", 1)) is not None
+    cache.put(("s", "c", 1), _frame(3.0))
+
+    assert cache.get(("s", "b", 1)) is None
+    assert cache.get(("s", "a", 1)) is not None
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.evictions == 1
+    assert stats.hits == 2
+    assert stats.misses == 1
+
+
+def test_memory_cache_respects_byte_budget_and_returns_copies() -> None:
+    frame = _frame(1.0)
+    size = frame_nbytes(frame)
+    cache = MemoryCache(max_entries=10, max_bytes=size * 2)
+    for key in ("a", "b", "c"):
+        cache.put(("s", key, 1), frame)
+    assert cache.stats().entries == 2
+    assert cache.stats().bytes <= size * 2
+
+    served = cache.get(("s", "c", 1))
+    assert served is not None
+    served.loc[0, "value"] = 99.0
+    again = cache.get(("s", "c", 1))
+    assert again is not None and again.loc[0, "value"] == 1.0
+
+
+def test_repository_memory_tier_skips_disk_and_validation(tmp_path, monkeypatch) -> None:
+    connector = callable_connector("connector.place_context", lambda **_: _frame(4.2))
+    repo = Repository(
+        {"connector.place_context": connector},
+        cache_dir=tmp_path,
+        memory_cache=MemoryCache(),
+    )
+    repo.get("connector.place_context")
+    warm = repo.get("connector.place_context")
+    assert warm.status == STATUS_FRESH
+
+    def _fail(*_: object, **__: object) -> pd.DataFrame:
+        raise AssertionError("memory hit should not re-validate")
+
+    monkeypatch.setattr(repository_module, "validate_connector", _fail)
+    hot = repo.get("connector.place_context")
+
+    assert hot.status == STATUS_FRESH
+    pd.testing.assert_frame_equal(hot.frame, warm.frame)
+    stats = repo.memory_stats
+    assert stats is not None
+    assert stats.hits == 1
+    assert stats.misses == 1
@@ -4,17 +4,43 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
+import requests
 
-from west_housing_model.core.exceptions import ConnectorError, SchemaError
-from west_housing_model.data.connectors import callable_connector
+from west_housing_model.core.exceptions import CacheError, ConnectorError, SchemaError
+from west_housing_model.data import repository as repository_module
+from west_housing_model.data.catalog import connector_schema_fingerprint
+from west_housing_model.data.connectors import (
+    BulkDataConnector,
+    DataConnector,
+    callable_connector,
+)
+from west_housing_model.data.connectors.common import HttpFetcher
+from west_housing_model.data.connectors.hud_fmr import (
+    HUDFMRConfig,
+    fetch_hud_fmr,
+    fetch_hud_fmr_many,
+)
+from west_housing_model.data.failure_log import read_failures
 from west_housing_model.data.repository import (
+    FORMAT_ARROW,
+    PARQUET_ROW_GROUP_ROWS,
     STATUS_FRESH,
     STATUS_REFRESHED,
     STATUS_STALE,
+    CacheIndex,
+    CacheIndexRecord,
+    CacheStore,
+    PartitionSpec,
     Repository,
 )
 
@@ -42,8 +68,8 @@ def test_connector_captures_payload_on_schema_failure(tmp_path, monkeypatch) ->
     with pytest.raises(SchemaError):
         connector.fetch()
 
-    failure_dir = Path(tmp_path) / "connector.place_context"
-    assert list(failure_dir.glob("*.csv")), "schema failures should capture payload CSVs"
+    (entry,) = read_failures("connector.place_context")
+    assert entry["payload"] == [{"unexpected": 1}], "schema failures should capture the payload"
 
 
 def test_repository_returns_cached_frame_when_fresh(tmp_path) -> None:
@@ -125,8 +151,7 @@ def test_repository_returns_stale_on_connector_error(tmp_path, monkeypatch) -> N
     assert fallback.status == STATUS_STALE
     assert flaky.calls == 2
 
-    failure_dir = Path(tmp_path / "failures") / "connector.place_context"
-    assert list(failure_dir.glob("*.log")), "failures should be logged when falling back"
+    assert read_failures("connector.place_context"), "failures should be logged when falling back"
 
 
 def test_repository_raises_when_no_cache_available(tmp_path) -> None:
@@ -185,3 +210,824 @@ def test_repository_emits_structured_logs(tmp_path, caplog) -> None:
     assert final["status"] == STATUS_REFRESHED
     assert final["cache_key"]
     assert final["correlation_id"] == result.correlation_id
+
+
+def test_repository_get_many_batches_lookup_and_fetches_misses(tmp_path) -> None:
+    class Fetcher:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        def __call__(self, *, place_id: str, **_: object) -> pd.DataFrame:
+            self.calls.append(place_id)
+            frame = _valid_connector_frame()
+            frame["place_id"] = [place_id]
+            return frame
+
+    fetcher = Fetcher()
+    connector = callable_connector("connector.place_context", fetcher, ttl_seconds=86_400)
+    repo = Repository({"connector.place_context": connector}, cache_dir=tmp_path)
+    repo.get("connector.place_context", place_id="p-001")
+
+    queries = [
+        {"place_id": "p-002"},
+        {"place_id": "p-001"},
+        {"place_id": "p-003"},
+        {"place_id": "p-002"},
+    ]
+    batch = repo.get_many("connector.place_context", queries, max_workers=4)
+
+    assert [result.frame["place_id"].iloc[0] for result in batch] == [
+        "p-002",
+        "p-001",
+        "p-003",
+        "p-002",
+    ]
+    assert [result.status for result in batch] == [
+        STATUS_REFRESHED,
+        STATUS_FRESH,
+        STATUS_REFRESHED,
+        STATUS_REFRESHED,
+    ]
+    assert sorted(fetcher.calls) == ["p-001", "p-002", "p-003"], "duplicates fetch once"
+    assert batch.status_counts == {STATUS_REFRESHED: 3, STATUS_FRESH: 1}
+    assert batch.cache_hits == 1
+    assert batch.duration_ms >= 0
+
+    again = repo.get_many("connector.place_context", queries)
+    assert {result.status for result in again} == {STATUS_FRESH}
+    assert len(fetcher.calls) == 3
+
+
+def test_repository_get_many_raises_first_error_after_batch(tmp_path) -> None:
+    def fetcher(*, place_id: str, **_: object) -> pd.DataFrame:
+        if place_id == "missing":
+            raise RuntimeError("boom")
+        frame = _valid_connector_frame()
+        frame["place_id"] = [place_id]
+        return frame
+
+    connector = callable_connector("connector.place_context", fetcher)
+    repo = Repository({"connector.place_context": connector}, cache_dir=tmp_path)
+
+    with pytest.raises(ConnectorError):
+        repo.get_many("connector.place_context", [{"place_id": "missing"}, {"place_id": "p-1"}])
+
+    assert repo.get("connector.place_context", place_id="p-1").status == STATUS_FRESH
+
+
+def test_repository_get_many_shares_index_commits(tmp_path, monkeypatch) -> None:
+    arrived = threading.Barrier(4)
+
+    def fetcher(*, place_id: str, **_: object) -> pd.DataFrame:
+        arrived.wait(timeout=5)
+        frame = _valid_connector_frame()
+        frame["place_id"] = [place_id]
+        return frame
+
+    connector = callable_connector("connector.place_context", fetcher)
+    repo = Repository({"connector.place_context": connector}, cache_dir=tmp_path)
+    groups: list[int] = []
+    bulk_upsert = CacheIndex.bulk_upsert
+
+    def slow_commit(self, records) -> int:
+        records = list(records)
+        groups.append(len(records))
+        time.sleep(0.3)  # the other workers queue behind the first commit
+        return bulk_upsert(self, records)
+
+    monkeypatch.setattr(CacheIndex, "bulk_upsert", slow_commit)
+    monkeypatch.setattr(CacheIndex, "upsert", lambda *_: pytest.fail("per-key commit"))
+
+    places = [{"place_id": f"p-{index:03d}"} for index in range(4)]
+    batch = repo.get_many("connector.place_context", places, max_workers=4)
+
+    assert {result.status for result in batch} == {STATUS_REFRESHED}
+    assert sum(groups) == 4 and len(groups) < 4
+    assert len(repo.store.index.records("connector.place_context")) == 4
+    repo.close()
+
+
+def _race(*calls) -> None:
+    threads = [threading.Thread(target=call) for call in calls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+
+def test_concurrent_get_many_calls_fetch_a_key_once(tmp_path) -> None:
+    calls: list[str] = []
+
+    def fetcher(*, place_id: str, **_: object) -> pd.DataFrame:
+        calls.append(place_id)
+        # p-2 keeps the first batch open after p-1's key lock is released.
+        time.sleep(0.3 if place_id == "p-1" else 0.8)
+        frame = _valid_connector_frame()
+        frame["place_id"] = [place_id]
+        return frame
+
+    first, second = (
+        Repository(
+            {"connector.place_context": callable_connector("connector.place_context", fetcher)},
+            cache_dir=tmp_path,
+        )
+        for _ in range(2)
+    )
+    statuses: list[str] = []
+
+    def _late_caller() -> None:
+        time.sleep(0.1)
+        batch = second.get_many("connector.place_context", [{"place_id": "p-1"}])
+        statuses.extend(result.status for result in batch)
+
+    _race(
+        lambda: first.get_many(
+            "connector.place_context", [{"place_id": "p-1"}, {"place_id": "p-2"}]
+        ),
+        _late_caller,
+    )
+
+    assert sorted(calls) == ["p-1", "p-2"]
+    assert statuses == [STATUS_FRESH]
+    for repo in (first, second):
+        repo.close()
+
+
+def test_concurrent_bulk_get_many_calls_fetch_a_key_once(tmp_path) -> None:
+    calls: list[str] = []
+
+    def _fetch(geo_id: str, **_: object) -> pd.DataFrame:
+        calls.append(geo_id)
+        return fetch_hud_fmr(geo_id=geo_id)
+
+    def _fetch_many(queries) -> pd.DataFrame:
+        calls.extend(query["geo_id"] for query in queries)
+        time.sleep(0.3)
+        return fetch_hud_fmr_many(geo_ids=[query["geo_id"] for query in queries])
+
+    repos = [
+        Repository(
+            {
+                "connector.hud_fmr": BulkDataConnector(
+                    source_id="connector.hud_fmr", fetch_func=_fetch, fetch_many_func=_fetch_many
+                )
+            },
+            cache_dir=tmp_path,
+        )
+        for _ in range(2)
+    ]
+    statuses: list[str] = []
+    _race(
+        *(
+            lambda repo=repo: statuses.extend(
+                result.status
+                for result in repo.get_many("connector.hud_fmr", [{"geo_id": "08005012602"}])
+            )
+            for repo in repos
+        )
+    )
+
+    assert calls == ["08005012602"]
+    assert sorted(statuses) == [STATUS_FRESH, STATUS_REFRESHED]
+    for repo in repos:
+        repo.close()
+
+
+def test_cache_index_uses_wal_and_bulk_upserts(tmp_path) -> None:
+    index = CacheIndex(tmp_path / "cache_index.sqlite")
+    mode = index._connect().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+    assert index._connect() is index._connect(), "connection is reused per thread"
+
+    created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    records = [
+        CacheIndexRecord(
+            source_id="connector.place_context",
+            key_hash=f"k{i}",
+            relative_path=Path(f"connector.place_context/k{i}.parquet"),
+            created_at=created,
+            as_of=None,
+            ttl_days=1,
+            rows=1,
+            schema_version=None,
+        )
+        for i in range(50)
+    ]
+    assert index.bulk_upsert(records) == 50
+    found = index.lookup_many("connector.place_context", [f"k{i}" for i in range(60)])
+    assert len(found) == 50
+    assert found["k7"].relative_path == Path("connector.place_context/k7.parquet")
+
+
+def test_repository_skips_revalidation_when_schema_fingerprint_matches(
+    tmp_path, monkeypatch
+) -> None:
+    connector = callable_connector(
+        "connector.place_context", lambda **_: _valid_connector_frame(), ttl_seconds=86_400
+    )
+    repo = Repository({"connector.place_context": connector}, cache_dir=tmp_path)
+    first = repo.get("connector.place_context")
+    record = repo._store.index.lookup("connector.place_context", first.cache_key)
+    assert record is not None
+    assert record.schema_fingerprint == connector_schema_fingerprint("connector.place_context")
+    assert record.content_hash
+
+    calls = {"count": 0}
+    original = repository_module.validate_connector
+
+    def counting(*args: object, **kwargs: object) -> pd.DataFrame:
+        calls["count"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(repository_module, "validate_connector", counting)
+    assert repo.get("connector.place_context").status == STATUS_FRESH
+    assert calls["count"] == 0
+
+    paranoid = Repository({"connector.place_context": connector}, cache_dir=tmp_path, paranoid=True)
+    assert paranoid.get("connector.place_context").status == STATUS_FRESH
+    assert calls["count"] == 1
+
+    first.artifact_path.write_bytes(first.artifact_path.read_bytes() + b"\0")
+    with pytest.raises(CacheError):
+        paranoid.get("connector.place_context")
+
+
+def test_cache_store_write_is_atomic(tmp_path) -> None:
+    store = CacheStore(tmp_path)
+    frame = _valid_connector_frame()
+    record = store.write("connector.place_context", "k1", frame, ttl_days=1, schema_version=None)
+
+    broken = frame.copy()
+    broken["value"] = [object()]
+    with pytest.raises(Exception):
+        store.write("connector.place_context", "k1", broken, ttl_days=1, schema_version=None)
+
+    source_dir = tmp_path / "connector.place_context"
+    assert not list(source_dir.glob("*.tmp")), "temp files are cleaned up on failure"
+    pd.testing.assert_frame_equal(store.load(record), frame)
+
+
+def test_cache_store_dedupes_identical_payloads(tmp_path) -> None:
+    store = CacheStore(tmp_path)
+    frame = _valid_connector_frame()
+    first = store.write("connector.place_context", "k1", frame, ttl_days=1, schema_version=None)
+    second = store.write("connector.place_context", "k2", frame, ttl_days=1, schema_version=None)
+
+    assert first.relative_path == second.relative_path
+    assert first.relative_path.stem == first.content_hash
+    assert len(list((tmp_path / "connector.place_context").glob("*.parquet"))) == 1
+    assert store.index.lookup("connector.place_context", "k2") == second
+
+
+def test_repository_serves_stale_while_revalidating(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("WEST_HOUSING_MODEL_FAILURE_CACHE", str(tmp_path / "failures"))
+    calls = {"count": 0}
+
+    def _fetch(**_: object) -> pd.DataFrame:
+        calls["count"] += 1
+        if calls["count"] == 3:
+            raise RuntimeError("upstream unavailable")
+        frame = _valid_connector_frame()
+        frame["value"] = float(calls["count"])
+        return frame
+
+    now = {"value": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+    connector = callable_connector("connector.place_context", _fetch, ttl_seconds=86_400)
+    repo = Repository(
+        {"connector.place_context": connector},
+        cache_dir=tmp_path,
+        clock=lambda: now["value"],
+        stale_while_revalidate=timedelta(days=1),
+    )
+    assert repo.get("connector.place_context").status == STATUS_REFRESHED
+
+    now["value"] += timedelta(days=1, hours=12)
+    stale = repo.get("connector.place_context")
+    assert stale.status == STATUS_STALE
+    assert stale.metadata["revalidating"] is True
+    assert stale.frame["value"].iloc[0] == 1.0
+    repo.wait_for_revalidations(timeout=10)
+
+    refreshed = repo.get("connector.place_context")
+    assert refreshed.status == STATUS_FRESH
+    assert refreshed.frame["value"].iloc[0] == 2.0
+
+    now["value"] += timedelta(days=1, hours=12)
+    assert repo.get("connector.place_context").status == STATUS_STALE
+    repo.wait_for_revalidations(timeout=10)
+    repo.close()
+
+    stats = repo.revalidation_stats
+    assert (stats.scheduled, stats.completed, stats.failed, stats.in_flight) == (2, 1, 1, 0)
+
+    now["value"] += timedelta(days=5)
+    past_grace = repo.get("connector.place_context")
+    assert past_grace.status == STATUS_REFRESHED
+    assert calls["count"] == 4
+
+
+def test_cache_store_gc_evicts_lru_and_reconciles_orphans(tmp_path) -> None:
+    store = CacheStore(tmp_path)
+    source_dir = tmp_path / "connector.place_context"
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    records = {}
+    for offset, key in enumerate(("old", "mid", "new")):
+        frame = _valid_connector_frame()
+        frame["value"] = float(offset)
+        records[key] = store.write(
+            "connector.place_context",
+            key,
+            frame,
+            ttl_days=30,
+            schema_version=None,
+            created_at=start + timedelta(days=offset),
+        )
+        written = (start + timedelta(days=offset)).timestamp()
+        os.utime(tmp_path / records[key].relative_path, (written, written))
+    store.index.touch("connector.place_context", "old", start + timedelta(days=3))
+
+    stale_orphan = source_dir / "legacy.parquet"
+    stale_orphan.write_bytes(b"x" * 64)
+    stale_tmp = source_dir / ".blob.abc.tmp"
+    stale_tmp.write_bytes(b"partial")
+    old = (start - timedelta(days=1)).timestamp()
+    os.utime(stale_orphan, (old, old))
+    os.utime(stale_tmp, (old, old))
+    in_flight_tmp = source_dir / ".blob.def.tmp"
+    in_flight_tmp.write_bytes(b"writing")
+
+    now = start + timedelta(days=4)
+    blob_bytes = records["new"].bytes or 0
+    budget = store.gc(max_bytes=1, now=now, dry_run=True).bytes_before - blob_bytes
+    preview = store.gc(max_bytes=budget, now=now, dry_run=True)
+    assert [record.key_hash for record in preview.evicted] == ["mid"]
+    assert stale_orphan.exists(), "dry runs delete nothing"
+
+    report = store.gc(max_bytes=budget, now=now)
+    assert [record.key_hash for record in report.evicted] == ["mid"]
+    assert report.bytes_after <= budget
+    assert store.index.lookup("connector.place_context", "mid") is None
+    assert not (tmp_path / records["mid"].relative_path).exists()
+    assert not stale_orphan.exists() and not stale_tmp.exists()
+    assert in_flight_tmp.exists(), "recent temp files may belong to a running write"
+    assert (tmp_path / records["old"].relative_path).exists()
+
+    aged = store.gc(max_age=timedelta(days=1), now=now)
+    assert {record.key_hash for record in aged.evicted} == {"new"}
+    assert (tmp_path / "cache_index.sqlite").exists()
+
+
+def test_gc_keeps_recently_deduped_blobs(tmp_path) -> None:
+    store = CacheStore(tmp_path)
+    frame = _valid_connector_frame()
+    first = store.write("connector.place_context", "a", frame, ttl_days=1, schema_version=None)
+    blob = tmp_path / first.relative_path
+    long_ago = (datetime.now(timezone.utc) - timedelta(days=2)).timestamp()
+    os.utime(blob, (long_ago, long_ago))
+
+    # A second key dedupes onto the blob but has not committed its row yet.
+    second = store.write(
+        "connector.place_context", "b", frame, ttl_days=1, schema_version=None, update_index=False
+    )
+    assert second.relative_path == first.relative_path
+    assert blob.stat().st_mtime > long_ago
+
+    report = store.gc(
+        max_age=timedelta(seconds=0), now=datetime.now(timezone.utc) + timedelta(minutes=1)
+    )
+    assert [record.key_hash for record in report.evicted] == ["a"]
+    assert blob.exists(), "freed blobs inside the grace period survive"
+    store.index.bulk_upsert([second])
+    assert len(store.load(second)) == 1
+
+
+def test_gc_unlinks_key_locks_only_under_the_lock(tmp_path, monkeypatch) -> None:
+    lock_path = tmp_path / "connector.place_context" / ".locks" / "k.lock"
+    with repository_module._file_lock(lock_path):
+        assert not repository_module._unlink_unheld_lock(lock_path)
+    assert repository_module._unlink_unheld_lock(lock_path)
+    assert not lock_path.exists()
+
+    # A locker whose file is unlinked between open() and flock() (gc won the
+    # race) must retry on the new file instead of locking the orphaned inode.
+    real_flock = repository_module.fcntl.flock
+    raced = []
+
+    def _flock(fd: int, operation: int) -> None:
+        if operation == repository_module.fcntl.LOCK_EX and not raced:
+            raced.append(True)
+            lock_path.unlink()
+        real_flock(fd, operation)
+
+    monkeypatch.setattr(repository_module.fcntl, "flock", _flock)
+    with repository_module._file_lock(lock_path):
+        assert raced and lock_path.exists()
+        assert not repository_module._unlink_unheld_lock(lock_path)
+
+
+def test_repository_batches_access_stats_until_flush(tmp_path) -> None:
+    connector = callable_connector("connector.place_context", lambda **_: _valid_connector_frame())
+    repo = Repository(
+        {"connector.place_context": connector},
+        cache_dir=tmp_path,
+        access_flush_interval=3600,
+    )
+    for _ in range(4):
+        repo.get("connector.place_context")
+    (pending,) = repo.store.index.source_stats()
+    assert (pending.hits, pending.misses) == (0, 0), "counters stay in memory until flushed"
+
+    repo.flush_access_stats()
+    (stats,) = repo.store.index.source_stats()
+    assert (stats.keys, stats.hits, stats.misses) == (1, 3, 1)
+    assert stats.hit_ratio == 0.75
+    assert stats.p50_load_ms is not None and stats.p95_load_ms is not None
+    (record,) = repo.store.index.records()
+    assert record.last_accessed_at is not None
+    assert record.last_accessed_at >= record.created_at
+
+
+def test_cache_reads_push_down_columns_and_filters(tmp_path) -> None:
+    rows = PARQUET_ROW_GROUP_ROWS * 2 + 10
+    statewide = pd.DataFrame(
+        {
+            "place_id": [f"p-{i:06d}" for i in range(rows)],
+            "metric": ["msa_jobs_t12"] * rows,
+            "value": [float(i) for i in range(rows)],
+            "observed_at": ["2024-01-01"] * rows,
+            "source_id": ["connector.place_context"] * rows,
+        }
+    )
+    store = CacheStore(tmp_path)
+    record = store.write("connector.place_context", "k1", statewide, 1, None)
+    metadata = pq.ParquetFile(tmp_path / record.relative_path).metadata
+    assert metadata.num_row_groups == 3
+    assert metadata.row_group(0).column(0).statistics.has_min_max
+
+    point = store.load(record, columns=["value"], filters=[("place_id", "==", "p-000042")])
+    assert list(point.columns) == ["value"]
+    assert point["value"].tolist() == [42.0]
+
+    connector = callable_connector("connector.place_context", lambda **_: statewide)
+    repo = Repository({"connector.place_context": connector}, cache_dir=tmp_path / "repo")
+    query = {"columns": ["place_id", "value"], "filters": [("value", ">=", rows - 2.0)]}
+    miss = repo.get("connector.place_context", **query)
+    hit = repo.get("connector.place_context", **query)
+    assert (miss.status, hit.status) == (STATUS_REFRESHED, STATUS_FRESH)
+    pd.testing.assert_frame_equal(miss.frame, hit.frame)
+    assert hit.frame["place_id"].tolist() == [f"p-{rows - 2:06d}", f"p-{rows - 1:06d}"]
+    assert len(repo.get("connector.place_context").frame) == rows
+
+    with pytest.raises(CacheError):
+        repo.get("connector.place_context", columns=["missing"])
+
+
+def test_partitioned_sources_share_one_file_per_partition(tmp_path) -> None:
+    def _fetch(*, place_id: str) -> pd.DataFrame:
+        frame = _valid_connector_frame()
+        frame["place_id"] = [place_id]
+        frame["value"] = [float(len(place_id))]
+        return frame
+
+    connector = callable_connector("connector.place_context", _fetch)
+    repo = Repository(
+        {"connector.place_context": connector},
+        cache_dir=tmp_path,
+        partitions={"connector.place_context": PartitionSpec("place_id", prefix_len=2)},
+    )
+    places = ["co-001", "co-0002", "ut-001"]
+    cold = repo.get_many("connector.place_context", [{"place_id": p} for p in places])
+    warm = repo.get_many("connector.place_context", [{"place_id": p} for p in places])
+    assert {result.status for result in warm} == {STATUS_FRESH}
+    for before, after in zip(cold, warm):
+        pd.testing.assert_frame_equal(before.frame, after.frame)
+
+    dataset = tmp_path / "connector.place_context" / "dataset"
+    parts = {path.relative_to(dataset).parent.name for path in dataset.glob("*/*.parquet")}
+    assert parts == {"part=co", "part=ut"}
+    assert not list((tmp_path / "connector.place_context").glob("*.parquet"))
+
+    # Re-writing a key re-points its row instead of keeping duplicate rows.
+    store = repo.store
+    first = cold.results[0]
+    store.write("connector.place_context", first.cache_key, first.frame, 1, None)
+    assert len(repo.scan("connector.place_context")) == len(places)
+
+    # GC compacts each partition back into one file.
+    store.gc(now=datetime.now(timezone.utc) + timedelta(hours=2))
+    assert len(list(dataset.glob("part=co/*.parquet"))) == 1
+    assert len(list(dataset.glob("part=ut/*.parquet"))) == 1
+
+    full = repo.scan("connector.place_context")
+    assert sorted(full["place_id"]) == sorted(places)
+    only_co = repo.scan(
+        "connector.place_context", columns=["place_id"], filters=[("value", "==", 7.0)]
+    )
+    assert only_co["place_id"].tolist() == ["co-0002"]
+
+
+def test_partition_writes_append_part_files_until_compacted(tmp_path, monkeypatch) -> None:
+    store = CacheStore(
+        tmp_path, partitions={"connector.place_context": PartitionSpec("place_id", prefix_len=2)}
+    )
+    written: list[int] = []
+    write_table = repository_module._write_table
+
+    def counting(table, path) -> None:
+        written.append(table.num_rows)
+        write_table(table, path)
+
+    def no_reads(path):
+        raise AssertionError(f"append read {path}")
+
+    frames = {}
+    for index in range(4):
+        frame = _valid_connector_frame()
+        frame["place_id"] = [f"co-{index:03d}"]
+        frames[f"key-{index}"] = frame
+    monkeypatch.setattr(repository_module, "_write_table", counting)
+    monkeypatch.setattr(repository_module, "_read_table", no_reads)
+    for key_hash, frame in frames.items():
+        store.write("connector.place_context", key_hash, frame, 1, None)
+    assert written == [1, 1, 1, 1]
+    monkeypatch.undo()
+
+    # A schema bump: the drifted keys are un-indexed so they refetch.
+    drifted = frames["key-0"].assign(value=["n/a"])
+    store.write("connector.place_context", "key-9", drifted, 1, None)
+    assert store.compact_partitions() == 1
+    records = store.index.records("connector.place_context")
+    assert [record.key_hash for record in records] == ["key-9"]
+    assert store.compact_partitions() == 0
+
+    for key_hash, frame in frames.items():
+        store.write("connector.place_context", key_hash, frame, 1, None)
+    assert store.compact_partitions("connector.place_context") == 1
+    records = store.index.lookup_many("connector.place_context", frames)
+    assert len({record.relative_path for record in records.values()}) == 1
+    for key_hash, frame in frames.items():
+        pd.testing.assert_frame_equal(store.load(records[key_hash]), frame)
+
+
+def test_bulk_fetches_append_each_partition_once(tmp_path, monkeypatch) -> None:
+    def _frame(place_id: str) -> pd.DataFrame:
+        frame = _valid_connector_frame()
+        frame["place_id"] = [place_id]
+        return frame
+
+    def _fetch_many(queries) -> pd.DataFrame:
+        return pd.concat([_frame(query["place_id"]) for query in queries], ignore_index=True)
+
+    connector = BulkDataConnector(
+        source_id="connector.place_context",
+        fetch_func=lambda place_id, **_: _frame(place_id),
+        fetch_many_func=_fetch_many,
+    )
+    repo = Repository(
+        {"connector.place_context": connector},
+        cache_dir=tmp_path,
+        partitions={"connector.place_context": PartitionSpec("place_id", prefix_len=2)},
+    )
+    rewrites: list[int] = []
+    write_table = repository_module._write_table
+
+    def counting(table, path) -> None:
+        rewrites.append(table.num_rows)
+        write_table(table, path)
+
+    monkeypatch.setattr(repository_module, "_write_table", counting)
+    places = ["co-001", "ut-001", "co-002", "co-003", "ut-002"]
+    batch = repo.get_many("connector.place_context", [{"place_id": p} for p in places])
+
+    assert all(result.metadata["bulk"] for result in batch)
+    assert sorted(rewrites) == [2, 3]
+    for place_id in places:
+        hit = repo.get("connector.place_context", place_id=place_id)
+        assert hit.status == STATUS_FRESH
+        assert hit.frame["place_id"].tolist() == [place_id]
+    repo.close()
+
+
+def test_arrow_format_artifacts_are_memory_mapped(tmp_path, monkeypatch) -> None:
+    connector = callable_connector("connector.place_context", lambda **_: _valid_connector_frame())
+    repo = Repository(
+        {"connector.place_context": connector},
+        cache_dir=tmp_path,
+        cache_formats={"connector.place_context": FORMAT_ARROW},
+    )
+    refreshed = repo.get("connector.place_context")
+    assert refreshed.artifact_path.suffix == ".arrow"
+
+    mapped = []
+    real_memory_map = pa.memory_map
+    monkeypatch.setattr(
+        pa, "memory_map", lambda path, mode="r": mapped.append(path) or real_memory_map(path, mode)
+    )
+    cached = repo.get("connector.place_context", columns=["place_id", "value"])
+    assert cached.status == STATUS_FRESH
+    assert mapped == [str(refreshed.artifact_path)]
+    pd.testing.assert_frame_equal(cached.frame, refreshed.frame[["place_id", "value"]])
+
+    with pytest.raises(CacheError):
+        Repository(cache_dir=tmp_path, cache_formats={"connector.place_context": "csv"})
+
+
+def test_negative_cache_fails_fast_until_ttl_expires(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("WEST_HOUSING_MODEL_FAILURE_CACHE", str(tmp_path / "failures"))
+    clock = [datetime(2025, 1, 1, tzinfo=timezone.utc)]
+    calls: list[str] = []
+
+    def fetcher(place_id: str, **_: object) -> pd.DataFrame:
+        calls.append(place_id)
+        if len(calls) < 3:
+            raise ConnectorError("PAD-US acres unavailable", context={"place_id": place_id})
+        return _valid_connector_frame()
+
+    connector = callable_connector("connector.place_context", fetcher)
+    repo = Repository(
+        {"connector.place_context": connector},
+        cache_dir=tmp_path / "cache",
+        clock=lambda: clock[0],
+        negative_ttl=timedelta(minutes=10),
+    )
+
+    with pytest.raises(ConnectorError, match="PAD-US acres unavailable"):
+        repo.get("connector.place_context", place_id="p-404")
+    with pytest.raises(ConnectorError) as repeated:
+        repo.get("connector.place_context", place_id="p-404")
+    assert repeated.value.context is not None and repeated.value.context["negative_cache"]
+    assert calls == ["p-404"]
+    assert len(read_failures("connector.place_context")) == 1
+
+    clock[0] += timedelta(minutes=11)
+    with pytest.raises(ConnectorError):
+        repo.get("connector.place_context", place_id="p-404")
+    clock[0] += timedelta(minutes=11)
+    assert repo.get("connector.place_context", place_id="p-404").status == STATUS_REFRESHED
+    assert calls == ["p-404", "p-404", "p-404"]
+    key_hash = repo.get("connector.place_context", place_id="p-404").cache_key
+    assert repo.store.index.lookup_negative("connector.place_context", key_hash) is None
+
+
+def test_negative_cache_skips_transient_failures(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("WEST_HOUSING_MODEL_FAILURE_CACHE", str(tmp_path / "failures"))
+    calls: list[str] = []
+    failures = {
+        "p-503": ConnectorError("upstream unavailable", context={"status": 503}),
+        "p-timeout": requests.Timeout("read timed out"),
+        "p-404": ConnectorError("no such place", context={"status": 404}),
+    }
+
+    def fetcher(place_id: str, **_: object) -> pd.DataFrame:
+        calls.append(place_id)
+        raise failures[place_id]
+
+    repo = Repository(
+        {"connector.place_context": callable_connector("connector.place_context", fetcher)},
+        cache_dir=tmp_path / "cache",
+        negative_ttl=timedelta(minutes=10),
+    )
+    for place_id in ("p-503", "p-timeout", "p-404"):
+        for _ in range(2):
+            with pytest.raises(ConnectorError) as raised:
+                repo.get("connector.place_context", place_id=place_id)
+
+    # Transient failures are retried every time; the 404 is remembered.
+    assert calls == ["p-503", "p-503", "p-timeout", "p-timeout", "p-404"]
+    context = raised.value.context or {}
+    assert context["negative_cache"] and context["error_class"] == "ConnectorError"
+    negative = repo.store.index.lookup_negative("connector.place_context", context["cache_key"])
+    assert negative is not None and negative.message == "no such place"
+    repo.close()
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, payload: object, headers: dict) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.url = "https://example.test/fmr"
+        self._payload = payload
+
+    def json(self) -> object:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _ConditionalSession:
+    """Answers 304 whenever the request carries the current ETag."""
+
+    def __init__(self) -> None:
+        self.sent_headers: list = []
+
+    def mount(self, *_: object) -> None:
+        pass
+
+    def get(self, url, params=None, headers=None, timeout=None) -> _FakeResponse:
+        self.sent_headers.append(dict(headers or {}))
+        validators = {"ETag": '"fmr-2025"', "Last-Modified": "Tue, 01 Oct 2024 00:00:00 GMT"}
+        if (headers or {}).get("If-None-Match") == '"fmr-2025"':
+            return _FakeResponse(304, None, validators)
+        payload = [{"geo_id": params["geo_id"], "hud_fmr_2br": 1450, "observed_at": "2025-01-01"}]
+        return _FakeResponse(200, payload, validators)
+
+
+def test_expired_rows_revalidate_conditionally_on_304(tmp_path) -> None:
+    session = _ConditionalSession()
+    http = HttpFetcher("https://example.test", session=session)
+    config = HUDFMRConfig(base_url="https://example.test/fmr")
+    connector = callable_connector(
+        "connector.hud_fmr",
+        lambda geo_id, **_: fetch_hud_fmr(geo_id=geo_id, config=config, http=http),
+    )
+    now = [datetime(2025, 3, 1, tzinfo=timezone.utc)]
+    repo = Repository({"connector.hud_fmr": connector}, cache_dir=tmp_path, clock=lambda: now[0])
+
+    first = repo.get("connector.hud_fmr", geo_id="08031")
+    assert first.status == STATUS_REFRESHED
+    (record,) = repo.store.index.records("connector.hud_fmr")
+    assert record.etag == '"fmr-2025"'
+    assert "If-None-Match" not in session.sent_headers[0]
+    artifact = repo.store.root / record.relative_path
+    mtime = artifact.stat().st_mtime_ns
+
+    now[0] += timedelta(days=3)
+    second = repo.get("connector.hud_fmr", geo_id="08031")
+    assert second.status == STATUS_FRESH
+    assert second.metadata["revalidated"] is True
+    assert second.frame["hud_fmr_2br"].tolist() == [1450.0]
+    assert session.sent_headers[1]["If-None-Match"] == '"fmr-2025"'
+    assert session.sent_headers[1]["If-Modified-Since"] == "Tue, 01 Oct 2024 00:00:00 GMT"
+    (renewed,) = repo.store.index.records("connector.hud_fmr")
+    assert renewed.created_at == now[0]
+    assert renewed.relative_path == record.relative_path
+    assert artifact.stat().st_mtime_ns == mtime
+
+    # The renewed row is fresh again: no request at all until it next expires.
+    assert repo.get("connector.hud_fmr", geo_id="08031").status == STATUS_FRESH
+    assert len(session.sent_headers) == 2
+    repo.close()
+
+
+def test_get_many_fetches_uncached_keys_in_one_bulk_call(tmp_path) -> None:
+    bulk_calls: list = []
+    single_calls: list = []
+
+    def _fetch(geo_id: str, **_: object) -> pd.DataFrame:
+        single_calls.append(geo_id)
+        return fetch_hud_fmr(geo_id=geo_id)
+
+    def _fetch_many(queries) -> pd.DataFrame:
+        bulk_calls.append([query["geo_id"] for query in queries])
+        return fetch_hud_fmr_many(geo_ids=[query["geo_id"] for query in queries])
+
+    connector = BulkDataConnector(
+        source_id="connector.hud_fmr", fetch_func=_fetch, fetch_many_func=_fetch_many
+    )
+    repo = Repository({"connector.hud_fmr": connector}, cache_dir=tmp_path)
+    geo_ids = ["08005012602", "16001020100", "08005012602"]
+
+    batch = repo.get_many("connector.hud_fmr", [{"geo_id": geo_id} for geo_id in geo_ids])
+    assert bulk_calls == [["08005012602", "16001020100"]]
+    assert single_calls == []
+    assert [result.status for result in batch] == [STATUS_REFRESHED] * 3
+    assert [result.frame["geo_id"].iloc[0] for result in batch] == geo_ids
+    assert all(result.metadata["bulk"] for result in batch)
+    assert "query_index" not in batch.results[0].frame.columns
+    assert len(repo.store.index.records("connector.hud_fmr")) == 2
+
+    # Cached keys are hits; keys the bulk call had no rows for take the per-key path.
+    with pytest.raises(ConnectorError):
+        repo.get_many("connector.hud_fmr", [{"geo_id": "08005012602"}, {"geo_id": "99999"}])
+    assert bulk_calls[-1] == ["99999"]
+    assert single_calls == ["99999"]
+    assert repo.get("connector.hud_fmr", geo_id="16001020100").status == STATUS_FRESH
+    repo.close()
+
+
+class _UnindexedBulkConnector(DataConnector):
+    """Bulk connector that forgets to tag rows with their query position."""
+
+    def fetch_many(self, queries) -> pd.DataFrame:
+        return pd.concat([self.fetch(**query) for query in queries], ignore_index=True)
+
+
+def test_get_many_falls_back_when_bulk_frame_lacks_query_index(tmp_path) -> None:
+    calls: list = []
+
+    def _fetch(geo_id: str, **_: object) -> pd.DataFrame:
+        calls.append(geo_id)
+        return fetch_hud_fmr(geo_id=geo_id)
+
+    connector = _UnindexedBulkConnector(source_id="connector.hud_fmr", fetch_func=_fetch)
+    repo = Repository({"connector.hud_fmr": connector}, cache_dir=tmp_path)
+    geo_ids = ["08005012602", "16001020100"]
+
+    batch = repo.get_many("connector.hud_fmr", [{"geo_id": geo_id} for geo_id in geo_ids])
+    assert [result.status for result in batch] == [STATUS_REFRESHED] * 2
+    assert not any(result.metadata.get("bulk") for result in batch)
+    # One bulk attempt, then the per-key path for every key.
+    assert sorted(calls) == sorted(geo_ids * 2)
+    repo.close()
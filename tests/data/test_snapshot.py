@@ -0,0 +1,88 @@
+"""Tests for cache snapshot export/import bundles."""
+
+from __future__ import annotations
+
+import io
+import json
+import tarfile
+from pathlib import Path
+from typing import Any, List
+
+import pandas as pd
+import pytest
+
+from west_housing_model.core.exceptions import CacheError
+from west_housing_model.data.connectors import callable_connector
+from west_housing_model.data.repository import STATUS_FRESH, Repository
+from west_housing_model.data.snapshot import export_bundle, import_bundle
+
+
+def _eia_connector(calls: List[str]):
+    def _fetch(state: str, **_: Any) -> pd.DataFrame:
+        calls.append(state)
+        return pd.DataFrame(
+            {
+                "state": [state],
+                "res_price_cents_per_kwh": [14.2],
+                "observed_at": ["2025-01-01"],
+                "source_id": ["connector.eia_v2"],
+                "as_of": ["2025-01" if state == "CO" else "2024-06"],
+            }
+        )
+
+    return callable_connector("connector.eia_v2", _fetch, ttl_seconds=3600)
+
+
+def test_bundle_round_trip_serves_without_refetch(tmp_path: Path) -> None:
+    calls: List[str] = []
+    source = Repository({"connector.eia_v2": _eia_connector(calls)}, cache_dir=tmp_path / "a")
+    for state in ("CO", "UT"):
+        source.get("connector.eia_v2", state=state)
+    bundle = tmp_path / "snapshot.tar.gz"
+
+    report = export_bundle(source.store, bundle, as_of_from="2025-01-01")
+    assert (report.records, report.files) == (0, 0)
+    report = export_bundle(source.store, bundle, as_of_from="2025-01", sources=["connector.eia_v2"])
+    assert (report.records, report.files) == (1, 1)
+
+    target = Repository({"connector.eia_v2": _eia_connector(calls)}, cache_dir=tmp_path / "b")
+    imported = import_bundle(target.store, bundle)
+    assert (imported.records, imported.files, imported.skipped) == (1, 1, 0)
+    result = target.get("connector.eia_v2", state="CO")
+    assert result.status == STATUS_FRESH
+    assert result.frame["state"].tolist() == ["CO"]
+    assert calls == ["CO", "UT"]
+
+    again = import_bundle(target.store, bundle)
+    assert (again.records, again.skipped) == (0, 1)
+    source.close()
+    target.close()
+
+
+def test_import_rejects_corrupt_bundle_without_touching_index(tmp_path: Path) -> None:
+    source = Repository({"connector.eia_v2": _eia_connector([])}, cache_dir=tmp_path / "a")
+    source.get("connector.eia_v2", state="CO")
+    bundle = tmp_path / "snapshot.tar.gz"
+    export_bundle(source.store, bundle)
+
+    tampered = tmp_path / "tampered.tar.gz"
+    with tarfile.open(bundle, "r:gz") as original, tarfile.open(tampered, "w:gz") as out:
+        for member in original.getmembers():
+            handle = original.extractfile(member)
+            assert handle is not None
+            data = handle.read()
+            if member.name.startswith("files/"):
+                data = data[:-1] + bytes([data[-1] ^ 0xFF])
+            out.addfile(member, io.BytesIO(data))
+
+    target = Repository({"connector.eia_v2": _eia_connector([])}, cache_dir=tmp_path / "b")
+    with pytest.raises(CacheError, match="checksum"):
+        import_bundle(target.store, tampered)
+    assert target.store.index.records() == []
+
+    with tarfile.open(bundle, "r:gz") as original:
+        handle = original.extractfile("manifest.json")
+        assert handle is not None
+        assert json.load(handle)["version"] == 1
+    source.close()
+    target.close()
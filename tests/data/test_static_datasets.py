@@ -0,0 +1,49 @@
+"""Tests for the indexed static-fixture layer."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from west_housing_model.core.exceptions import ConnectorError
+from west_housing_model.data.connectors.common import StaticDataset
+from west_housing_model.data.connectors.eia_v2 import fetch_eia_rates
+from west_housing_model.data.connectors.usfs_wildfire import fetch_usfs_wildfire
+
+
+def _dataset(**kwargs) -> StaticDataset:
+    frame = pd.DataFrame(
+        {
+            "geo_id": ["08005012602", "08005", "08031", "08005012602"],
+            "value": [1, 2, 3, 4],
+        }
+    )
+    return StaticDataset(frame, "geo_id", **kwargs)
+
+
+def test_lookup_returns_first_row_per_key_and_prefix_fallback() -> None:
+    dataset = _dataset(prefix_len=5)
+    assert dataset.lookup("08005012602")["value"].tolist() == [1]
+    # Unknown tract falls back to the first row sharing its county prefix.
+    assert dataset.lookup("08005999999")["value"].tolist() == [1]
+    assert dataset.lookup("08031000100")["value"].tolist() == [3]
+    assert dataset.lookup("49035").empty
+
+    many = dataset.lookup_many(["08031", "missing", "08005", "08005999999"])
+    assert many["value"].tolist() == [3, 2, 1]
+
+    exact_only = _dataset()
+    assert exact_only.lookup("08005999999").empty
+
+
+def test_upper_keys_match_case_insensitively() -> None:
+    dataset = StaticDataset(pd.DataFrame({"state": ["CO", "ID"]}), "state", upper_keys=True)
+    assert dataset.lookup_many(["id", "Co", "UT"])["state"].tolist() == ["ID", "CO"]
+
+
+def test_connectors_resolve_rows_through_the_index() -> None:
+    wildfire = fetch_usfs_wildfire(geo_id="08005999999")
+    assert wildfire["geo_id"].tolist() == ["08005012602"]
+    assert fetch_eia_rates(state="co")["state"].tolist() == ["CO"]
+    with pytest.raises(ConnectorError):
+        fetch_eia_rates(state="ZZ")
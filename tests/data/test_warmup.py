@@ -0,0 +1,193 @@
+"""Tests for the portfolio cache warm-up planner."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+import pytest
+
+from west_housing_model.core.exceptions import ConnectorError, RegistryError
+from west_housing_model.data.connectors import BulkDataConnector, callable_connector
+from west_housing_model.data.rate_limit import (
+    RateLimiter,
+    RateSpec,
+    SharedRateState,
+    limiter_for,
+    parse_rate_limit,
+    parse_rate_spec,
+    reset_rate_limits,
+)
+from west_housing_model.data.repository import Repository
+from west_housing_model.data.warmup import load_portfolio, plan_queries, warm_cache
+
+
+def _write_portfolio(path: Path) -> Path:
+    path.write_text(
+        "property_id,lat,lon,tract,place_id\n"
+        "a,39.74,-104.99,08031001000,p-den\n"
+        "b,39.75,-104.98,08031001000,p-den\n"
+        "c,40.76,-111.89,49035101100,p-slc\n"
+        "d,,,,\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def _hud_fetch(calls: List[Dict[str, Any]]):
+    lock = threading.Lock()
+
+    def _fetch(geo_id: str, **_: Any) -> pd.DataFrame:
+        with lock:
+            calls.append({"geo_id": geo_id})
+        if geo_id.startswith("49"):
+            raise ConnectorError("HUD unavailable", context={"geo_id": geo_id})
+        return pd.DataFrame(
+            {
+                "geo_id": [geo_id],
+                "hud_fmr_2br": [1650.0],
+                "observed_at": ["2025-01-01"],
+                "source_id": ["connector.hud_fmr"],
+            }
+        )
+
+    return _fetch
+
+
+def _eia_fetch(state: str, **_: Any) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "state": [state],
+            "res_price_cents_per_kwh": [14.2],
+            "observed_at": ["2025-01-01"],
+            "source_id": ["connector.eia_v2"],
+        }
+    )
+
+
+def test_plan_queries_derives_and_dedupes_connector_keys(tmp_path: Path) -> None:
+    properties = load_portfolio(_write_portfolio(tmp_path / "portfolio.csv"))
+    plan = plan_queries(properties)
+
+    assert plan.properties == 4
+    assert plan.queries["connector.census_acs"] == (
+        {"state": "08", "county": "031", "table": "B19013_001E"},
+        {"state": "49", "county": "035", "table": "B19013_001E"},
+    )
+    assert plan.queries["connector.noaa_storm_events"] == (
+        {"county_id": "08031"},
+        {"county_id": "49035"},
+    )
+    assert plan.queries["connector.eia_v2"] == ({"state": "CO"}, {"state": "UT"})
+    assert len(plan.queries["connector.usgs_designmaps"]) == 3
+    assert plan.queries["connector.usgs_epqs"] == ({"place_id": "p-den"}, {"place_id": "p-slc"})
+
+    restricted = plan_queries(properties, sources=["connector.hud_fmr"])
+    assert list(restricted.queries) == ["connector.hud_fmr"]
+
+
+def test_warm_cache_fetches_only_missing_keys(tmp_path: Path) -> None:
+    properties = load_portfolio(_write_portfolio(tmp_path / "portfolio.csv"))
+    calls: List[Dict[str, Any]] = []
+    connectors = {
+        "connector.hud_fmr": callable_connector("connector.hud_fmr", _hud_fetch(calls)),
+        "connector.eia_v2": callable_connector("connector.eia_v2", _eia_fetch),
+    }
+    repo = Repository(connectors, cache_dir=tmp_path / "cache")
+    repo.get("connector.eia_v2", state="CO")
+    plan = plan_queries(properties, sources=connectors)
+
+    preview = warm_cache(repo, plan, dry_run=True)
+    assert (preview.planned, preview.missing, preview.fetched) == (4, 3, 0)
+    assert calls == []
+
+    progress: List[tuple[int, int]] = []
+    summary = warm_cache(
+        repo,
+        plan,
+        rate_limits={"connector.eia_v2": "10/s", "connector.hud_fmr": "none"},
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    by_source = {item.source_id: item for item in summary.sources}
+    assert (by_source["connector.eia_v2"].cached, by_source["connector.eia_v2"].fetched) == (1, 1)
+    assert by_source["connector.hud_fmr"].fetched == 1
+    assert by_source["connector.hud_fmr"].failed == 1
+    assert "HUD unavailable" in by_source["connector.hud_fmr"].errors[0]
+    assert progress[0] == (0, 3) and progress[-1] == (3, 3)
+    # Registry limits become the process-wide buckets the HTTP clients draw from.
+    assert limiter_for("connector.eia_v2").spec == RateSpec(10.0)
+    assert limiter_for("connector.hud_fmr").spec is None
+    reset_rate_limits()
+
+    rerun = warm_cache(repo, plan, dry_run=True)
+    assert rerun.missing == 1
+    repo.close()
+
+
+def test_warm_cache_resolves_each_source_with_one_bulk_call(tmp_path: Path) -> None:
+    properties = load_portfolio(_write_portfolio(tmp_path / "portfolio.csv"))
+    bulk_calls: List[List[str]] = []
+
+    def _fetch_many(queries: Any) -> pd.DataFrame:
+        bulk_calls.append([query["state"] for query in queries])
+        return pd.concat([_eia_fetch(query["state"]) for query in queries], ignore_index=True)
+
+    connector = BulkDataConnector(
+        source_id="connector.eia_v2", fetch_func=_eia_fetch, fetch_many_func=_fetch_many
+    )
+    repo = Repository({"connector.eia_v2": connector}, cache_dir=tmp_path / "cache")
+    plan = plan_queries(properties, sources=["connector.eia_v2"])
+
+    summary = warm_cache(repo, plan)
+    assert bulk_calls == [["CO", "UT"]]
+    assert (summary.fetched, summary.failed) == (2, 0)
+    repo.close()
+
+
+def test_rate_limiter_spaces_requests() -> None:
+    assert parse_rate_limit("40/min") == pytest.approx(40 / 60)
+    assert parse_rate_limit("none") is None
+    with pytest.raises(RegistryError):
+        parse_rate_limit("fast")
+
+    clock = [0.0]
+    waits: List[float] = []
+    limiter = RateLimiter(
+        2.0, monotonic=lambda: clock[0], sleep=lambda seconds: waits.append(seconds)
+    )
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.5, 1.0]
+    assert waits == [0.5, 1.0]
+
+
+def test_token_bucket_allows_bursts_and_shares_state_across_processes(tmp_path: Path) -> None:
+    assert parse_rate_spec("10/s burst 20") == RateSpec(10.0, burst=20)
+    assert parse_rate_spec("none") is None
+    with pytest.raises(RegistryError):
+        parse_rate_spec("10/s burst 0")
+
+    clock = [0.0]
+    waits: List[float] = []
+    bursty = RateLimiter(
+        2.0, burst=3, monotonic=lambda: clock[0], sleep=lambda seconds: waits.append(seconds)
+    )
+    assert [bursty.acquire() for _ in range(4)] == [0.0, 0.0, 0.0, 0.5]
+    clock[0] = 10.0
+    # An idle bucket refills to the burst size, never beyond it.
+    assert [bursty.acquire() for _ in range(4)] == [0.0, 0.0, 0.0, 0.5]
+
+    # Two limiters on one state file behave like two worker processes.
+    state_path = tmp_path / "rate.sqlite"
+    workers = [
+        RateLimiter(
+            2.0,
+            key="connector.census_acs",
+            state=SharedRateState(state_path),
+            clock=lambda: 100.0,
+            sleep=lambda seconds: None,
+        )
+        for _ in range(2)
+    ]
+    delays = [workers[index % 2].acquire() for index in range(4)]
+    assert delays == pytest.approx([0.0, 0.5, 1.0, 1.5])
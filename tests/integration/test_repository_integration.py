@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import logging
+import multiprocessing
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
@@ -13,6 +15,7 @@ import pytest
 
 from west_housing_model.core.exceptions import SchemaError
 from west_housing_model.data.connectors import callable_connector
+from west_housing_model.data.failure_log import read_failures
 from west_housing_model.data.repository import (
     STATUS_FRESH,
     STATUS_REFRESHED,
@@ -139,8 +142,7 @@ def test_repository_captures_schema_drift_payload(
     with pytest.raises(SchemaError):
         repo.get(connector.source_id)
 
-    failure_dir = Path(tmp_path / "failures") / connector.source_id
-    assert any(failure_dir.glob("*.log")), "Schema drift logs should exist"
+    assert read_failures(connector.source_id), "Schema drift logs should exist"
 
 
 def test_repository_falls_back_to_stale_on_error(
@@ -168,8 +170,7 @@ def test_repository_falls_back_to_stale_on_error(
     fallback = repo.get(connector.source_id)
     assert fallback.status == STATUS_STALE
     assert fallback.metadata.get("fallback_reason")
-    failure_dir = Path(tmp_path / "failures") / connector.source_id
-    assert list(failure_dir.glob("*.log")), "Failure log should be recorded"
+    assert read_failures(connector.source_id), "Failure log should be recorded"
 
 
 def test_repository_parallel_refresh_uses_locks(tmp_path: Path) -> None:
@@ -210,3 +211,51 @@ def test_repository_refresh_returns_metadata(tmp_path: Path) -> None:
     assert result.metadata["rows"] == 1
     assert result.metadata["ttl_days"] >= 1
     assert result.metadata["schema_version"] is None
+
+
+def test_repository_single_flight_coalesces_concurrent_misses(tmp_path: Path) -> None:
+    payload = _make_payload("connector.place_context")
+    calls = {"count": 0}
+    guard = threading.Lock()
+
+    def fetcher(**_: object) -> pd.DataFrame:
+        with guard:
+            calls["count"] += 1
+        time.sleep(0.1)
+        return payload.copy(deep=True)
+
+    connector = _connector("connector.place_context", fetcher, ttl_seconds=24 * 60 * 60)
+    repo = Repository({connector.source_id: connector}, cache_dir=tmp_path)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(repo.get, connector.source_id) for _ in range(4)]
+        results = [future.result(timeout=5) for future in futures]
+
+    assert calls["count"] == 1, "only the first caller should reach the connector"
+    statuses = sorted(result.status for result in results)
+    assert statuses == [STATUS_FRESH] * 3 + [STATUS_REFRESHED]
+
+
+def _fork_get(cache_dir: str, counter: str) -> str:
+    payload = _make_payload("connector.place_context")
+
+    def fetcher(**_: object) -> pd.DataFrame:
+        with open(counter, "a") as handle:
+            handle.write("x")
+        time.sleep(0.2)
+        return payload.copy(deep=True)
+
+    connector = _connector("connector.place_context", fetcher, ttl_seconds=24 * 60 * 60)
+    repo = Repository({connector.source_id: connector}, cache_dir=Path(cache_dir))
+    return repo.get(connector.source_id).status
+
+
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning")
+def test_repository_single_flight_across_processes(tmp_path: Path) -> None:
+    counter = tmp_path / "calls.txt"
+    context = multiprocessing.get_context("fork")
+    with context.Pool(2) as pool:
+        statuses = pool.starmap(_fork_get, [(str(tmp_path), str(counter))] * 2)
+
+    assert counter.read_text() == "x"
+    assert sorted(statuses) == [STATUS_FRESH, STATUS_REFRESHED]
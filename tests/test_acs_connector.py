@@ -8,6 +8,7 @@ import pytest
 
 from west_housing_model.core.exceptions import SchemaError
 from west_housing_model.data.connectors import make_census_acs_connector
+from west_housing_model.data.failure_log import read_failures
 from west_housing_model.data.repository import (
     STATUS_FRESH,
     STATUS_REFRESHED,
@@ -89,5 +90,7 @@ def test_census_acs_schema_failure_captures_payload(
     with pytest.raises(SchemaError):
         repo.get(connector.source_id, state="08", county="005")
 
-    failure_files = list((tmp_path / "failures" / connector.source_id).glob("*.csv"))
-    assert failure_files, "Schema failures should capture a snapshot payload"
+    captured = [
+        entry for entry in read_failures(connector.source_id) if entry["kind"] == "schema-payload"
+    ]
+    assert captured and captured[0]["payload"], "Schema failures should capture a snapshot payload"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict
 
@@ -139,3 +140,120 @@ def test_cli_refresh_online_and_offline(
         json.loads(record.message) for record in caplog.records if record.message.startswith("{")
     ]
     assert any(entry.get("status") == "stale" for entry in offline_logs)
+
+
+def test_cli_cache_gc_reports_reclaimed_bytes(capsys, temp_cache_dir: Path) -> None:
+    orphan_dir = temp_cache_dir / "connector.place_context"
+    orphan_dir.mkdir(parents=True)
+    orphan = orphan_dir / "legacy.parquet"
+    orphan.write_bytes(b"x" * 128)
+    os.utime(orphan, (0, 0))
+
+    assert main(["cache", "gc", "--max-bytes", "1GB", "--dry-run", "--json"]) == 0
+    preview = json.loads(capsys.readouterr().out.strip())
+    assert preview["dry_run"] is True
+    assert preview["reclaimed_bytes"] == 128
+    assert orphan.exists()
+
+    assert main(["cache", "gc", "--json"]) == 0
+    report = json.loads(capsys.readouterr().out.strip())
+    assert report["removed_files"] == [str(orphan)]
+    assert not orphan.exists()
+
+
+def test_cli_cache_stats_reports_hit_ratio_per_source(capsys, temp_cache_dir: Path) -> None:
+    from west_housing_model.cli import main as cli_module
+
+    connector = callable_connector(
+        "connector.place_context",
+        lambda **_: pd.DataFrame(
+            {
+                "place_id": ["p-1"],
+                "metric": ["msa_jobs_t12"],
+                "value": [4.2],
+                "observed_at": ["2025-01-01"],
+                "source_id": ["connector.place_context"],
+            }
+        ),
+        ttl_seconds=3600,
+    )
+    cli_module.DEFAULT_CONNECTORS = {connector.source_id: connector}
+    for _ in range(3):
+        assert cli_module.main(["refresh", connector.source_id, "--json"]) == 0
+    capsys.readouterr()
+
+    assert cli_module.main(["cache", "stats", "--json"]) == 0
+    payload = json.loads(capsys.readouterr().out.strip())
+    (row,) = payload["sources"]
+    assert row["source_id"] == "connector.place_context"
+    assert (row["keys"], row["hits"], row["misses"]) == (1, 2, 1)
+    assert row["hit_ratio"] == round(2 / 3, 4)
+    assert row["bytes"] > 0
+    assert row["p50_load_ms"] is not None
+
+
+def test_cli_warm_reports_missing_then_cached(
+    tmp_path: Path, capsys, monkeypatch, temp_cache_dir: Path
+) -> None:
+    from west_housing_model.cli import main as cli_module
+
+    _ = temp_cache_dir
+    connector = callable_connector(
+        "connector.eia_v2",
+        lambda state, **_: pd.DataFrame(
+            {
+                "state": [state],
+                "res_price_cents_per_kwh": [14.2],
+                "observed_at": ["2025-01-01"],
+                "source_id": ["connector.eia_v2"],
+            }
+        ),
+        ttl_seconds=3600,
+    )
+    monkeypatch.setattr(cli_module, "DEFAULT_CONNECTORS", {connector.source_id: connector})
+    portfolio = tmp_path / "portfolio.json"
+    portfolio.write_text(
+        json.dumps([{"property_id": "a", "state": "CO"}, {"property_id": "b", "state": "UT"}])
+    )
+
+    assert cli_module.main(["warm", str(portfolio), "--json"]) == 0
+    first = json.loads(capsys.readouterr().out.strip())
+    assert (first["planned"], first["missing"], first["fetched"]) == (2, 2, 2)
+
+    assert cli_module.main(["warm", str(portfolio), "--dry-run", "--json"]) == 0
+    second = json.loads(capsys.readouterr().out.strip())
+    assert (second["missing"], second["sources"][0]["cached"]) == (0, 2)
+
+
+def test_cli_cache_export_import_round_trip(
+    tmp_path: Path, capsys, monkeypatch, temp_cache_dir: Path
+) -> None:
+    from west_housing_model.cli import main as cli_module
+
+    connector = callable_connector(
+        "connector.place_context",
+        lambda **_: pd.DataFrame(
+            {
+                "place_id": ["p-1"],
+                "metric": ["msa_jobs_t12"],
+                "value": [4.2],
+                "observed_at": ["2025-01-01"],
+                "source_id": ["connector.place_context"],
+            }
+        ),
+        ttl_seconds=3600,
+    )
+    monkeypatch.setattr(cli_module, "DEFAULT_CONNECTORS", {connector.source_id: connector})
+    assert cli_module.main(["refresh", connector.source_id, "--json"]) == 0
+    bundle = tmp_path / "snapshot.tar.gz"
+    assert cli_module.main(["cache", "export", str(bundle), "--json"]) == 0
+    capsys.readouterr()
+
+    monkeypatch.setenv("WEST_HOUSING_MODEL_CACHE_ROOT", str(tmp_path / "fresh-cache"))
+    assert cli_module.main(["cache", "import", str(bundle), "--json"]) == 0
+    imported = json.loads(capsys.readouterr().out.strip())
+    assert (imported["records"], imported["skipped"]) == (1, 0)
+
+    assert cli_module.main(["refresh", connector.source_id, "--offline", "--json"]) == 0
+    offline = json.loads(capsys.readouterr().out.strip())
+    assert offline["cache_hit"] is True
@@ -2,7 +2,12 @@ from pathlib import Path
 
 import pytest
 
-from west_housing_model.config import load_data_dictionary, load_registry
+from west_housing_model.config import (
+    connector_cache_formats,
+    connector_rate_limits,
+    load_data_dictionary,
+    load_registry,
+)
 from west_housing_model.core.exceptions import RegistryError
 
 
@@ -86,3 +91,44 @@ sources:
         "license",
         "notes",
     }
+
+
+def test_cache_format_is_parsed_and_validated(tmp_path: Path):
+    base = tmp_path / "sources.yml"
+    template = """
+sources:
+  - id: hud_fmr
+    enabled: true
+    endpoint: "https://example.com"
+    geography: county
+    cadence: annual
+    cache_ttl_days: 400
+    license: public
+    rate_limit: "none"
+    cache_format: {fmt}
+  - id: census_acs
+    enabled: true
+    endpoint: "https://example.com"
+    geography: tract
+    cadence: annual
+    cache_ttl_days: 400
+    license: public
+    rate_limit: "none"
+"""
+    base.write_text(template.format(fmt="arrow"), encoding="utf-8")
+    reg = load_registry(base, base)
+    assert [s.cache_format for s in reg] == ["arrow", "parquet"]
+    assert connector_cache_formats(reg) == {"connector.hud_fmr": "arrow"}
+
+    base.write_text(template.format(fmt="csv"), encoding="utf-8")
+    with pytest.raises(RegistryError):
+        _ = load_registry(base, base)
+
+
+def test_connector_id_defaults_and_maps_rate_limits():
+    reg = load_registry()
+    by_id = {cfg.id: cfg for cfg in reg}
+    assert by_id["hud_fmr"].connector_id == "connector.hud_fmr"
+    assert by_id["usfs_wildfire_risk"].connector_id == "connector.usfs_wildfire"
+    limits = connector_rate_limits(reg)
+    assert limits["connector.usgs_designmaps"] == by_id["usgs_seismic_designmaps"].rate_limit
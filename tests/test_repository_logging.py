@@ -8,6 +8,7 @@ import pandas as pd
 import pytest
 
 from west_housing_model.data.connectors import callable_connector
+from west_housing_model.data.failure_log import read_failures
 from west_housing_model.data.repository import (
     STATUS_FRESH,
     STATUS_REFRESHED,
@@ -53,10 +54,9 @@ def test_repository_writes_failure_log_and_returns_stale(tmp_path: Path, monkeyp
     second = repo.get("connector.place_context")
     assert second.status == STATUS_STALE
 
-    failure_dir = tmp_path / "failures" / "connector.place_context"
-    logs = list(failure_dir.glob("*.log"))
+    logs = read_failures("connector.place_context")
     assert logs, "expected a failure log to be written"
-    data = json.loads(logs[-1].read_text())
+    data = logs[-1]
     assert data.get("source_id") == "connector.place_context"
     assert "correlation_id" in data
 